@@ -0,0 +1,11 @@
+"""Benchmarks package.
+
+Contains scripts that time the hot paths of
+the application.  Run them from the project
+root, for example:
+
+    python3 -m benchmarks.bench_search
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
@@ -0,0 +1,198 @@
+"""Codec benchmark.
+
+Compares the size and the encode and decode time
+of orders written by ItemCodec with the same
+orders written as JSON.  Both formats are decoded
+into the items of each line, and into whole Order
+objects, which also keys and prices every line.
+JSON items are rebuilt by making each item and
+setting its properties, as a JSON reader would.
+
+Usage:
+    python3 -m benchmarks.bench_codec
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import json
+import timeit
+from typing import Any, Dict, List, Tuple
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.ItemCodec import ItemCodec
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+ORDERS: int = 2000
+KINDS: Dict[str, type] = {kind.__name__: kind
+                          for kind, _ in ItemCodec.TYPES.values()}
+NAMES: Dict[type, Tuple[str, ...]] = {kind: names for kind, names
+                                      in ItemCodec.TYPES.values()}
+PARTS: Tuple[str, ...] = ("wrap", "drink", "side")
+
+
+def item_document(item: Any) -> Dict[str, Any]:
+    """Writes an item as a JSON document.
+
+    Args:
+        item: The item or combo to write.
+
+    Returns:
+        A dict of its class and state.
+    """
+    if isinstance(item, Combo):
+        document: Dict[str, Any] = {"combo": item.name}
+        for part in PARTS:
+            value = getattr(item, part)
+            if value is not None:
+                document[part] = item_document(value)
+        return document
+    if isinstance(item, CustomItem):
+        return {"custom": item.name, "price_cents": item.price_cents,
+                "calories": item.calories}
+    document = {"type": type(item).__name__}
+    for name in NAMES[type(item)]:
+        document[name] = getattr(item, name)
+    if isinstance(item, Wrap):
+        document["shell"] = item.shell.name
+        document["addins"] = sorted(addin.name for addin in item.addins)
+    else:
+        document["size"] = item.size.name
+    return document
+
+
+def item_of(document: Dict[str, Any]) -> Any:
+    """Rebuilds an item from a JSON document.
+
+    Args:
+        document: A dict made by item_document.
+
+    Returns:
+        A new item equal to the one written.
+    """
+    if "combo" in document:
+        combo = Combo(document["combo"])
+        for part in PARTS:
+            if part in document:
+                setattr(combo, part, item_of(document[part]))
+        return combo
+    if "custom" in document:
+        return CustomItem(document["custom"], document["price_cents"] / 100,
+                          document["calories"])
+    item = KINDS[document["type"]]()
+    for name in NAMES[type(item)]:
+        setattr(item, name, document[name])
+    if isinstance(item, Wrap):
+        item.shell = Shell[document["shell"]]
+        addins = {Addin[name] for name in document["addins"]}
+        for addin in Addin:
+            if addin in addins:
+                item.add_addin(addin)
+            else:
+                item.remove_addin(addin)
+    else:
+        item.size = Size[document["size"]]
+    return item
+
+
+def to_json(order: Order) -> bytes:
+    """Writes an order as JSON.
+
+    Args:
+        order: The order to write.
+
+    Returns:
+        The JSON of its number, tax rate
+        and lines.
+    """
+    document = {"number": order.order_number, "tax_rate": order.tax_rate,
+                "lines": [[line.quantity, item_document(line.item)]
+                          for line in order.lines]}
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def json_lines(data: bytes) -> Tuple[int, float, List[Tuple[int, Item]]]:
+    """Reads an order written as JSON.
+
+    Args:
+        data: Bytes made by to_json.
+
+    Returns:
+        A tuple of the order number, the tax
+        rate and a list of the quantity and item
+        of each line, as ItemCodec.decode_lines.
+    """
+    document = json.loads(data)
+    return (document["number"], document["tax_rate"],
+            [(quantity, item_of(item))
+             for quantity, item in document["lines"]])
+
+
+def json_order(data: bytes) -> Order:
+    """Builds an order written as JSON.
+
+    Args:
+        data: Bytes made by to_json.
+
+    Returns:
+        A new order, as ItemCodec.decode_order.
+    """
+    number, rate, lines = json_lines(data)
+    order = Order(number)
+    order.tax_rate = rate
+    for quantity, item in lines:
+        if quantity == 1:
+            order.add_item(item)
+        else:
+            order.add_items(item, quantity)
+    return order
+
+
+def main() -> None:
+    """Runs the benchmark and prints a table."""
+    items = Menu.fullmenu()
+    orders: List[Order] = list()
+    for n in range(ORDERS):
+        order = Order()
+        for k in range(1 + n % 5):
+            order.add_items(items[(n * 7 + k) % len(items)], 1 + k % 3)
+        if n % 3 == 0:
+            order.add_item(ComboBuilder.build_combo("Classic"))
+        orders.append(order)
+    binary = [ItemCodec.encode_order(order) for order in orders]
+    text = [to_json(order) for order in orders]
+    for data, expected in zip(text, binary):
+        assert ItemCodec.encode_order(json_order(data)) == expected
+    print("{:>12} {:>12} {:>12} {:>12}".format(
+        "format", "bytes/order", "encode (ms)", "decode (ms)"))
+    rows = [
+        ("binary", binary,
+         lambda: [ItemCodec.encode_order(order) for order in orders],
+         lambda: [ItemCodec.decode_lines(data) for data in binary]),
+        ("json", text,
+         lambda: [to_json(order) for order in orders],
+         lambda: [json_lines(data) for data in text]),
+        ("binary order", binary,
+         lambda: [ItemCodec.encode_order(order) for order in orders],
+         lambda: [ItemCodec.decode_order(data) for data in binary]),
+        ("json order", text,
+         lambda: [to_json(order) for order in orders],
+         lambda: [json_order(data) for data in text]),
+    ]
+    for name, encoded, encode, decode in rows:
+        runs = 5
+        size = sum(len(data) for data in encoded) / len(encoded)
+        print("{:>12} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+            name, size,
+            timeit.timeit(encode, number=runs) / runs * 1e3,
+            timeit.timeit(decode, number=runs) / runs * 1e3))
+
+
+if __name__ == "__main__":
+    main()
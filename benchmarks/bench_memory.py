@@ -0,0 +1,61 @@
+"""Memory benchmark.
+
+Measures how many bytes each wrap, drink and
+side takes once built and keyed, as items kept
+for reporting are, and how much a large list of
+mixed items takes in all.
+
+Usage:
+    python3 -m benchmarks.bench_memory
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import timeit
+import tracemalloc
+from typing import Callable, List
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+
+ITEMS: int = 100000
+
+
+def measure(build: Callable[[], List[Item]]) -> int:
+    """Measures the memory of built items.
+
+    Args:
+        build: Builds the items to measure.
+
+    Returns:
+        The bytes still held once they are
+        built and keyed.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    for item in items:
+        hash(item)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main() -> None:
+    """Runs the benchmark and prints a table."""
+    kinds = list()
+    for item in Menu.wraps() + Menu.drinks() + Menu.sides():
+        if type(item) not in kinds:
+            kinds.append(type(item))
+    print("{:>20} {:>12} {:>12}".format("class", "bytes/item", "build (us)"))
+    runs = 1000
+    for kind in kinds:
+        size = measure(lambda: [kind() for _ in range(runs)]) / runs
+        print("{:>20} {:>12.1f} {:>12.2f}".format(
+            kind.__name__, size,
+            timeit.timeit(kind, number=runs) / runs * 1e6))
+    total = measure(lambda: [kinds[n % len(kinds)]() for n in range(ITEMS)])
+    print("{} mixed items: {:.1f} MB".format(ITEMS, total / 1e6))
+
+
+if __name__ == "__main__":
+    main()
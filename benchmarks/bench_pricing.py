@@ -0,0 +1,103 @@
+"""Pricing benchmark.
+
+Compares re-pricing orders by walking the price
+of every item with the BatchPricer, at 10k and 1M
+orders.  The 1M batch repeats the flattened 10k
+batch, as building a million Order objects would
+measure memory rather than pricing.
+
+Usage:
+    python3 -m benchmarks.bench_pricing
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import timeit
+from typing import List
+import numpy as np  # type: ignore
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.BatchPricer import BatchPricer, LineBatch
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.Money import Money
+from src.thatsawrap.data.order.Order import Order
+
+ORDERS: int = 10000
+REPEAT: int = 100
+
+
+def walk(orders: List[Order]) -> List[int]:
+    """Re-prices orders by asking every item.
+
+    Args:
+        orders: The orders to price.
+
+    Returns:
+        The total in cents of each order.
+    """
+    totals: List[int] = list()
+    for order in orders:
+        subtotal = 0
+        for line in order.lines:
+            subtotal += Money.to_cents(line.item.price) * line.quantity
+        totals.append(subtotal + Money.tax_cents(subtotal, order.tax_rate))
+    return totals
+
+
+def repeat(batch: LineBatch, times: int) -> LineBatch:
+    """Repeats a batch of orders.
+
+    Args:
+        batch: The batch to repeat.
+        times: How many copies to make.
+
+    Returns:
+        A LineBatch with the orders of the batch
+        repeated, keeping rows grouped by order.
+    """
+    orders = len(batch.tax_numerator)
+    lines = batch.line[-1] + 1 if len(batch.line) else 0
+    copies = np.repeat(np.arange(times), len(batch.order))
+    return LineBatch(
+        order=np.tile(batch.order, times) + copies * orders,
+        line=np.tile(batch.line, times) + copies * lines,
+        kind=np.tile(batch.kind, times),
+        code=np.tile(batch.code, times),
+        variant=np.tile(batch.variant, times),
+        quantity=np.tile(batch.quantity, times),
+        discount=np.tile(batch.discount, times),
+        cents=np.tile(batch.cents, times),
+        tax_numerator=np.tile(batch.tax_numerator, times),
+        tax_denominator=np.tile(batch.tax_denominator, times))
+
+
+def main() -> None:
+    """Runs the benchmark and prints a table."""
+    items = Menu.fullmenu()
+    orders: List[Order] = list()
+    for n in range(ORDERS):
+        order = Order()
+        for k in range(1 + n % 5):
+            order.add_items(items[(n * 7 + k) % len(items)], 1 + k % 3)
+        if n % 3 == 0:
+            order.add_item(ComboBuilder.build_combo("Classic"))
+        orders.append(order)
+    pricer = BatchPricer()
+    batch = pricer.flatten(orders)
+    assert (list(pricer.price(batch).total_cents) == walk(orders) ==
+            [order.total_cents for order in orders])
+    print("{:>9} {:>14} {:>14}".format("orders", "method", "time (ms)"))
+    rows = [
+        (ORDERS, "walk items", lambda: walk(orders)),
+        (ORDERS, "flatten+price", lambda: pricer.price_orders(orders)),
+        (ORDERS, "price", lambda: pricer.price(batch)),
+    ]
+    big = repeat(batch, REPEAT)
+    rows.append((ORDERS * REPEAT, "price", lambda: pricer.price(big)))
+    for count, name, run in rows:
+        runs = 5
+        seconds = timeit.timeit(run, number=runs) / runs
+        print("{:>9} {:>14} {:>14.1f}".format(count, name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main()
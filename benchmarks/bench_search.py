@@ -0,0 +1,114 @@
+"""Search benchmark.
+
+Compares the advanced search answered by the
+chained Menu filters with the same search answered
+by the QueryPlanner and by the MenuTable masks, on
+the menu padded out with copies of its sides.
+Custom items are not searched, so the catalog is
+padded by having Menu.sides return the copies too.
+
+Usage:
+    python3 -m benchmarks.bench_search
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import copy
+import timeit
+from typing import List
+from unittest.mock import patch
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.QueryPlanner import QueryPlanner
+
+SIZES: List[int] = [0, 1000, 10000]
+QUERIES: List[MenuQuery] = [
+    MenuQuery(text="chicken", wraps=True, drinks=True, sides=True,
+              combos=True),
+    MenuQuery(wraps=True, combos=True, pricemax=10),
+    MenuQuery(text="the", drinks=True, sides=True, caloriesmin=400,
+              caloriesmax=900, pricemin=2, pricemax=8),
+]
+
+
+def chain(items: List[Item], query: MenuQuery) -> List[Item]:
+    """Runs the Menu filters one after another.
+
+    The filters are given a copy of the items,
+    as they use the indexes of the snapshot when
+    given its own list, and this times the scan
+    the search made before the planner.
+
+    Args:
+        items: The list of items to be filtered.
+        query: The search criteria.
+
+    Returns:
+        A list of items that meet the criteria.
+    """
+    items = Menu.filter_keywords(list(items), query.text)
+    items = Menu.filter_type_of_item(query.wraps, query.drinks,
+                                     query.sides, query.combos, items)
+    items = Menu.filter_calories(items, query.caloriesmin,
+                                 query.caloriesmax)
+    return Menu.filter_price(items, query.pricemin, query.pricemax)
+
+
+def padding(size: int) -> List[Item]:
+    """Makes sides to pad the menu with.
+
+    Args:
+        size: How many sides to make.
+
+    Returns:
+        Copies of the sides on the menu, in
+        every size, with their calories moved so
+        that ranges cut through them.
+    """
+    sides = Menu.sides()
+    extra: List[Item] = list()
+    for n in range(size):
+        side = copy.copy(sides[n % len(sides)])
+        side.size = list(Size)[n // len(sides) % len(Size)]
+        extra.append(side)
+    return extra
+
+
+def main() -> None:
+    """Runs the benchmark and prints a table."""
+    sides = Menu.sides
+    print("{:>8} {:>7} {:>12} {:>12} {:>12} {:>8}".format(
+        "padding", "query", "chain (us)", "planner (us)", "table (us)",
+        "speedup"))
+    try:
+        for size in SIZES:
+            extra = padding(size)
+            with patch.object(Menu, "sides", lambda: sides() + extra):
+                CatalogVersion.bump()
+                snapshot = MenuCatalog.snapshot()
+            assert len(snapshot.items) == len(Menu.fullmenu()) + size
+            table = snapshot.table
+            for number, query in enumerate(QUERIES):
+                assert (chain(snapshot.items, query) ==
+                        QueryPlanner.execute(snapshot, query))
+                runs = 20
+                old = timeit.timeit(lambda: chain(snapshot.items, query),
+                                    number=runs) / runs
+                new = timeit.timeit(
+                    lambda: QueryPlanner.execute(snapshot, query),
+                    number=runs) / runs
+                masked = timeit.timeit(lambda: table.select(query),
+                                       number=runs) / runs
+                print("{:>8} {:>7} {:>12.1f} {:>12.1f} {:>12.1f} {:>7.1f}x"
+                      .format(size, number, old * 1e6, new * 1e6,
+                              masked * 1e6, old / new))
+    finally:
+        CatalogVersion.bump()
+
+
+if __name__ == "__main__":
+    main()
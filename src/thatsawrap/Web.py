@@ -1,6 +1,7 @@
 from flask import Flask
 from src.thatsawrap.web.MenuController import MenuController
 from src.thatsawrap.web.CustomController import CustomController
+from src.thatsawrap.web.ApiController import ApiController
 from typing import List
 
 
@@ -11,6 +12,8 @@ class Web:
         app = Flask(__name__)
         MenuController.register(app)
         CustomController.register(app)
+        ApiController.register(app)
         app.config['WTF_CSRF_ENABLED'] = False
+        app.config['SEARCH_PAGE_SIZE'] = 25
         app.debug = True
         return app
@@ -7,6 +7,7 @@ Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
 from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Money import Money
 from typing import List
 
 
@@ -68,6 +69,14 @@ class CustomItem(Item):
         """
         self.__price = round(price, 2)
 
+    @property
+    def price_cents(self) -> int:
+        """Getter for price in cents.
+
+        Returns: The price as an int number of cents.
+        """
+        return Money.to_cents(self.__price)
+
     @property
     def calories(self) -> int:
         """Getter for calories.
@@ -7,6 +7,7 @@ Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
 from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
 from typing import Iterable, Iterator
 import json
 
@@ -58,6 +59,7 @@ class CustomItemList(Iterable[CustomItem]):
             item: A CustomItem type object.
         """
         self.__custom_items.append(item)
+        CatalogVersion.bump()
 
     def __getitem__(self, index: int) -> CustomItem:
         """Get item.
@@ -87,6 +89,7 @@ class CustomItemList(Iterable[CustomItem]):
             at the index.
         """
         self.__custom_items[index] = item
+        CatalogVersion.bump()
 
     def __delitem__(self, index: int) -> None:
         """Delete item.
@@ -99,6 +102,7 @@ class CustomItemList(Iterable[CustomItem]):
             place of the desired item in the list.
         """
         del self.__custom_items[index]
+        CatalogVersion.bump()
 
     def __iter__(self) -> Iterator[CustomItem]:
         """returns iterator"""
@@ -19,7 +19,16 @@ class Drink:
     This class contains the methods that all Drink objects
     have in common.  It will behave as a superclass that
     all side classes will inherit from.
+
+    Drinks keep no __dict__, only slots for the
+    size, the options, and the epoch and key kept
+    by Item.  The flavors of a drink are packed
+    into the bits of one int.
     """
+    __slots__ = ("_size", "_options", "_Item__epoch", "_Item__key")
+    _size: Size
+    _options: int
+
     @property
     def size(self) -> Size:
         """Getter for size.
@@ -47,20 +56,55 @@ class Drink:
         """
         self._size = value
 
+    def _has(self, bit: int) -> bool:
+        """Has option method.
+
+        Args:
+            bit: The bit of an option.
+
+        Returns:
+            True if the option is set,
+            False otherwise.
+        """
+        return bool(self._options & bit)
+
+    def _put(self, bit: int, value: bool) -> None:
+        """Put option method.
+
+        Args:
+            bit: The bit of an option.
+            value: True to set the option,
+            False to clear it.
+        """
+        if value:
+            self._options = self._options | bit
+        else:
+            self._options = self._options & ~bit
+
     @property
     @abc.abstractmethod
-    def price(self) -> float:
-        """Abstract getter for price.
+    def price_cents(self) -> int:
+        """Abstract getter for price in cents.
 
         Verifies that each subclass has
         price getting functionality. This method
         should not be called directly.
 
         Returns:
-            Price when overwritten by subclass.
+            Price in cents when overwritten by subclass.
         """
         raise NotImplementedError
 
+    @property
+    def price(self) -> float:
+        """Getter for price.
+
+        Returns:
+            The price in dollars, from
+            price_cents.
+        """
+        return self.price_cents / 100
+
     @property
     @abc.abstractmethod
     def calories(self) -> int:
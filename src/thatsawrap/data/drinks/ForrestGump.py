@@ -19,30 +19,34 @@ class ForrestGump(Drink, Item):
     the state of the drink, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __CHOCOLATE: int = 1
+    __VANILLA: int = __CHOCOLATE << 1
+    __CARAMEL: int = __VANILLA << 1
+    __COFFEE: int = __CARAMEL << 1
+
     def __init__(self) -> None:
         """Constructor for the Forrest Gump class."""
-        self.__size: Size = Size.INDIE
-        self.__chocolate = True
-        self.__vanilla = False
-        self.__caramel = False
-        self.__coffee = False
+        self._size: Size = Size.INDIE
+        self._options: int = ForrestGump.__CHOCOLATE
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the drink.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the drink.
 
         The drink could have 3 different prices depending
         on its size.
 
         Returns:
-            A float value indicating the price of the drink.
+            An int value indicating the price of the drink
+            in cents.
         """
-        if self.__size == Size.INDIE:
-            return 5.25
-        elif self.__size == Size.STUDIO:
-            return 7.50
+        if self._size == Size.INDIE:
+            return 525
+        elif self._size == Size.STUDIO:
+            return 750
         else:
-            return 9.00
+            return 900
 
     @property
     def calories(self) -> int:
@@ -51,9 +55,9 @@ class ForrestGump(Drink, Item):
         Returns:
             An int indicating how many calories the drink has.
         """
-        if self.__size == Size.INDIE:
+        if self._size == Size.INDIE:
             return 980
-        elif self.__size == Size.STUDIO:
+        elif self._size == Size.STUDIO:
             return 1365
         else:
             return 1875
@@ -72,13 +76,13 @@ class ForrestGump(Drink, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__chocolate:
+        if not self._has(ForrestGump.__CHOCOLATE):
             specials.append("Hold Chocolate")
-        if self.__vanilla:
+        if self._has(ForrestGump.__VANILLA):
             specials.append("Add Vanilla")
-        if self.__caramel:
+        if self._has(ForrestGump.__CARAMEL):
             specials.append("Add Caramel")
-        if self.__coffee:
+        if self._has(ForrestGump.__COFFEE):
             specials.append("Add Coffee")
         return specials
 
@@ -92,7 +96,7 @@ class ForrestGump(Drink, Item):
         Returns:
             True if the drink has chocolate, otherwise False.
         """
-        return self.__chocolate
+        return self._has(ForrestGump.__CHOCOLATE)
 
     @chocolate.setter
     def chocolate(self, value: bool) -> None:
@@ -105,7 +109,7 @@ class ForrestGump(Drink, Item):
             value: True if we wish to include chocolate,
             False otherwise.
         """
-        self.__chocolate = value
+        self._put(ForrestGump.__CHOCOLATE, value)
 
     @property
     def vanilla(self) -> bool:
@@ -117,7 +121,7 @@ class ForrestGump(Drink, Item):
         Returns:
             True if the drink has vanilla, otherwise False.
         """
-        return self.__vanilla
+        return self._has(ForrestGump.__VANILLA)
 
     @vanilla.setter
     def vanilla(self, value: bool) -> None:
@@ -130,7 +134,7 @@ class ForrestGump(Drink, Item):
             value: True if we wish to include vanilla,
             False otherwise.
         """
-        self.__vanilla = value
+        self._put(ForrestGump.__VANILLA, value)
 
     @property
     def caramel(self) -> bool:
@@ -142,7 +146,7 @@ class ForrestGump(Drink, Item):
         Returns:
             True if the drink has caramel, otherwise False.
         """
-        return self.__caramel
+        return self._has(ForrestGump.__CARAMEL)
 
     @caramel.setter
     def caramel(self, value: bool) -> None:
@@ -155,7 +159,7 @@ class ForrestGump(Drink, Item):
             value: True if we wish to include caramel,
             False otherwise.
         """
-        self.__caramel = value
+        self._put(ForrestGump.__CARAMEL, value)
 
     @property
     def coffee(self) -> bool:
@@ -167,7 +171,7 @@ class ForrestGump(Drink, Item):
         Returns:
             True if the drink has coffee, otherwise False.
         """
-        return self.__coffee
+        return self._has(ForrestGump.__COFFEE)
 
     @coffee.setter
     def coffee(self, value: bool) -> None:
@@ -180,7 +184,7 @@ class ForrestGump(Drink, Item):
             value: True if we wish to include coffee,
             False otherwise.
         """
-        self.__coffee = value
+        self._put(ForrestGump.__COFFEE, value)
 
     @property
     def size(self) -> Size:
@@ -193,7 +197,7 @@ class ForrestGump(Drink, Item):
         Returns:
             A Size type object corresponding to size.
         """
-        return self.__size
+        return self._size
 
     @size.setter
     def size(self, value: Size) -> None:
@@ -206,7 +210,7 @@ class ForrestGump(Drink, Item):
         Args:
             value: A Size type object indicating the size of the drink.
         """
-        self.__size = value
+        self._size = value
 
     def __str__(self) -> str:
         """String representation.
@@ -218,7 +222,7 @@ class ForrestGump(Drink, Item):
         Returns:
             The string representation of the drink.
         """
-        return "{} Forrest Gump".format(self.__size)
+        return "{} Forrest Gump".format(self._size)
 
     def __eq__(self, value: object) -> bool:
         """Sets conditions for equality.
@@ -238,11 +242,8 @@ class ForrestGump(Drink, Item):
             False otherwise
         """
         if isinstance(value, ForrestGump):
-            return (self.__size == value.size and
-                    self.__chocolate == value.chocolate and
-                    self.__vanilla == value.vanilla and
-                    self.__caramel == value.caramel and
-                    self.__coffee == value.coffee)
+            return (self._size == value.size and
+                    self._options == value._options)
         else:
             return False
 
@@ -19,30 +19,34 @@ class KingKong(Drink, Item):
     the state of the drink, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __BANANA: int = 1
+    __STRAWBERRY: int = __BANANA << 1
+    __PEACH: int = __STRAWBERRY << 1
+    __MANGO: int = __PEACH << 1
+
     def __init__(self) -> None:
         """Constructor for the King Kong class."""
         self._size: Size = Size.INDIE
-        self.__banana = True
-        self.__strawberry = False
-        self.__peach = False
-        self.__mango = False
+        self._options: int = KingKong.__BANANA
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the drink.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the drink.
 
         The drink could have 3 different prices depending
         on its size.
 
         Returns:
-            A float value indicating the price of the drink.
+            An int value indicating the price of the drink
+            in cents.
         """
         if self._size == Size.INDIE:
-            return 4.85
+            return 485
         elif self._size == Size.STUDIO:
-            return 5.95
+            return 595
         else:
-            return 7.45
+            return 745
 
     @property
     def calories(self) -> int:
@@ -72,13 +76,13 @@ class KingKong(Drink, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__banana:
+        if not self._has(KingKong.__BANANA):
             specials.append("Hold Banana")
-        if self.__strawberry:
+        if self._has(KingKong.__STRAWBERRY):
             specials.append("Add Strawberry")
-        if self.__peach:
+        if self._has(KingKong.__PEACH):
             specials.append("Add Peach")
-        if self.__mango:
+        if self._has(KingKong.__MANGO):
             specials.append("Add Mango")
         return specials
 
@@ -92,7 +96,7 @@ class KingKong(Drink, Item):
         Returns:
             True if the drink has banana, otherwise False.
         """
-        return self.__banana
+        return self._has(KingKong.__BANANA)
 
     @banana.setter
     def banana(self, value: bool) -> None:
@@ -105,7 +109,7 @@ class KingKong(Drink, Item):
             value: True if we wish to include banana,
             False otherwise.
         """
-        self.__banana = value
+        self._put(KingKong.__BANANA, value)
 
     @property
     def peach(self) -> bool:
@@ -117,7 +121,7 @@ class KingKong(Drink, Item):
         Returns:
             True if the drink has peach, otherwise False.
         """
-        return self.__peach
+        return self._has(KingKong.__PEACH)
 
     @peach.setter
     def peach(self, value: bool) -> None:
@@ -130,7 +134,7 @@ class KingKong(Drink, Item):
             value: True if we wish to include peach,
             False otherwise.
         """
-        self.__peach = value
+        self._put(KingKong.__PEACH, value)
 
     @property
     def mango(self) -> bool:
@@ -142,7 +146,7 @@ class KingKong(Drink, Item):
         Returns:
             True if the drink has mango, otherwise False.
         """
-        return self.__mango
+        return self._has(KingKong.__MANGO)
 
     @mango.setter
     def mango(self, value: bool) -> None:
@@ -155,7 +159,7 @@ class KingKong(Drink, Item):
             value: True if we wish to include mango,
             False otherwise.
         """
-        self.__mango = value
+        self._put(KingKong.__MANGO, value)
 
     @property
     def strawberry(self) -> bool:
@@ -167,7 +171,7 @@ class KingKong(Drink, Item):
         Returns:
             True if the drink has strawberry, otherwise False.
         """
-        return self.__strawberry
+        return self._has(KingKong.__STRAWBERRY)
 
     @strawberry.setter
     def strawberry(self, value: bool) -> None:
@@ -180,7 +184,7 @@ class KingKong(Drink, Item):
             value: True if we wish to include strawberry,
             False otherwise.
         """
-        self.__strawberry = value
+        self._put(KingKong.__STRAWBERRY, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -212,11 +216,8 @@ class KingKong(Drink, Item):
             False otherwise.
         """
         if isinstance(value, KingKong):
-            return (self.__banana == value.banana and
-                    self.__strawberry == value.strawberry and
-                    self.__peach == value.peach and
-                    self.__mango == value.mango and
-                    self._size == value.size)
+            return (self._size == value.size and
+                    self._options == value._options)
         else:
             return False
 
@@ -19,30 +19,34 @@ class SinginInTheRain(Drink, Item):
     the state of the wrap, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __CHERRY: int = 1
+    __STRAWBERRY: int = __CHERRY << 1
+    __COLA: int = __STRAWBERRY << 1
+    __GRAPE: int = __COLA << 1
+
     def __init__(self) -> None:
         """Constructor for the Singin' in the Rain class."""
         self._size: Size = Size.INDIE
-        self.__cherry = True
-        self.__strawberry = False
-        self.__cola = False
-        self.__grape = False
+        self._options: int = SinginInTheRain.__CHERRY
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the drink.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the drink.
 
         The drink could have 3 different prices depending
         on its size.
 
         Returns:
-            A float value indicating the price of the drink.
+            An int value indicating the price of the drink
+            in cents.
         """
         if self._size == Size.INDIE:
-            return 2.75
+            return 275
         elif self._size == Size.STUDIO:
-            return 3.25
+            return 325
         else:
-            return 4.00
+            return 400
 
     @property
     def calories(self) -> int:
@@ -72,13 +76,13 @@ class SinginInTheRain(Drink, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__cherry:
+        if not self._has(SinginInTheRain.__CHERRY):
             specials.append("Hold Cherry")
-        if self.__strawberry:
+        if self._has(SinginInTheRain.__STRAWBERRY):
             specials.append("Add Strawberry")
-        if self.__cola:
+        if self._has(SinginInTheRain.__COLA):
             specials.append("Add Cola")
-        if self.__grape:
+        if self._has(SinginInTheRain.__GRAPE):
             specials.append("Add Grape")
         return specials
 
@@ -92,7 +96,7 @@ class SinginInTheRain(Drink, Item):
         Returns:
             True if the drink has cherry, otherwise False.
         """
-        return self.__cherry
+        return self._has(SinginInTheRain.__CHERRY)
 
     @cherry.setter
     def cherry(self, value: bool) -> None:
@@ -105,7 +109,7 @@ class SinginInTheRain(Drink, Item):
             value: True if we wish to include cherry,
             False otherwise.
         """
-        self.__cherry = value
+        self._put(SinginInTheRain.__CHERRY, value)
 
     @property
     def cola(self) -> bool:
@@ -117,7 +121,7 @@ class SinginInTheRain(Drink, Item):
         Returns:
             True if the drink has cola, otherwise False.
         """
-        return self.__cola
+        return self._has(SinginInTheRain.__COLA)
 
     @cola.setter
     def cola(self, value: bool) -> None:
@@ -130,7 +134,7 @@ class SinginInTheRain(Drink, Item):
             value: True if we wish to include cola,
             False otherwise.
         """
-        self.__cola = value
+        self._put(SinginInTheRain.__COLA, value)
 
     @property
     def grape(self) -> bool:
@@ -142,7 +146,7 @@ class SinginInTheRain(Drink, Item):
         Returns:
             True if the drink has cola, otherwise False.
         """
-        return self.__grape
+        return self._has(SinginInTheRain.__GRAPE)
 
     @grape.setter
     def grape(self, value: bool) -> None:
@@ -155,7 +159,7 @@ class SinginInTheRain(Drink, Item):
             value: True if we wish to include grape,
             False otherwise.
         """
-        self.__grape = value
+        self._put(SinginInTheRain.__GRAPE, value)
 
     @property
     def strawberry(self) -> bool:
@@ -167,7 +171,7 @@ class SinginInTheRain(Drink, Item):
         Returns:
             True if the drink has strawberry, otherwise False.
         """
-        return self.__strawberry
+        return self._has(SinginInTheRain.__STRAWBERRY)
 
     @strawberry.setter
     def strawberry(self, value: bool) -> None:
@@ -180,7 +184,7 @@ class SinginInTheRain(Drink, Item):
             value: True if we wish to include strawberry,
             False otherwise.
         """
-        self.__strawberry = value
+        self._put(SinginInTheRain.__STRAWBERRY, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -212,11 +216,8 @@ class SinginInTheRain(Drink, Item):
             False otherwise
         """
         if isinstance(value, SinginInTheRain):
-            return (self.__cherry == value.cherry and
-                    self.__strawberry == value.strawberry and
-                    self.__cola == value.cola and
-                    self.__grape == value.grape and
-                    self._size == value.size)
+            return (self._size == value.size and
+                    self._options == value._options)
         else:
             return False
 
@@ -0,0 +1,38 @@
+"""Item Type Enumeration.
+
+This file contains the code required to enumerate the different
+kinds of item that are on the menu.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from enum import Enum
+
+
+class ItemType(int, Enum):
+    """The ItemType class.
+
+    This class is an enumeration that contains all the kinds
+    of item on the menu, in the order the advanced search
+    lists them.
+
+    Args:
+        int: An int code for one of the kinds of item.
+    """
+    WRAP = 0
+    DRINK = 1
+    SIDE = 2
+    COMBO = 3
+    CUSTOM = 4
+
+    def __str__(self) -> str:
+        """The string representation.
+
+        This method defines and returns the string
+        that is printed when the print function is
+        run on the object.
+
+        Returns:
+            A string representation of the object.
+        """
+        return self.name.capitalize()
@@ -0,0 +1,51 @@
+"""Catalog Version.
+
+This file contains the code required to keep
+track of the version of the menu catalog, so
+that anything built from the catalog knows
+when it has gone stale.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import threading
+
+
+class CatalogVersion:
+    """Catalog Version class.
+
+    Holds a class-wide counter that is bumped
+    whenever something that the menu catalog is
+    built from changes, such as the combo discount,
+    the tax rate or the list of custom items.
+    """
+    __version: int = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def get_version(cls) -> int:
+        """Static getter for version.
+
+        Gets the current catalog version.
+
+        Returns:
+            An int representing the
+            current catalog version.
+        """
+        return cls.__version
+
+    @classmethod
+    def bump(cls) -> int:
+        """Bump version method.
+
+        Increments the catalog version, marking
+        every snapshot built from an older
+        version as stale.
+
+        Returns:
+            An int representing the new
+            catalog version.
+        """
+        with CatalogVersion.lock:
+            cls.__version += 1
+            return cls.__version
@@ -0,0 +1,194 @@
+"""The Fuzzy Index.
+
+This file contains the code required to build
+a trigram index over the words of the menu, so
+that misspelled searches can still be answered
+with the closest items, best first.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import heapq
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+
+
+class FuzzyIndex:
+    """Fuzzy Index class.
+
+    Indexes every distinct word in the names of a
+    list of items, the names of the wraps inside
+    combos and the ingredients of items by its
+    trigrams.  A keyword is compared only against
+    the words sharing a trigram with it, so the
+    work done depends on the size of the vocabulary
+    that looks alike, not on the number of items.
+    Items are referred to by their position in the
+    indexed list.
+    """
+    THRESHOLD: float = 0.3
+    INGREDIENT_WEIGHT: float = 0.5
+    WORD = re.compile("[a-z0-9]+")
+
+    def __init__(self, items: Sequence[Item]) -> None:
+        """Constructor for the fuzzy index.
+
+        Args:
+            items: The items to be indexed.
+        """
+        self.__words: List[str] = list()
+        self.__grams: List[Set[str]] = list()
+        self.__word_ids: Dict[str, int] = dict()
+        self.__postings: Dict[str, List[int]] = dict()
+        self.__items: List[Dict[int, float]] = list()
+        for i, item in enumerate(items):
+            text = item.name or ""
+            if isinstance(item, Combo) and item.wrap is not None:
+                text += " " + item.wrap.name
+            for word in FuzzyIndex.WORD.findall(text.lower()):
+                self.__add(word, i, 1.0)
+            for ingredient in Menu.ingredients_of(item):
+                for word in FuzzyIndex.WORD.findall(ingredient):
+                    self.__add(word, i, FuzzyIndex.INGREDIENT_WEIGHT)
+
+    def __add(self, word: str, i: int, weight: float) -> None:
+        """Add method.
+
+        Records that an item contains a word,
+        keeping the largest weight seen.
+
+        Args:
+            word: A lowercase word.
+            i: The id of the item.
+            weight: How much a match on this
+            word counts for the item.
+        """
+        word_id = self.__word_ids.get(word)
+        if word_id is None:
+            word_id = len(self.__words)
+            self.__word_ids[word] = word_id
+            self.__words.append(word)
+            grams = FuzzyIndex.trigrams(word)
+            self.__grams.append(grams)
+            self.__items.append(dict())
+            for gram in grams:
+                self.__postings.setdefault(gram, list()).append(word_id)
+        weights = self.__items[word_id]
+        if weights.get(i, 0.0) < weight:
+            weights[i] = weight
+
+    @staticmethod
+    def trigrams(word: str) -> Set[str]:
+        """Trigrams method.
+
+        The word is padded with two spaces in
+        front and one behind, so that short words
+        and the start of a word count for more.
+
+        Args:
+            word: A lowercase word.
+
+        Returns:
+            The set of trigrams of the word.
+        """
+        padded = "  " + word + " "
+        return {padded[start:start + 3]
+                for start in range(len(padded) - 2)}
+
+    @staticmethod
+    def similarity(first: str, second: str) -> float:
+        """Similarity method.
+
+        Args:
+            first: A lowercase word.
+            second: Another lowercase word.
+
+        Returns:
+            The number of trigrams the words share
+            over the number of trigrams in either,
+            from 0.0 to 1.0.
+        """
+        a = FuzzyIndex.trigrams(first)
+        b = FuzzyIndex.trigrams(second)
+        return len(a & b) / len(a | b)
+
+    def __len__(self) -> int:
+        """Length method.
+
+        Returns:
+            The number of distinct words indexed.
+        """
+        return len(self.__words)
+
+    def similar_words(self, keyword: str) -> List[Tuple[int, float]]:
+        """Similar words method.
+
+        A keyword of three or more letters found
+        inside a word is an exact match and scores
+        1.0.
+
+        Args:
+            keyword: A lowercase keyword.
+
+        Returns:
+            A list of (word id, similarity) pairs for
+            every word at least THRESHOLD similar to
+            the keyword.
+        """
+        grams = FuzzyIndex.trigrams(keyword)
+        shared: Dict[int, int] = dict()
+        for gram in grams:
+            for word_id in self.__postings.get(gram, list()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        output: List[Tuple[int, float]] = list()
+        for word_id, count in shared.items():
+            if len(keyword) >= 3 and keyword in self.__words[word_id]:
+                score = 1.0
+            else:
+                score = count / (len(grams) + len(self.__grams[word_id]) -
+                                 count)
+            if score >= FuzzyIndex.THRESHOLD:
+                output.append((word_id, score))
+        return output
+
+    def search(self, keywords: Optional[str], k: int = 10,
+               candidates: Optional[Set[int]] = None
+               ) -> List[Tuple[int, float]]:
+        """Search method.
+
+        Each keyword adds the score of the most
+        similar word of an item to that item, so
+        items matching more of the keywords rank
+        higher.  Ties keep menu order.
+
+        Args:
+            keywords: The space separated keywords
+            to search for.
+            k: The most results to return.
+            candidates: If given, only these item
+            ids may be returned.
+
+        Returns:
+            A list of up to k (item id, score)
+            pairs, best first.
+        """
+        if keywords is None or k < 1:
+            return list()
+        scores: Dict[int, float] = dict()
+        for keyword in set(FuzzyIndex.WORD.findall(keywords.lower())):
+            best: Dict[int, float] = dict()
+            for word_id, similarity in self.similar_words(keyword):
+                for i, weight in self.__items[word_id].items():
+                    if candidates is not None and i not in candidates:
+                        continue
+                    score = similarity * weight
+                    if best.get(i, 0.0) < score:
+                        best[i] = score
+            for i, score in best.items():
+                scores[i] = scores.get(i, 0.0) + score
+        ranked = heapq.nsmallest(k, scores.items(),
+                                 key=lambda pair: (-pair[1], pair[0]))
+        return [(i, round(score, 6)) for i, score in ranked]
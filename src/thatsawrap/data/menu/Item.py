@@ -8,7 +8,9 @@ Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
 import abc
-from typing import List
+import itertools
+import types
+from typing import Any, Dict, Hashable, List, Tuple
 
 
 class Item(metaclass=abc.ABCMeta):
@@ -16,7 +18,177 @@ class Item(metaclass=abc.ABCMeta):
 
     This class defines the behaviors that
     each inheriting class should have.
+
+    Every attribute set on an item stamps it with
+    a new epoch from a clock shared by all items,
+    so an item has a new epoch whenever it changes.
+    Its structural key, made from its class and the
+    value of each settable property, is kept along
+    with the epoch it was made at, and items hash
+    by that key.  Items of the same configuration
+    share one key, for up to SHARED_KEYS
+    configurations; keys of any seen after that
+    are not kept, so the table cannot keep growing.
+
+    Item has no slots of its own, so that it can
+    be mixed into classes that have them, but a
+    class with slots must give room for the epoch
+    and key.
     """
+    __slots__ = ()
+    __clock = itertools.count(1)
+    __settable: Dict[type, Tuple[str, ...]] = dict()
+    __slotted: Dict[type, Tuple[str, ...]] = dict()
+    __keys: Dict[Hashable, Hashable] = dict()
+    SHARED_KEYS: int = 4096
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Sets up an inheriting class.
+
+        A class that defines __eq__ without
+        __hash__ would not be hashable, so it is
+        given the structural hash instead.
+
+        Args:
+            kwargs: Passed on to the superclass.
+        """
+        super().__init_subclass__(**kwargs)
+        if "__eq__" in cls.__dict__ and cls.__dict__.get("__hash__") is None:
+            cls.__hash__ = Item.__hash__  # type: ignore
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Sets an attribute and moves the epoch on.
+
+        Args:
+            name: The name of the attribute.
+            value: The value to set.
+        """
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_Item__epoch", next(Item.__clock))
+
+    @property
+    def epoch(self) -> int:
+        """Getter for epoch.
+
+        Returns:
+            An int that changes whenever the
+            item changes.
+        """
+        return getattr(self, "_Item__epoch", 0)
+
+    @staticmethod
+    def tick() -> int:
+        """Tick method.
+
+        Takes the next epoch off the clock.  When
+        two ticks are one apart, no item was made
+        or changed between them.
+
+        Returns:
+            An int greater than the epoch of
+            every item.
+        """
+        return next(Item.__clock)
+
+    @property
+    def key(self) -> Hashable:
+        """Getter for the structural key.
+
+        Two items have the same key when they
+        are the same class with the same value for
+        every settable property, such as size,
+        shell and toppings, and the same addins.
+        Items held by an item, as in a combo, are
+        compared by their own keys if they
+        inherit from Item.  The key is only made
+        again after the epoch changes.
+
+        Returns:
+            A hashable key for the configuration
+            of the item.
+        """
+        return self.__cached()[1]
+
+    def __copy__(self) -> "Item":
+        """Shallow copy method.
+
+        Copies the attributes straight across,
+        from slots and any __dict__, without
+        setting each one, so the copy has the same
+        epoch and cached key.  Attributes are only
+        ever replaced, never changed in place, so
+        the copy can share them.
+
+        Returns:
+            A copy of the item.
+        """
+        kind = type(self)
+        clone = object.__new__(kind)
+        names = Item.__slotted.get(kind)
+        if names is None:
+            names = tuple(name for klass in kind.__mro__
+                          for name, value in vars(klass).items()
+                          if isinstance(value, types.MemberDescriptorType))
+            Item.__slotted[kind] = names
+        for name in names:
+            try:
+                object.__setattr__(clone, name, object.__getattribute__(
+                    self, name))
+            except AttributeError:
+                pass
+        state = getattr(self, "__dict__", None)
+        if state is not None:
+            clone.__dict__.update(state)
+        return clone
+
+    def __hash__(self) -> int:
+        """Hashes the item by its structural key.
+
+        Returns:
+            The hash of the key.
+        """
+        return self.__cached()[2]
+
+    def __cached(self) -> Tuple[int, Hashable, int]:
+        """Cached key method.
+
+        Returns:
+            A tuple of the epoch, the key and
+            its hash, made again if the epoch
+            has changed since they were made.
+        """
+        epoch = self.epoch
+        cached = getattr(self, "_Item__key", None)
+        if cached is not None and cached[0] == epoch:
+            return cached
+        kind = type(self)
+        names = Item.__settable.get(kind)
+        if names is None:
+            found = [name for name in sorted(dir(kind))
+                     if isinstance(getattr(kind, name, None), property) and
+                     getattr(kind, name).fset is not None]
+            if isinstance(getattr(kind, "addins", None), property):
+                found.append("addins")
+            names = tuple(found)
+            Item.__settable[kind] = names
+        values: List[Any] = list()
+        for name in names:
+            value = getattr(self, name)
+            if Item in type(value).__mro__:
+                value = value.key
+            elif isinstance(value, (set, frozenset)):
+                value = frozenset(value)
+            values.append(value)
+        key: Hashable = (kind.__qualname__, tuple(values))
+        shared = Item.__keys.get(key)
+        if shared is not None:
+            key = shared
+        elif len(Item.__keys) < Item.SHARED_KEYS:
+            Item.__keys[key] = key
+        cached = (epoch, key, hash(key))
+        object.__setattr__(self, "_Item__key", cached)
+        return cached
+
     @classmethod
     def __subclasshook__(cls, subclass: type) -> bool:
         """Checks that inheriting class is compatible.
@@ -0,0 +1,146 @@
+"""The Keyword Index.
+
+This file contains the code required to build
+an inverted index over the names on the menu,
+so that keyword searches do not have to scan
+every item.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from typing import Dict, List, Optional, Sequence, Set, Union
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+
+class GramPostings:
+    """Gram Postings class.
+
+    Maps every substring of up to GRAM characters
+    of a set of texts to the sorted ids of the
+    texts that contain it.  Longer keywords are
+    answered by intersecting the postings of their
+    grams and checking the few remaining candidates.
+    """
+    GRAM: int = 3
+
+    def __init__(self, texts: Dict[int, str]) -> None:
+        """Constructor for gram postings.
+
+        Args:
+            texts: A dict mapping item ids to
+            the lowercase text indexed for them.
+        """
+        self.__texts: Dict[int, str] = texts
+        self.__ids: List[int] = sorted(texts)
+        self.__postings: Dict[str, List[int]] = dict()
+        for i in self.__ids:
+            text = texts[i]
+            grams: Set[str] = set()
+            for size in range(1, GramPostings.GRAM + 1):
+                for start in range(len(text) - size + 1):
+                    grams.add(text[start:start + size])
+            for gram in grams:
+                self.__postings.setdefault(gram, list()).append(i)
+
+    def lookup(self, keyword: str) -> List[int]:
+        """Lookup method.
+
+        Finds every text containing the keyword.
+
+        Args:
+            keyword: A lowercase keyword.
+
+        Returns:
+            The sorted ids of the texts that
+            contain the keyword.
+        """
+        if len(keyword) == 0:
+            return self.__ids
+        if len(keyword) <= GramPostings.GRAM:
+            return self.__postings.get(keyword, list())
+        shortest: List[int] = self.__ids
+        for start in range(len(keyword) - GramPostings.GRAM + 1):
+            posting = self.__postings.get(
+                keyword[start:start + GramPostings.GRAM], list())
+            if len(posting) < len(shortest):
+                shortest = posting
+            if len(shortest) == 0:
+                return list()
+        return [i for i in shortest if keyword in self.__texts[i]]
+
+
+class KeywordIndex:
+    """Keyword Index class.
+
+    Indexes the names of a list of items, the
+    names of the wraps inside combos and the
+    addins of wraps.  Items are referred to by
+    their position in the indexed list.
+    """
+    def __init__(self, items: Sequence[Item]) -> None:
+        """Constructor for the keyword index.
+
+        Args:
+            items: The items to be indexed.
+        """
+        names: Dict[int, str] = dict()
+        wrap_names: Dict[int, str] = dict()
+        addins: Dict[int, str] = dict()
+        for i, item in enumerate(items):
+            names[i] = (item.name or "").lower()
+            wrap: Union[Item, Wrap, None] = item
+            if isinstance(item, Combo):
+                wrap = item.wrap
+                if wrap is not None:
+                    wrap_names[i] = wrap.name.lower()
+            if isinstance(wrap, Wrap):
+                addins[i] = " ".join(sorted(
+                    str(addin).lower() for addin in wrap.addins))
+        self.__size: int = len(items)
+        self.__names = GramPostings(names)
+        self.__wrap_names = GramPostings(wrap_names)
+        self.__addins = GramPostings(addins)
+
+    def search(self, keywords: Optional[str],
+               addins: bool = False) -> List[int]:
+        """Search method.
+
+        Answers a space separated keyword query
+        with the same results, in the same order,
+        as Menu.filter_keywords: items whose name
+        contains a keyword, keyword by keyword,
+        followed by combos whose wrap name
+        contains a keyword.
+
+        Args:
+            keywords: The keywords to search for,
+            or None or "" for every item.
+            addins: If set to True, items whose
+            addins contain a keyword also match.
+
+        Returns:
+            A list of the ids of the matching
+            items, without duplicates.
+        """
+        if keywords is None or len(keywords) == 0:
+            return list(range(self.__size))
+        output: List[int] = list()
+        seen: Set[int] = set()
+        split = [keyword.lower() for keyword in keywords.split(" ")]
+        for keyword in split:
+            matches = self.__names.lookup(keyword)
+            if addins:
+                matches = sorted(set(matches).union(
+                    self.__addins.lookup(keyword)))
+            for i in matches:
+                if i not in seen:
+                    seen.add(i)
+                    output.append(i)
+        for keyword in split:
+            for i in self.__wrap_names.lookup(keyword):
+                if i not in seen:
+                    seen.add(i)
+                    output.append(i)
+        return output
@@ -7,8 +7,9 @@ return all of the items at our restaurant.
 Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
-from typing import List
+from typing import List, Optional, Set, Tuple
 from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.enums.ItemType import ItemType
 from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
 from src.thatsawrap.data.wraps.WestSideStory import WestSideStory
 from src.thatsawrap.data.wraps.SomeLikeItHot import SomeLikeItHot
@@ -212,7 +213,9 @@ class Menu(object):
         This method will filter menu items
         based on a list of keywords. If an item
         on the menu contains one of the keywords,
-        it will be returned.
+        it will be returned.  When the items are
+        the catalog snapshot, the keyword index
+        is used instead of scanning every item.
 
         Args:
             items: The list of items to be filtered.
@@ -224,22 +227,63 @@ class Menu(object):
         """
         if keywords is None or len(keywords) == 0:
             return items
+        # Imported here as the catalog is itself built from Menu.
+        from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+        snapshot = MenuCatalog.snapshot()
+        if items is snapshot.items:
+            return [items[i] for i in
+                    snapshot.keyword_index.search(keywords)]
         output: List[Item] = list()
+        seen: Set[int] = set()
         for keyword in keywords.split(" "):
             keyword = keyword.lower()
             for item in items:
-                if keyword in item.name.lower():
-                    if item not in output:
-                        output.append(item)
-        combos: List[Combo] = Menu.combos()
+                if id(item) not in seen and keyword in item.name.lower():
+                    seen.add(id(item))
+                    output.append(item)
+        matched: Set[Item] = {item for item in output
+                              if isinstance(item, Combo)}
         for keyword in keywords.split(" "):
             keyword = keyword.lower()
-            for combo in combos:
+            for combo in snapshot.combos:
                 if keyword in combo.wrap.name.lower():
-                    if combo not in output:
+                    if combo not in matched:
+                        matched.add(combo)
                         output.append(combo)
         return output
 
+    @staticmethod
+    def search_ranked(items: List[Item], keywords: str,
+                      k: int = 10) -> List[Item]:
+        """Ranked search.
+
+        This method will find the menu items
+        closest to a list of keywords, even when
+        the keywords are misspelled, by comparing
+        the trigrams of the keywords with the words
+        in item names and ingredients.  When the
+        items are the catalog snapshot, the fuzzy
+        index of the snapshot is used.
+
+        Args:
+            items: The list of items to be searched.
+            keywords: The keywords to search for.
+            k: The most items to return.
+
+        Returns:
+            A list of up to k items, most similar
+            first.
+        """
+        # Imported here as the catalog is itself built from Menu.
+        from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+        from src.thatsawrap.data.menu.FuzzyIndex import FuzzyIndex
+        snapshot = MenuCatalog.snapshot()
+        if items is snapshot.items:
+            index = snapshot.fuzzy_index
+        else:
+            index = FuzzyIndex(items)
+        return [items[i] for i, _ in index.search(keywords, k)]
+
     @staticmethod
     def filter_type_of_item(wraps: bool, drinks: bool,
                             sides: bool, combos: bool,
@@ -283,6 +327,65 @@ class Menu(object):
                     output.append(item)
         return output
 
+    @staticmethod
+    def type_of_item(item: Item) -> ItemType:
+        """Type of item method.
+
+        Finds which kind of item an item is.
+
+        Args:
+            item: The item to be classified.
+
+        Returns:
+            The ItemType of the item; anything that
+            is not a wrap, drink, side or combo is
+            a custom item.
+        """
+        if isinstance(item, Wrap):
+            return ItemType.WRAP
+        elif isinstance(item, Drink):
+            return ItemType.DRINK
+        elif isinstance(item, Side):
+            return ItemType.SIDE
+        elif isinstance(item, Combo):
+            return ItemType.COMBO
+        else:
+            return ItemType.CUSTOM
+
+    @staticmethod
+    def ingredients_of(item: Item) -> List[str]:
+        """Ingredients of item method.
+
+        Lists the addins of a wrap and the
+        ingredients it or a drink includes.  A
+        combo has the ingredients of every item
+        in it.
+
+        Args:
+            item: The item to describe.
+
+        Returns:
+            A list of lowercase ingredient names,
+            without duplicates.
+        """
+        if isinstance(item, Combo):
+            output: List[str] = list()
+            for part in item.items_in_combo:
+                for name in Menu.ingredients_of(part):
+                    if name not in output:
+                        output.append(name)
+            return output
+        names: List[str] = list()
+        if isinstance(item, Wrap):
+            names.extend(str(addin).lower() for addin in item.addins)
+        for name in dir(type(item)):
+            attribute = getattr(type(item), name, None)
+            if (isinstance(attribute, property) and
+                    attribute.fset is not None and
+                    getattr(item, name) is True):
+                names.append(name.replace("_", " "))
+        return names
+
     @staticmethod
     def filter_calories(items: List[Item],
                         caloriesmin: int,
@@ -291,7 +394,7 @@ class Menu(object):
 
         This method will filter menu items
         based on the number of calories the item
-        contains.
+        contains.  A negative bound is ignored.
 
         Args:
             items: The list of items to be filtered.
@@ -308,17 +411,8 @@ class Menu(object):
         """
         if caloriesmin < 0 and caloriesmax < 0:
             return items
-        if caloriesmax < 0:
-            caloriesmax = 5000
-        output: List[Item] = list()
-        for item in items:
-            try:
-                calories = item.calories
-                if calories >= caloriesmin and calories <= caloriesmax:
-                    output.append(item)
-            except Exception:
-                continue
-        return output
+        return Menu.__filter_range(items, "calories",
+                                   caloriesmin, caloriesmax)
 
     @staticmethod
     def filter_price(items: List[Item],
@@ -327,7 +421,8 @@ class Menu(object):
         """Filter based on price.
 
         This method will filter menu items
-        based on price.
+        based on price.  A negative bound is
+        ignored.
 
         Args:
             items: The list of items to be filtered.
@@ -344,14 +439,72 @@ class Menu(object):
         """
         if pricemin < 0 and pricemax < 0:
             return items
-        if pricemax < 0:
-            pricemax = 5000
+        return Menu.__filter_range(items, "price", pricemin, pricemax)
+
+    @staticmethod
+    def range_bounds(low: float,
+                     high: float) -> Tuple[Optional[float],
+                                           Optional[float]]:
+        """Range bounds method.
+
+        Turns the minimum and maximum given by a
+        search form, where a negative value means
+        the bound was left blank, into the bounds
+        taken by a RangeIndex.
+
+        Args:
+            low: The minimum value, or a
+            negative number for no minimum.
+            high: The maximum value, or a
+            negative number for no maximum.
+
+        Returns:
+            A tuple of the lower and upper bound,
+            with None for a missing bound.
+        """
+        return (low if low >= 0 else None,
+                high if high >= 0 else None)
+
+    @staticmethod
+    def __filter_range(items: List[Item], attribute: str,
+                       low: float, high: float) -> List[Item]:
+        """Filter based on a range.
+
+        Keeps the items whose attribute lies
+        between low and high.  The catalog
+        snapshot is answered from its range
+        index; any other list is scanned, skipping
+        items that do not have the attribute.
+
+        Args:
+            items: The list of items to be filtered.
+            attribute: Either "price" or "calories".
+            low: The minimum value, or a negative
+            number for no minimum.
+            high: The maximum value, or a negative
+            number for no maximum.
+
+        Returns:
+            A list of items that meet the
+            criteria.
+        """
+        bottom, top = Menu.range_bounds(low, high)
+        # Imported here as the catalog is itself built from Menu.
+        from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+        snapshot = MenuCatalog.snapshot()
+        if items is snapshot.items:
+            if attribute == "price":
+                index = snapshot.price_index
+            else:
+                index = snapshot.calorie_index
+            return [items[i] for i in sorted(index.between(bottom, top))]
         output: List[Item] = list()
         for item in items:
             try:
-                price = item.price
-                if price >= pricemin and price <= pricemax:
-                    output.append(item)
+                value = getattr(item, attribute)
             except Exception:
                 continue
+            if ((bottom is None or value >= bottom) and
+                    (top is None or value <= top)):
+                output.append(item)
         return output
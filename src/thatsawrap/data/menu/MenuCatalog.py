@@ -0,0 +1,272 @@
+"""The Menu Catalog.
+
+This file contains the code required to build
+a snapshot of everything on the menu once and
+share it between requests until the catalog
+version changes.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import threading
+from typing import Dict, List, Optional, Set
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.enums.ItemType import ItemType
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.menu.KeywordIndex import KeywordIndex
+from src.thatsawrap.data.menu.FuzzyIndex import FuzzyIndex
+from src.thatsawrap.data.menu.RangeIndex import RangeIndex
+from src.thatsawrap.data.menu.MenuTable import MenuTable
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.custom.CustomItemList import CustomItemList
+
+
+class MenuSnapshot:
+    """Menu Snapshot class.
+
+    An immutable view of the menu at a single
+    catalog version.  The lists handed out by
+    this class are shared between callers and
+    must not be modified.
+    """
+    def __init__(self, version: int) -> None:
+        """Constructor for the menu snapshot.
+
+        Builds every item on the menu a single
+        time.
+
+        Args:
+            version: The catalog version the
+            snapshot is built from.
+        """
+        self.__version: int = version
+        self.__wraps: List[Item] = Menu.wraps()
+        self.__drinks: List[Item] = Menu.drinks()
+        self.__sides: List[Item] = Menu.sides()
+        self.__combos: List[Combo] = Menu.combos()
+        self.__custom_items: List[CustomItem] = list(CustomItemList())
+        self.__items: List[Item] = [*self.__wraps, *self.__drinks,
+                                    *self.__sides, *self.__combos]
+        self.__types: List[ItemType] = [Menu.type_of_item(item)
+                                        for item in self.__items]
+        self.__type_index: Dict[ItemType, Set[int]] = {
+            item_type: set() for item_type in ItemType}
+        for i, item_type in enumerate(self.__types):
+            self.__type_index[item_type].add(i)
+        self.__keyword_index = KeywordIndex(self.__items)
+        self.__calories: List[int] = [item.calories
+                                      for item in self.__items]
+        self.__prices: List[float] = [item.price for item in self.__items]
+        self.__calorie_index = RangeIndex(dict(enumerate(self.__calories)))
+        self.__price_index = RangeIndex(dict(enumerate(self.__prices)))
+        self.__table: Optional[MenuTable] = None
+        self.__fuzzy_index: Optional[FuzzyIndex] = None
+
+    @property
+    def version(self) -> int:
+        """Getter for version.
+
+        Returns:
+            The catalog version the snapshot
+            was built from.
+        """
+        return self.__version
+
+    @property
+    def items(self) -> List[Item]:
+        """Getter for items.
+
+        Returns:
+            Every item on the menu, in the
+            same order as Menu.fullmenu().
+            Custom items are not searched and
+            are only in custom_items.
+        """
+        return self.__items
+
+    @property
+    def wraps(self) -> List[Item]:
+        """Getter for wraps.
+
+        Returns:
+            A list of Wrap/Item type objects.
+        """
+        return self.__wraps
+
+    @property
+    def drinks(self) -> List[Item]:
+        """Getter for drinks.
+
+        Returns:
+            A list of Drink/Item type objects.
+        """
+        return self.__drinks
+
+    @property
+    def sides(self) -> List[Item]:
+        """Getter for sides.
+
+        Returns:
+            A list of Side/Item type objects.
+        """
+        return self.__sides
+
+    @property
+    def combos(self) -> List[Combo]:
+        """Getter for combos.
+
+        Returns:
+            A list of the named combos.
+        """
+        return self.__combos
+
+    @property
+    def custom_items(self) -> List[CustomItem]:
+        """Getter for custom items.
+
+        Returns:
+            A list of CustomItem type objects.
+        """
+        return self.__custom_items
+
+    @property
+    def types(self) -> List[ItemType]:
+        """Getter for types.
+
+        Returns:
+            The ItemType of each of items,
+            by position.
+        """
+        return self.__types
+
+    @property
+    def calories(self) -> List[int]:
+        """Getter for calories.
+
+        Returns:
+            The calories of each of items,
+            by position.
+        """
+        return self.__calories
+
+    @property
+    def prices(self) -> List[float]:
+        """Getter for prices.
+
+        Returns:
+            The price of each of items,
+            by position.
+        """
+        return self.__prices
+
+    @property
+    def type_index(self) -> Dict[ItemType, Set[int]]:
+        """Getter for the type index.
+
+        Returns:
+            A dict mapping each ItemType to
+            the ids of the items of that type.
+        """
+        return self.__type_index
+
+    @property
+    def keyword_index(self) -> KeywordIndex:
+        """Getter for the keyword index.
+
+        Returns:
+            The KeywordIndex built over items.
+        """
+        return self.__keyword_index
+
+    @property
+    def calorie_index(self) -> RangeIndex:
+        """Getter for the calorie index.
+
+        Returns:
+            The RangeIndex over the calories
+            of items.
+        """
+        return self.__calorie_index
+
+    @property
+    def price_index(self) -> RangeIndex:
+        """Getter for the price index.
+
+        Returns:
+            The RangeIndex over the prices
+            of items.
+        """
+        return self.__price_index
+
+    @property
+    def table(self) -> MenuTable:
+        """Getter for the table.
+
+        The columnar table is only built the
+        first time it is asked for.
+
+        Returns:
+            The MenuTable over items.
+        """
+        if self.__table is None:
+            self.__table = MenuTable(self.__items, self.__keyword_index)
+        return self.__table
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        """Getter for the fuzzy index.
+
+        The fuzzy index is only built the
+        first time it is asked for.
+
+        Returns:
+            The FuzzyIndex over items.
+        """
+        if self.__fuzzy_index is None:
+            self.__fuzzy_index = FuzzyIndex(self.__items)
+        return self.__fuzzy_index
+
+
+class MenuCatalog:
+    """Menu Catalog class.
+
+    Hands out the current menu snapshot,
+    rebuilding it only when the catalog
+    version has changed.
+    """
+    _snapshot: Optional[MenuSnapshot] = None
+    lock = threading.Lock()
+
+    @classmethod
+    def snapshot(cls) -> MenuSnapshot:
+        """Getter for the snapshot.
+
+        Returns the cached snapshot, building
+        a new one if the catalog has been
+        invalidated since it was built.
+
+        Returns:
+            The MenuSnapshot for the current
+            catalog version.
+        """
+        version = CatalogVersion.get_version()
+        snapshot = cls._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with MenuCatalog.lock:
+            version = CatalogVersion.get_version()
+            if cls._snapshot is None or cls._snapshot.version != version:
+                cls._snapshot = MenuSnapshot(version)
+            return cls._snapshot
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Invalidate method.
+
+        Marks the current snapshot as stale
+        so that the next call to snapshot()
+        rebuilds it.
+        """
+        CatalogVersion.bump()
@@ -0,0 +1,161 @@
+"""The Menu Document.
+
+This file contains the code required to turn
+the menu into JSON once per catalog version and
+keep the encoded bytes, so that the menu API can
+answer most requests without building anything.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+
+
+class SerializedSection(NamedTuple):
+    """Serialized Section class.
+
+    The encoded JSON of one section of the menu
+    and a strong ETag, without quotes, made from
+    a hash of it.
+    """
+    body: bytes
+    etag: str
+
+
+class MenuDocument:
+    """Menu Document class.
+
+    Builds the JSON for each section of the menu
+    the first time it is asked for at a catalog
+    version, and hands out the same bytes until
+    the version changes.
+    """
+    SECTIONS: List[str] = ["wraps", "drinks", "sides", "combos"]
+    _version: Optional[int] = None
+    _sections: Dict[str, SerializedSection] = dict()
+    lock = threading.Lock()
+
+    @classmethod
+    def section(cls, name: str) -> SerializedSection:
+        """Getter for a section.
+
+        Args:
+            name: One of SECTIONS, or "menu"
+            for all of them.
+
+        Returns:
+            The SerializedSection for the current
+            catalog version.
+
+        Raises:
+            KeyError: If there is no such section.
+        """
+        if name != "menu" and name not in MenuDocument.SECTIONS:
+            raise KeyError(name)
+        version = CatalogVersion.get_version()
+        with MenuDocument.lock:
+            if cls._version != version:
+                cls._version = version
+                cls._sections = dict()
+            found = cls._sections.get(name)
+        if found is not None:
+            return found
+        if name == "menu":
+            document: Any = {"discount": Combo.get_discount()}
+            for section in MenuDocument.SECTIONS:
+                document[section] = MenuDocument.__builders()[section]()
+        else:
+            document = MenuDocument.__builders()[name]()
+        body = json.dumps(document, separators=(",", ":"),
+                          sort_keys=True).encode("utf-8")
+        found = SerializedSection(body, hashlib.sha1(body).hexdigest())
+        with MenuDocument.lock:
+            if cls._version == version:
+                cls._sections[name] = found
+        return found
+
+    @staticmethod
+    def __builders() -> Dict[str, Callable[[], Any]]:
+        """Builders method.
+
+        Returns:
+            A dict mapping each section name to a
+            function building its document.
+        """
+        return {
+            "wraps": lambda: [MenuDocument.item(wrap)
+                              for wrap in Menu.wraps()],
+            "drinks": lambda: [MenuDocument.sized(sizes)
+                               for sizes in Menu.parsed_drinks()],
+            "sides": lambda: [MenuDocument.sized(sizes)
+                              for sizes in Menu.parsed_sides()],
+            "combos": lambda: [MenuDocument.combo(combo)
+                               for combo in Menu.combos()],
+        }
+
+    @staticmethod
+    def item(item: Item) -> Dict[str, Any]:
+        """Item document method.
+
+        Args:
+            item: The item to describe.
+
+        Returns:
+            A dict of the name, size or shell,
+            price, calories and instructions of
+            the item.
+        """
+        document: Dict[str, Any] = {
+            "name": getattr(item, "name", None),
+            "price": round(item.price, 2),
+            "calories": item.calories,
+            "instructions": list(item.instructions),
+        }
+        if hasattr(item, "size"):
+            document["size"] = str(item.size)
+        if hasattr(item, "shell"):
+            document["shell"] = str(item.shell)
+        return document
+
+    @staticmethod
+    def sized(sizes: List[Item]) -> Dict[str, Any]:
+        """Sized item document method.
+
+        Args:
+            sizes: Every size of a drink or side,
+            as given by Menu.parsed_drinks or
+            Menu.parsed_sides.
+
+        Returns:
+            A dict of the name of the item and a
+            list of its sizes.
+        """
+        return {"name": sizes[0].name,
+                "sizes": [{"size": str(item.size),
+                           "price": round(item.price, 2),
+                           "calories": item.calories}
+                          for item in sizes]}
+
+    @staticmethod
+    def combo(combo: Combo) -> Dict[str, Any]:
+        """Combo document method.
+
+        Args:
+            combo: The combo to describe.
+
+        Returns:
+            A dict of the name, price and calories
+            of the combo and the items in it.
+        """
+        return {"name": combo.name,
+                "price": round(combo.price, 2),
+                "calories": combo.calories,
+                "items": [MenuDocument.item(item)
+                          for item in combo.items_in_combo]}
@@ -0,0 +1,71 @@
+"""The Menu Query.
+
+This file contains the code required to represent
+everything a customer asked for on the advanced
+search form as a single object.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from typing import Mapping, NamedTuple, Optional
+
+
+class MenuQuery(NamedTuple):
+    """Menu Query class.
+
+    Holds the criteria of an advanced search.  A
+    negative calorie or price bound means that
+    the bound was left blank.
+    """
+    text: Optional[str] = None
+    wraps: bool = False
+    drinks: bool = False
+    sides: bool = False
+    combos: bool = False
+    caloriesmin: int = -1
+    caloriesmax: int = -1
+    pricemin: float = -1
+    pricemax: float = -1
+
+    @classmethod
+    def from_form(cls, form: Mapping[str, str]) -> "MenuQuery":
+        """Build from form method.
+
+        Reads the criteria submitted on the
+        advanced search form.  Bounds that are
+        missing or are not numbers are treated
+        as blank.
+
+        Args:
+            form: The submitted form fields.
+
+        Returns:
+            A MenuQuery holding the criteria.
+        """
+        return cls(text=form.get('text', None),
+                   wraps=bool(form.get('wraps', False)),
+                   drinks=bool(form.get('drinks', False)),
+                   sides=bool(form.get('sides', False)),
+                   combos=bool(form.get('combos', False)),
+                   caloriesmin=cls.__number(form, 'caloriesmin', int),
+                   caloriesmax=cls.__number(form, 'caloriesmax', int),
+                   pricemin=cls.__number(form, 'pricemin', float),
+                   pricemax=cls.__number(form, 'pricemax', float))
+
+    @staticmethod
+    def __number(form: Mapping[str, str], field: str, kind: type):
+        """Number parsing method.
+
+        Args:
+            form: The submitted form fields.
+            field: The name of the field to read.
+            kind: Either int or float.
+
+        Returns:
+            The value of the field, or -1 if it
+            is missing or not a number.
+        """
+        try:
+            return kind(form.get(field, "-1"))
+        except Exception:
+            return -1
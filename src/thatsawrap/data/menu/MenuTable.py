@@ -0,0 +1,288 @@
+"""The Menu Table.
+
+This file contains the code required to store
+the menu catalog as parallel NumPy columns, so
+that the Menu filters can be evaluated as boolean
+masks over every item at once.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np  # type: ignore
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.ItemType import ItemType
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.KeywordIndex import KeywordIndex
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+
+
+class MenuTable:
+    """Menu Table class.
+
+    Holds a price, calories, type code and
+    ingredient bitmask column for a list of items.
+    Row i of every column describes item i.  Each
+    ingredient name gets a bit of its own, and the
+    masks are split across as many 64 bit words
+    as there are names to hold.
+    """
+    WORD: int = 64
+
+    def __init__(self, items: Sequence[Item],
+                 keyword_index: Optional[KeywordIndex] = None) -> None:
+        """Constructor for the menu table.
+
+        Args:
+            items: The items to store.
+            keyword_index: A KeywordIndex built over
+            the same items; one is built if not
+            given.
+        """
+        self.__size: int = len(items)
+        self.__keyword_index: KeywordIndex = (
+            keyword_index if keyword_index is not None
+            else KeywordIndex(items))
+        self.__bits: Dict[str, int] = {
+            str(addin).lower(): 1 << bit for bit, addin in enumerate(Addin)}
+        self.__price = np.array([item.price for item in items],
+                                dtype=np.float64)
+        self.__calories = np.array([item.calories for item in items],
+                                   dtype=np.int64)
+        self.__type_code = np.array([Menu.type_of_item(item)
+                                     for item in items], dtype=np.int8)
+        masks = [self.__mask_of(item) for item in items]
+        self.__words: int = max(1, -(-len(self.__bits) // MenuTable.WORD))
+        self.__ingredients = np.array([self.__split(mask) for mask in masks],
+                                      dtype=np.uint64).reshape(
+                                          self.__size, self.__words)
+
+    def __split(self, mask: int) -> List[int]:
+        """Split mask method.
+
+        Args:
+            mask: An ingredient bitmask of any
+            width.
+
+        Returns:
+            The mask as a list of 64 bit words,
+            lowest first.
+        """
+        low = (1 << MenuTable.WORD) - 1
+        return [(mask >> (MenuTable.WORD * word)) & low
+                for word in range(self.__words)]
+
+    def __mask_of(self, item: Item) -> int:
+        """Ingredient mask method.
+
+        Args:
+            item: The item to describe.
+
+        Returns:
+            An int with one bit set per
+            ingredient of the item.
+        """
+        mask = 0
+        for name in Menu.ingredients_of(item):
+            if name not in self.__bits:
+                self.__bits[name] = 1 << len(self.__bits)
+            mask |= self.__bits[name]
+        return mask
+
+    @property
+    def price(self) -> np.ndarray:
+        """Getter for the price column.
+
+        Returns:
+            A float64 array of prices.
+        """
+        return self.__price
+
+    @property
+    def calories(self) -> np.ndarray:
+        """Getter for the calories column.
+
+        Returns:
+            An int64 array of calories.
+        """
+        return self.__calories
+
+    @property
+    def type_code(self) -> np.ndarray:
+        """Getter for the type code column.
+
+        Returns:
+            An int8 array of ItemType values.
+        """
+        return self.__type_code
+
+    @property
+    def ingredients(self) -> np.ndarray:
+        """Getter for the ingredient column.
+
+        Returns:
+            A uint64 array of ingredient
+            bitmasks, one row per item and one
+            column per 64 bit word.
+        """
+        return self.__ingredients
+
+    def keyword_mask(self, keywords: Optional[str]) -> np.ndarray:
+        """Keyword mask method.
+
+        Mask form of Menu.filter_keywords.
+
+        Args:
+            keywords: The keywords to filter on.
+
+        Returns:
+            A boolean array, True for the items
+            that match one of the keywords.
+        """
+        mask = np.zeros(self.__size, dtype=bool)
+        mask[self.__keyword_index.search(keywords)] = True
+        return mask
+
+    def type_mask(self, wraps: bool, drinks: bool,
+                  sides: bool, combos: bool) -> np.ndarray:
+        """Type mask method.
+
+        Mask form of Menu.filter_type_of_item.
+
+        Args:
+            wraps: If set to True, wraps match.
+            drinks: If set to True, drinks match.
+            sides: If set to True, sides match.
+            combos: If set to True, combos match.
+
+        Returns:
+            A boolean array, True for the items
+            of the chosen types.
+        """
+        wanted = [item_type for item_type, flag in
+                  zip((ItemType.WRAP, ItemType.DRINK,
+                       ItemType.SIDE, ItemType.COMBO),
+                      (wraps, drinks, sides, combos)) if flag]
+        return np.isin(self.__type_code, wanted)
+
+    def calorie_mask(self, caloriesmin: int,
+                     caloriesmax: int) -> np.ndarray:
+        """Calorie mask method.
+
+        Mask form of Menu.filter_calories.
+
+        Args:
+            caloriesmin: The minimum calories, or
+            a negative number for no minimum.
+            caloriesmax: The maximum calories, or
+            a negative number for no maximum.
+
+        Returns:
+            A boolean array, True for the items
+            within the range.
+        """
+        return self.__range_mask(self.__calories, caloriesmin, caloriesmax)
+
+    def price_mask(self, pricemin: float, pricemax: float) -> np.ndarray:
+        """Price mask method.
+
+        Mask form of Menu.filter_price.
+
+        Args:
+            pricemin: The minimum price, or a
+            negative number for no minimum.
+            pricemax: The maximum price, or a
+            negative number for no maximum.
+
+        Returns:
+            A boolean array, True for the items
+            within the range.
+        """
+        return self.__range_mask(self.__price, pricemin, pricemax)
+
+    def ingredient_mask(self, names: Iterable[str]) -> np.ndarray:
+        """Ingredient mask method.
+
+        Args:
+            names: The addins or ingredients that
+            must all be in the item, such as
+            "pickles" or "chicken".
+
+        Returns:
+            A boolean array, True for the items
+            containing every ingredient.
+        """
+        wanted = 0
+        for name in names:
+            bit = self.__bits.get(name.lower())
+            if bit is None:
+                return np.zeros(self.__size, dtype=bool)
+            wanted |= bit
+        wanted_bits = np.array(self.__split(wanted), dtype=np.uint64)
+        return ((self.__ingredients & wanted_bits) ==
+                wanted_bits).all(axis=1)
+
+    def __range_mask(self, column: np.ndarray, low: float,
+                     high: float) -> np.ndarray:
+        """Range mask method.
+
+        Args:
+            column: The column to compare.
+            low: The minimum, or a negative number
+            for no minimum.
+            high: The maximum, or a negative number
+            for no maximum.
+
+        Returns:
+            A boolean array, True for the rows
+            within the range.
+        """
+        mask = np.ones(self.__size, dtype=bool)
+        if low < 0 and high < 0:
+            return mask
+        bottom, top = Menu.range_bounds(low, high)
+        if bottom is not None:
+            mask &= column >= bottom
+        if top is not None:
+            mask &= column <= top
+        return mask
+
+    def mask(self, query: MenuQuery) -> np.ndarray:
+        """Query mask method.
+
+        Args:
+            query: The search criteria.
+
+        Returns:
+            A boolean array, True for the items
+            that meet every criterion.
+        """
+        return (self.keyword_mask(query.text) &
+                self.type_mask(query.wraps, query.drinks,
+                               query.sides, query.combos) &
+                self.calorie_mask(query.caloriesmin, query.caloriesmax) &
+                self.price_mask(query.pricemin, query.pricemax))
+
+    def select(self, query: MenuQuery) -> np.ndarray:
+        """Select method.
+
+        Orders the rows matched by mask() the way
+        the advanced search lists them: by type,
+        then in keyword order.
+
+        Args:
+            query: The search criteria.
+
+        Returns:
+            An array of the ids of the matching
+            items.
+        """
+        mask = self.mask(query)
+        if query.text:
+            order = np.array(self.__keyword_index.search(query.text),
+                             dtype=np.intp)
+            ids = order[mask[order]]
+        else:
+            ids = np.flatnonzero(mask)
+        return ids[np.argsort(self.__type_code[ids], kind="stable")]
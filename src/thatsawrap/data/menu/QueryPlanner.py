@@ -0,0 +1,181 @@
+"""The Query Planner.
+
+This file contains the code required to answer
+an advanced search from the indexes of the menu
+catalog in a single pass, instead of chaining
+the Menu filters.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from src.thatsawrap.data.enums.ItemType import ItemType
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuCatalog import MenuSnapshot
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+
+
+class SearchFacets(NamedTuple):
+    """Search Facets class.
+
+    Holds how many items each choice on the advanced
+    search form would give.  Every facet is counted
+    with all of the other criteria applied, but not
+    its own, so each count is what the customer would
+    see after changing only that part of the form.
+    """
+    types: List[Tuple[str, int]]
+    prices: List[Tuple[str, int]]
+    calories: List[Tuple[str, int]]
+
+
+class QueryPlanner:
+    """Query Planner class.
+
+    Gives the same results, in the same order, as
+    filter_keywords, filter_type_of_item,
+    filter_calories and filter_price applied one
+    after another to the catalog.
+    """
+    TYPES: Tuple[ItemType, ...] = (ItemType.WRAP, ItemType.DRINK,
+                                   ItemType.SIDE, ItemType.COMBO)
+    TYPE_LABELS: Tuple[str, ...] = ("Wraps", "Drinks", "Sides", "Combos")
+    PRICE_EDGES: Tuple[float, ...] = (5, 10, 15, 20)
+    PRICE_LABELS: Tuple[str, ...] = ("Under $5", "$5 to $10", "$10 to $15",
+                                     "$15 to $20", "$20 and up")
+    CALORIE_EDGES: Tuple[int, ...] = (500, 1000, 1500, 2000)
+    CALORIE_LABELS: Tuple[str, ...] = ("Under 500", "500 to 1000",
+                                       "1000 to 1500", "1500 to 2000",
+                                       "2000 and up")
+
+    @staticmethod
+    def plan(snapshot: MenuSnapshot, query: MenuQuery) -> List[int]:
+        """Plan method.
+
+        Narrows the catalog with the type and range
+        indexes, smallest set first, then walks the
+        keyword matches once, keeping the candidates
+        and grouping them by type.
+
+        Args:
+            snapshot: The catalog snapshot to search.
+            query: The search criteria.
+
+        Returns:
+            The ids of the matching items.
+        """
+        selected: List[ItemType] = [
+            item_type for item_type, wanted in
+            zip(QueryPlanner.TYPES, (query.wraps, query.drinks,
+                                     query.sides, query.combos))
+            if wanted]
+        if len(selected) == 0:
+            return list()
+        filters: List[Set[int]] = [set().union(
+            *(snapshot.type_index[item_type] for item_type in selected))]
+        if not (query.caloriesmin < 0 and query.caloriesmax < 0):
+            filters.append(snapshot.calorie_index.between(
+                *Menu.range_bounds(query.caloriesmin, query.caloriesmax)))
+        if not (query.pricemin < 0 and query.pricemax < 0):
+            filters.append(snapshot.price_index.between(
+                *Menu.range_bounds(query.pricemin, query.pricemax)))
+        filters.sort(key=len)
+        candidates = filters[0].intersection(*filters[1:])
+        if query.text:
+            order: List[int] = snapshot.keyword_index.search(query.text)
+        else:
+            order = sorted(candidates)
+        groups: Dict[ItemType, List[int]] = {
+            item_type: list() for item_type in selected}
+        types = snapshot.types
+        for i in order:
+            if i in candidates:
+                groups[types[i]].append(i)
+        return [i for item_type in selected for i in groups[item_type]]
+
+    @staticmethod
+    def plan_with_facets(snapshot: MenuSnapshot,
+                         query: MenuQuery) -> Tuple[List[int],
+                                                    SearchFacets]:
+        """Plan with facets method.
+
+        Gives the same ids as plan() and counts the
+        facets while doing so.  Facets need the
+        items excluded by each filter, so the range
+        and type indexes are only used for set
+        lookups while walking the keyword matches
+        once.
+
+        Args:
+            snapshot: The catalog snapshot to search.
+            query: The search criteria.
+
+        Returns:
+            A tuple of the ids of the matching items
+            and the SearchFacets.
+        """
+        flags = (query.wraps, query.drinks, query.sides, query.combos)
+        selected: List[ItemType] = [
+            item_type for item_type, wanted in
+            zip(QueryPlanner.TYPES, flags) if wanted]
+        in_type: Set[int] = set().union(
+            *(snapshot.type_index[item_type] for item_type in selected))
+        in_calories: Optional[Set[int]] = None
+        if not (query.caloriesmin < 0 and query.caloriesmax < 0):
+            in_calories = snapshot.calorie_index.between(
+                *Menu.range_bounds(query.caloriesmin, query.caloriesmax))
+        in_price: Optional[Set[int]] = None
+        if not (query.pricemin < 0 and query.pricemax < 0):
+            in_price = snapshot.price_index.between(
+                *Menu.range_bounds(query.pricemin, query.pricemax))
+        if query.text:
+            order: List[int] = snapshot.keyword_index.search(query.text)
+        else:
+            order = list(range(len(snapshot.items)))
+        type_counts = [0] * len(QueryPlanner.TYPES)
+        price_counts = [0] * len(QueryPlanner.PRICE_LABELS)
+        calorie_counts = [0] * len(QueryPlanner.CALORIE_LABELS)
+        groups: Dict[ItemType, List[int]] = {
+            item_type: list() for item_type in selected}
+        types = snapshot.types
+        prices = snapshot.prices
+        calories = snapshot.calories
+        for i in order:
+            item_type = types[i]
+            if item_type == ItemType.CUSTOM:
+                continue
+            type_ok = i in in_type
+            calories_ok = in_calories is None or i in in_calories
+            price_ok = in_price is None or i in in_price
+            if calories_ok and price_ok:
+                type_counts[item_type] += 1
+            if type_ok and price_ok:
+                calorie_counts[bisect_right(QueryPlanner.CALORIE_EDGES,
+                                            calories[i])] += 1
+            if type_ok and calories_ok:
+                price_counts[bisect_right(QueryPlanner.PRICE_EDGES,
+                                          prices[i])] += 1
+                if price_ok:
+                    groups[item_type].append(i)
+        facets = SearchFacets(
+            types=list(zip(QueryPlanner.TYPE_LABELS, type_counts)),
+            prices=list(zip(QueryPlanner.PRICE_LABELS, price_counts)),
+            calories=list(zip(QueryPlanner.CALORIE_LABELS, calorie_counts)))
+        return ([i for item_type in selected for i in groups[item_type]],
+                facets)
+
+    @staticmethod
+    def execute(snapshot: MenuSnapshot, query: MenuQuery) -> List[Item]:
+        """Execute method.
+
+        Args:
+            snapshot: The catalog snapshot to search.
+            query: The search criteria.
+
+        Returns:
+            A list of the matching items.
+        """
+        items = snapshot.items
+        return [items[i] for i in QueryPlanner.plan(snapshot, query)]
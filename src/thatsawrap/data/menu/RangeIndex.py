@@ -0,0 +1,82 @@
+"""The Range Index.
+
+This file contains the code required to build
+a sorted index over a numeric property of the
+items on the menu, such as price or calories,
+so that range queries do not have to scan
+every item.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Set
+
+
+class RangeIndex:
+    """Range Index class.
+
+    Keeps item ids sorted by value, so that the
+    ids within a range are found with two binary
+    searches.
+    """
+    def __init__(self, values: Dict[int, float]) -> None:
+        """Constructor for the range index.
+
+        Args:
+            values: A dict mapping item ids to
+            the value indexed for them.
+        """
+        pairs = sorted((value, i) for i, value in values.items())
+        self.__values: List[float] = [value for value, i in pairs]
+        self.__ids: List[int] = [i for value, i in pairs]
+
+    def between(self, low: Optional[float] = None,
+                high: Optional[float] = None) -> Set[int]:
+        """Range query method.
+
+        Finds every item whose value lies in
+        the closed interval [low, high].
+
+        Args:
+            low: The smallest value to include,
+            or None for no lower bound.
+            high: The largest value to include,
+            or None for no upper bound.
+
+        Returns:
+            A set of the ids of the matching
+            items.
+        """
+        start = 0 if low is None else bisect_left(self.__values, low)
+        end = (len(self.__values) if high is None
+               else bisect_right(self.__values, high))
+        return set(self.__ids[start:end])
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Getter for the minimum.
+
+        Returns:
+            The smallest indexed value, or
+            None if the index is empty.
+        """
+        return self.__values[0] if self.__values else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Getter for the maximum.
+
+        Returns:
+            The largest indexed value, or
+            None if the index is empty.
+        """
+        return self.__values[-1] if self.__values else None
+
+    def __len__(self) -> int:
+        """Length method.
+
+        Returns:
+            The number of indexed items.
+        """
+        return len(self.__ids)
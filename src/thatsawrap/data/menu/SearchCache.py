@@ -0,0 +1,196 @@
+"""The Search Cache.
+
+This file contains the code required to remember
+the results of recent searches, so that repeated
+searches are not worked out again.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuCatalog import MenuSnapshot
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.RangeIndex import RangeIndex
+
+
+class SearchCache:
+    """Search Cache class.
+
+    A least recently used cache whose entries also
+    expire after a fixed time.  Keys should include
+    the catalog version, so that a change to the
+    catalog stops old results from being used.
+    """
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Constructor for the search cache.
+
+        Args:
+            maxsize: The most entries to keep.
+            ttl: The number of seconds an entry
+            may be used for.
+            clock: A function giving the current
+            time in seconds.
+        """
+        if maxsize < 1 or ttl <= 0:
+            raise ValueError
+        self.__maxsize: int = maxsize
+        self.__ttl: float = ttl
+        self.__clock: Callable[[], float] = clock
+        self.__entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict())
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable,
+                       compute: Callable[[], Any]) -> Any:
+        """Get or compute method.
+
+        Returns the cached value for the key,
+        computing and storing it if it is missing
+        or has expired.
+
+        Args:
+            key: The key of the entry.
+            compute: A function computing the value.
+
+        Returns:
+            The value for the key.
+        """
+        now = self.__clock()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry[1]
+            self.__misses += 1
+        value = compute()
+        with self.__lock:
+            self.__entries[key] = (now + self.__ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Clear method.
+
+        Removes every entry and resets the
+        counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Getter for hits.
+
+        Returns:
+            The number of lookups answered
+            from the cache.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Getter for misses.
+
+        Returns:
+            The number of lookups that had
+            to be computed.
+        """
+        return self.__misses
+
+    def stats(self) -> Dict[str, int]:
+        """Statistics method.
+
+        Returns:
+            A dict of the hit and miss counters
+            and the number of entries.
+        """
+        return {"hits": self.__hits, "misses": self.__misses,
+                "size": len(self.__entries)}
+
+    def __len__(self) -> int:
+        """Length method.
+
+        Returns:
+            The number of entries, including
+            any that have expired.
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def normalize(snapshot: MenuSnapshot, query: MenuQuery) -> MenuQuery:
+        """Normalize method.
+
+        Rewrites a query into a cache key, so
+        that searches which ask for the same thing
+        share one: keywords are lowercased and
+        repeats dropped, keeping the order they
+        were given in as results follow it, and
+        bounds that do not exclude any item in the
+        catalog are dropped.  Searches should still
+        be run on the query as given.
+
+        Args:
+            snapshot: The catalog snapshot the query
+            will be run against.
+            query: The search criteria.
+
+        Returns:
+            The normalized MenuQuery.
+        """
+        text = ""
+        if query.text:
+            text = " ".join(dict.fromkeys(query.text.lower().split(" ")))
+        caloriesmin, caloriesmax = SearchCache.__clamp(
+            snapshot.calorie_index, query.caloriesmin, query.caloriesmax)
+        pricemin, pricemax = SearchCache.__clamp(
+            snapshot.price_index, query.pricemin, query.pricemax)
+        return MenuQuery(text=text, wraps=bool(query.wraps),
+                         drinks=bool(query.drinks),
+                         sides=bool(query.sides),
+                         combos=bool(query.combos),
+                         caloriesmin=int(caloriesmin),
+                         caloriesmax=int(caloriesmax),
+                         pricemin=pricemin, pricemax=pricemax)
+
+    @staticmethod
+    def __clamp(index: RangeIndex, low: float,
+                high: float) -> Tuple[float, float]:
+        """Clamp method.
+
+        Args:
+            index: The range index of the bounded
+            property.
+            low: The minimum, or a negative number
+            for no minimum.
+            high: The maximum, or a negative number
+            for no maximum.
+
+        Returns:
+            The minimum and maximum, with -1 for
+            a bound that does not exclude anything.
+        """
+        if low < 0 and high < 0:
+            return -1, -1
+        bottom: Optional[float]
+        top: Optional[float]
+        bottom, top = Menu.range_bounds(low, high)
+        minimum = index.minimum
+        maximum = index.maximum
+        if bottom is not None and minimum is not None and bottom <= minimum:
+            bottom = None
+        if top is not None and maximum is not None and top >= maximum:
+            top = None
+        return (-1 if bottom is None else bottom,
+                -1 if top is None else top)
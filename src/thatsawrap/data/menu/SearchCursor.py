@@ -0,0 +1,109 @@
+"""The Search Cursor.
+
+This file contains the code required to split
+search results into pages that can be walked
+through with an opaque cursor.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import base64
+import binascii
+from itertools import islice
+from typing import Iterator, NamedTuple, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class SearchCursor(NamedTuple):
+    """Search Cursor class.
+
+    Points at the first result of a page.  A cursor
+    is only valid for the catalog version it was
+    made at, as results are only guaranteed to keep
+    their order while the catalog does not change.
+    """
+    version: int
+    offset: int
+
+    def encode(self) -> str:
+        """Encode method.
+
+        Returns:
+            The cursor as a URL safe string.
+        """
+        text = "{}:{}".format(self.version, self.offset)
+        return base64.urlsafe_b64encode(text.encode("ascii")).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: Optional[str]) -> Optional["SearchCursor"]:
+        """Decode method.
+
+        Args:
+            token: A string made by encode.
+
+        Returns:
+            The SearchCursor, or None if the token
+            is missing or not a valid cursor.
+        """
+        if not token:
+            return None
+        try:
+            text = base64.urlsafe_b64decode(token.encode("ascii"))
+            version, offset = text.decode("ascii").split(":")
+            cursor = cls(int(version), int(offset))
+        except (ValueError, UnicodeError, binascii.Error):
+            return None
+        if cursor.offset < 0:
+            return None
+        return cursor
+
+
+class SearchPage(NamedTuple):
+    """Search Page class.
+
+    One page of search results.  The items are
+    produced lazily, so that a streamed template
+    can send each one as soon as it is rendered.
+    """
+    items: Iterator
+    start: int
+    end: int
+    total: int
+    next_cursor: Optional[str]
+    stale: bool
+
+    @classmethod
+    def paginate(cls, results: Sequence[T], version: int,
+                 token: Optional[str], page_size: int) -> "SearchPage":
+        """Paginate method.
+
+        A cursor from another catalog version
+        starts again from the first page.
+
+        Args:
+            results: Every result of the search,
+            in order.
+            version: The catalog version the
+            results were found at.
+            token: The cursor of the page wanted,
+            or None for the first page.
+            page_size: The most results on a page.
+
+        Returns:
+            The SearchPage the cursor points at.
+        """
+        if page_size < 1:
+            raise ValueError
+        cursor = SearchCursor.decode(token)
+        stale = cursor is not None and cursor.version != version
+        offset = 0
+        if cursor is not None and not stale:
+            offset = min(cursor.offset, len(results))
+        end = min(offset + page_size, len(results))
+        next_cursor: Optional[str] = None
+        if end < len(results):
+            next_cursor = SearchCursor(version, end).encode()
+        return cls(items=islice(results, offset, end), start=offset,
+                   end=end, total=len(results), next_cursor=next_cursor,
+                   stale=stale)
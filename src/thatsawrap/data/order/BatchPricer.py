@@ -0,0 +1,325 @@
+"""BatchPricer class.
+
+Prices many orders at once by flattening their
+lines into NumPy arrays and looking every line
+up in a price table, instead of asking each item
+for its price.  Promotions are taken off in the
+same pass.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version: 0.1
+"""
+from fractions import Fraction
+from typing import (Dict, Iterable, List, NamedTuple, Optional, Sequence,
+                    Union)
+import numpy as np  # type: ignore
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.Money import Money
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.PromotionEngine import PromotionEngine
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+
+class LineBatch(NamedTuple):
+    """Line Batch class.
+
+    The lines of a list of orders as parallel
+    arrays, one row per item, plus one row per
+    combo carrying its discount flag.  Rows are
+    grouped by order, and by line within each
+    order, and carry the number of their line and
+    the class code of the item on it.  The tax
+    rate of each order is kept as an exact
+    fraction.
+    """
+    order: np.ndarray
+    line: np.ndarray
+    kind: np.ndarray
+    code: np.ndarray
+    variant: np.ndarray
+    quantity: np.ndarray
+    discount: np.ndarray
+    cents: np.ndarray
+    tax_numerator: np.ndarray
+    tax_denominator: np.ndarray
+
+
+class BatchTotals(NamedTuple):
+    """Batch Totals class.
+
+    The subtotal, tax and total in cents of each
+    order in a batch, in the order given.
+    """
+    subtotal_cents: np.ndarray
+    tax_cents: np.ndarray
+    total_cents: np.ndarray
+
+
+class BatchPricer:
+    """BatchPricer class.
+
+    Gives every wrap, drink and side class on the
+    menu a product code, and every shell or size
+    a variant code, and builds a table of prices in
+    cents from the items themselves.  Combos and
+    items without a code, such as custom items,
+    carry their own price in cents on their row.
+
+    Every class of item flattened is also given a
+    class code, and promotions running in the
+    PromotionEngine are taken off each line as
+    Order takes them off, looking up the promotion
+    of each class once per batch from the same
+    mask and table.
+    """
+    COMBO: int = 0
+    OTHER: int = 1
+
+    def __init__(self) -> None:
+        """Constructor for the batch pricer.
+
+        Builds the price table from one item
+        of each class in each variant.
+        """
+        self.__codes: Dict[type, int] = dict()
+        self.__kinds: Dict[type, int] = dict()
+        width = max(len(Shell), len(Size))
+        rows: List[List[int]] = [[0] * width, [0] * width]
+        for item in Menu.wraps() + Menu.drinks() + Menu.sides():
+            kind = type(item)
+            if kind in self.__codes:
+                continue
+            self.__codes[kind] = len(rows)
+            prices: List[int] = list()
+            if isinstance(item, Wrap):
+                for shell in Shell:
+                    sample = kind()
+                    sample.shell = shell
+                    prices.append(Money.to_cents(sample.price))
+            else:
+                for size in Size:
+                    sample = kind()
+                    sample.size = size
+                    prices.append(Money.to_cents(sample.price))
+            rows.append(prices + [0] * (width - len(prices)))
+        self.__table = np.array(rows, dtype=np.int64)
+
+    @property
+    def table(self) -> np.ndarray:
+        """Getter for the price table.
+
+        Returns:
+            An int64 array of prices in cents,
+            indexed by product code and then
+            variant code.
+        """
+        return self.__table
+
+    def code_of(self, item: Union[Item, Wrap, Drink, Side]) -> int:
+        """Code of item method.
+
+        Args:
+            item: The item to look up.
+
+        Returns:
+            The product code of the item, COMBO
+            for combos, or OTHER if its class has
+            no code.
+        """
+        if isinstance(item, Combo):
+            return BatchPricer.COMBO
+        return self.__codes.get(type(item), BatchPricer.OTHER)
+
+    def flatten(self, orders: Iterable[Order]) -> LineBatch:
+        """Flatten method.
+
+        Args:
+            orders: The orders to flatten.
+
+        Returns:
+            A LineBatch of the lines of every
+            order.
+        """
+        order: List[int] = list()
+        line_of: List[int] = list()
+        kind: List[int] = list()
+        code: List[int] = list()
+        variant: List[int] = list()
+        quantity: List[int] = list()
+        discount: List[bool] = list()
+        cents: List[int] = list()
+        numerators: List[int] = list()
+        denominators: List[int] = list()
+        shells = {shell: n for n, shell in enumerate(Shell)}
+        sizes = {size: n for n, size in enumerate(Size)}
+        rates: Dict[float, Fraction] = dict()
+        lines = 0
+
+        def add(index: int, item: Union[Item, Wrap, Drink, Side, None],
+                count: int) -> None:
+            if item is None:
+                return
+            item_code = self.code_of(item)
+            order.append(index)
+            code.append(item_code)
+            quantity.append(count)
+            discount.append(False)
+            if item_code == BatchPricer.OTHER:
+                variant.append(0)
+                cents.append(Money.to_cents(item.price))
+            elif isinstance(item, Wrap):
+                variant.append(shells[item.shell])
+                cents.append(0)
+            elif isinstance(item, (Drink, Side)):
+                variant.append(sizes[item.size])
+                cents.append(0)
+
+        for index, entry in enumerate(orders):
+            rate = entry.tax_rate
+            fraction = rates.get(rate)
+            if fraction is None:
+                fraction = Fraction(str(rate))
+                rates[rate] = fraction
+            numerators.append(fraction.numerator)
+            denominators.append(fraction.denominator)
+            for line in entry.lines:
+                item = line.item
+                if isinstance(item, Combo):
+                    parts = (item.wrap, item.drink, item.side)
+                    for part in parts:
+                        add(index, part, line.quantity)
+                    order.append(index)
+                    code.append(BatchPricer.COMBO)
+                    variant.append(0)
+                    quantity.append(line.quantity)
+                    discount.append(all(part is not None for part in parts))
+                    cents.append(0)
+                else:
+                    add(index, item, line.quantity)
+                kind_code = self.__kinds.setdefault(type(item),
+                                                    len(self.__kinds))
+                rows = len(order) - len(line_of)
+                line_of.extend([lines] * rows)
+                kind.extend([kind_code] * rows)
+                lines += 1
+        return LineBatch(
+            order=np.array(order, dtype=np.int64),
+            line=np.array(line_of, dtype=np.int64),
+            kind=np.array(kind, dtype=np.int64),
+            code=np.array(code, dtype=np.int16),
+            variant=np.array(variant, dtype=np.int8),
+            quantity=np.array(quantity, dtype=np.int64),
+            discount=np.array(discount, dtype=bool),
+            cents=np.array(cents, dtype=np.int64),
+            tax_numerator=np.array(numerators, dtype=np.int64),
+            tax_denominator=np.array(denominators, dtype=np.int64))
+
+    def price(self, batch: LineBatch,
+              mask: Optional[int] = None) -> BatchTotals:
+        """Price method.
+
+        Looks up every row, takes the combo
+        discount off flagged rows, sums the rows
+        of each order, takes off the promotions and
+        rounds the tax of each order half up, as
+        Order does.  The rows must be grouped by
+        order, in order, as flatten makes them.
+
+        Args:
+            batch: The flattened orders.
+            mask: The running promotions, or None
+            to work them out.
+
+        Returns:
+            The BatchTotals of the orders.
+        """
+        unit = (self.__table[batch.code, batch.variant] + batch.cents -
+                batch.discount * Combo.get_discount_cents())
+        running = np.concatenate(([0], np.cumsum(unit * batch.quantity)))
+        bounds = np.searchsorted(batch.order,
+                                 np.arange(len(batch.tax_numerator) + 1))
+        subtotal = (running[bounds[1:]] - running[bounds[:-1]] -
+                    self.__discount_cents(batch, unit, mask))
+        tax = ((2 * subtotal * batch.tax_numerator + batch.tax_denominator)
+               // (2 * batch.tax_denominator))
+        return BatchTotals(subtotal_cents=subtotal, tax_cents=tax,
+                           total_cents=subtotal + tax)
+
+    def __discount_cents(self, batch: LineBatch, unit: np.ndarray,
+                         mask: Optional[int]) -> np.ndarray:
+        """Discount in cents method.
+
+        Finds the promotion of each line from the
+        promotion of its class, takes percents off
+        the unit price of each line, and sorts the
+        units of buy one get one promotions in each
+        order by price to take off every group-th
+        one, as PromotionEngine.apply does.
+
+        Args:
+            batch: The flattened orders.
+            unit: The price in cents of one unit
+            of each row.
+            mask: The running promotions, or None
+            to work them out.
+
+        Returns:
+            An int64 array of the cents taken off
+            each order.
+        """
+        discount = np.zeros(len(batch.tax_numerator), dtype=np.int64)
+        promotions = PromotionEngine.get_promotions()
+        if not promotions or not len(batch.line):
+            return discount
+        if mask is None:
+            mask = PromotionEngine.mask()
+        if not mask:
+            return discount
+        kinds = np.zeros(len(self.__kinds), dtype=np.int64)
+        for kind, kind_code in self.__kinds.items():
+            kinds[kind_code] = PromotionEngine.index_of(kind, mask)
+        # The extra entry at the end is read for lines with no promotion.
+        percents = np.array([p.percent for p in promotions] + [0],
+                            dtype=np.int64)
+        buys = np.array([p.buy for p in promotions] + [0], dtype=np.int64)
+        first = np.flatnonzero(np.diff(batch.line, prepend=-1))
+        price = np.add.reduceat(unit, first)
+        quantity = batch.quantity[first]
+        owner = batch.order[first]
+        rule = kinds[batch.kind[first]]
+        buy = buys[rule]
+        count = np.where(buy == 0, quantity, 0)
+        pooled = np.flatnonzero(buy)
+        if len(pooled):
+            pooled = pooled[np.lexsort(
+                (-price[pooled], rule[pooled], owner[pooled]))]
+            held = quantity[pooled]
+            group = buy[pooled] + 1
+            before = np.cumsum(held) - held
+            starts = np.ones(len(pooled), dtype=bool)
+            starts[1:] = ((owner[pooled][1:] != owner[pooled][:-1]) |
+                          (rule[pooled][1:] != rule[pooled][:-1]))
+            # Every group-th unit, counting from the dearest, is off.
+            seen = before - np.maximum.accumulate(
+                np.where(starts, before, 0))
+            count[pooled] = (seen + held) // group - seen // group
+        off = (price * percents[rule] * 2 + 100) // 200 * count
+        np.add.at(discount, owner, off)
+        return discount
+
+    def price_orders(self, orders: Sequence[Order]) -> BatchTotals:
+        """Price orders method.
+
+        Args:
+            orders: The orders to price.
+
+        Returns:
+            The BatchTotals of the orders.
+        """
+        return self.price(self.flatten(orders))
@@ -7,11 +7,15 @@ as a combo.
 Author: Dustin hayes djhayes@ksu.edu
 Version: 0.1
 """
-from typing import List
+import copy
+from typing import Any, List, Optional, Tuple
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 from src.thatsawrap.data.drinks.Drink import Drink
 from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.order.Money import Money
+from src.thatsawrap.data.order.PromotionEngine import PromotionEngine
 
 
 class Combo(Item):
@@ -22,6 +26,8 @@ class Combo(Item):
     side.
     """
     __discount: float = .95
+    __PARTS: Tuple[str, ...] = ("_Combo__wrap", "_Combo__drink",
+                                "_Combo__side")
 
     def __init__(self, name: str = None) -> None:
         """Constructor for combo class.
@@ -36,6 +42,10 @@ class Combo(Item):
         self.__wrap: Wrap = None
         self.__side: Side = None
         self.__drink: Drink = None
+        self.__shared: Tuple[str, ...] = ()
+        self.__memo: Optional[Tuple[Optional[Tuple[int, int, int]], int, int,
+                                    Tuple[str, ...],
+                                    Tuple[Item, ...]]] = None
 
     @classmethod
     def get_discount(cls) -> float:
@@ -54,7 +64,8 @@ class Combo(Item):
     def set_discount(cls, discount: float) -> None:
         """Static setter for discount.
 
-        Sets the discount.
+        Sets the discount and invalidates
+        the menu catalog.
 
         Args:
             discount: A float representing the
@@ -65,6 +76,7 @@ class Combo(Item):
             raise ValueError
         else:
             cls._Combo__discount = discount
+            CatalogVersion.bump()
 
     @property
     def name(self) -> str:
@@ -99,7 +111,7 @@ class Combo(Item):
             The Wrap type object in the
             combo.
         """
-        return self.__wrap
+        return self.__take("_Combo__wrap")
 
     @wrap.setter
     def wrap(self, w: Wrap) -> None:
@@ -112,6 +124,7 @@ class Combo(Item):
             stored in the combo.
         """
         if isinstance(w, Wrap) or w is None:
+            self.__release("_Combo__wrap")
             self.__wrap = w
         else:
             raise ValueError
@@ -126,7 +139,7 @@ class Combo(Item):
             The Drink type object in the
             combo.
         """
-        return self.__drink
+        return self.__take("_Combo__drink")
 
     @drink.setter
     def drink(self, d: Drink) -> None:
@@ -139,6 +152,7 @@ class Combo(Item):
             stored in the combo.
         """
         if isinstance(d, Drink) or d is None:
+            self.__release("_Combo__drink")
             self.__drink = d
         else:
             raise ValueError
@@ -153,7 +167,7 @@ class Combo(Item):
             The Side type object in the
             combo.
         """
-        return self.__side
+        return self.__take("_Combo__side")
 
     @side.setter
     def side(self, s: side) -> None:
@@ -166,6 +180,7 @@ class Combo(Item):
             stored in the combo.
         """
         if isinstance(s, Side) or s is None:
+            self.__release("_Combo__side")
             self.__side = s
         else:
             raise ValueError
@@ -179,6 +194,97 @@ class Combo(Item):
         self.__drink = None
         self.__side = None
         self.__name = None
+        self.__shared = ()
+
+    def clone(self) -> "Combo":
+        """Clone method.
+
+        Makes a copy of the combo that shares
+        its items, and the values and key already
+        worked out, with this one.  The copy takes
+        a copy of an item the first time it hands
+        it out, as that is where it could be
+        changed in place, and stops sharing an item
+        once it is set.  Working out the price,
+        calories, key and equality reads the shared
+        items without copying them.  This combo
+        must not be changed while clones share its
+        items, as with the prototypes kept by
+        ComboBuilder.
+
+        Returns:
+            A copy-on-write copy of the combo.
+        """
+        clone = copy.copy(self)
+        object.__setattr__(clone, "_Combo__shared", Combo.__PARTS)
+        return clone
+
+    def __take(self, name: str) -> Any:
+        """Take item method.
+
+        Swaps an item shared with the combo this
+        was cloned from for a copy before handing
+        it out.  The copy has the same epoch, so
+        the key and values worked out are kept,
+        with the copy in place of the shared item.
+
+        Args:
+            name: The attribute the item is kept in.
+
+        Returns:
+            The item, owned by this combo.
+        """
+        item = getattr(self, name)
+        if name in self.__shared:
+            self.__release(name)
+            if item is not None:
+                item = copy.copy(item)
+                object.__setattr__(self, name, item)
+                memo = self.__memo
+                if memo is not None:
+                    items = tuple(part for part in (self.__wrap, self.__drink,
+                                                    self.__side)
+                                  if part is not None)
+                    object.__setattr__(self, "_Combo__memo",
+                                       memo[:4] + (items,))
+        return item
+
+    def __release(self, name: str) -> None:
+        """Release item method.
+
+        Stops sharing an item with the combo
+        this was cloned from.
+
+        Args:
+            name: The attribute the item is kept in.
+        """
+        if name in self.__shared:
+            object.__setattr__(self, "_Combo__shared", tuple(
+                shared for shared in self.__shared if shared != name))
+
+    @classmethod
+    def get_discount_cents(cls) -> int:
+        """Static getter for discount in cents.
+
+        Returns:
+            The discount rounded to the
+            nearest cent.
+        """
+        return Money.to_cents(cls.get_discount())
+
+    @property
+    def price_cents(self) -> int:
+        """Getter for price in cents.
+
+        Gets the price of all items, each
+        rounded to the nearest cent, less the
+        discount in cents if the combo is full.
+
+        Returns:
+            An int representing the
+            price of the combo in cents.
+        """
+        return self.__derived()[1]
 
     @property
     def price(self) -> float:
@@ -191,21 +297,7 @@ class Combo(Item):
             A float representing the
             price of the combo.
         """
-        if (self.__wrap is not None and
-                self.__drink is not None and
-                self.__side is not None):
-            return (self.__wrap.price +
-                    self.__drink.price +
-                    self.__side.price - self._Combo__discount)
-        else:
-            total_price = 0
-            if self.__wrap is not None:
-                total_price = total_price + self.__wrap.price
-            if self.__drink is not None:
-                total_price = total_price + self.__drink.price
-            if self.__side is not None:
-                total_price = total_price + self.__side.price
-            return total_price
+        return Money.to_dollars(self.price_cents)
 
     @property
     def calories(self) -> int:
@@ -217,36 +309,21 @@ class Combo(Item):
             A int representing the
             calories in the combo.
         """
-        total_calories = 0
-        if self.__wrap is not None:
-            total_calories = total_calories + self.__wrap.calories
-        if self.__drink is not None:
-            total_calories = total_calories + self.__drink.calories
-        if self.__side is not None:
-            total_calories = total_calories + self.__side.calories
-        return total_calories
+        return self.__derived()[2]
 
     @property
     def instructions(self) -> List[str]:
         """Getter for instructions.
 
-        Gets the instructions.
+        Gets the instructions, with the
+        promotion that takes something off the
+        combo, if any.
 
         Returns:
             A list of strings representing the
             instructions for the combo.
         """
-        instructions = list()
-        if self.__name is not None:
-            instructions.append(self.__name)
-        else:
-            instructions.append("Custom Combo")
-        if (self.__wrap is not None and
-            self.__drink is not None and
-            self.__side is not None):
-            instructions.append("${} Discount Applied".format(
-                               self._Combo__discount))
-        return instructions
+        return list(self.__derived()[3])
 
     @property
     def items_in_combo(self) -> List[Item]:
@@ -259,21 +336,94 @@ class Combo(Item):
             A list of Item objects representing
             the items in the combo.
         """
-        item_list: List[Item] = list()
-        if self.__wrap is not None:
-            item_list.append(self.__wrap)
-        if self.__drink is not None:
-            item_list.append(self.__drink)
-        if self.__side is not None:
-            item_list.append(self.__side)
-        return item_list
+        for name in self.__shared:
+            self.__take(name)
+        return list(self.__derived()[4])
+
+    def __derived(self) -> Tuple[Optional[Tuple[int, int, int]], int, int,
+                                 Tuple[str, ...], Tuple[Item, ...]]:
+        """Derived values method.
+
+        Works out the price in cents, calories,
+        instructions and items of the combo, and
+        keeps them along with the epoch of the
+        combo, the catalog version, which moves
+        when the discount or promotions change,
+        and the running promotions.  They are only
+        worked out again once any has moved.
+        Items that do not inherit from Item cannot
+        say when they change, so a combo holding
+        one is never kept.
+
+        Returns:
+            A tuple of the stamp the values were
+            worked out at, or None, the price in
+            cents, calories, instructions and items.
+        """
+        mask = PromotionEngine.mask()
+        stamp: Optional[Tuple[int, int, int]] = (
+            self.epoch, CatalogVersion.get_version(), mask)
+        memo = self.__memo
+        if memo is not None and memo[0] == stamp:
+            return memo
+        parts: Tuple[Any, ...] = (self.__wrap, self.__drink, self.__side)
+        items: Tuple[Item, ...] = tuple(item for item in parts
+                                        if item is not None)
+        if not all(Item in type(item).__mro__ for item in items):
+            stamp = None
+        full = len(items) == 3
+        total_cents = sum(Money.to_cents(item.price) for item in items)
+        if full:
+            total_cents -= Combo.get_discount_cents()
+        total_calories = 0
+        for item in items:
+            total_calories = total_calories + item.calories
+        instructions = [self.__name if self.__name is not None
+                        else "Custom Combo"]
+        if full:
+            instructions.append("${} Discount Applied".format(
+                               Combo.get_discount()))
+        promotion = PromotionEngine.promotion_of(self, mask)
+        # One combo never makes up a group of a buy one get one.
+        if (promotion is not None and not promotion.buy and
+                Money.percent_cents(total_cents, promotion.percent)):
+            instructions.append("{} Promotion".format(promotion.name))
+        derived = (stamp, total_cents, total_calories, tuple(instructions),
+                   items)
+        if stamp is not None:
+            # Set without moving the epoch, which would spoil the stamp.
+            object.__setattr__(self, "_Combo__memo", derived)
+        return derived
+
+    @property
+    def epoch(self) -> int:
+        """Getter for epoch.
+
+        Epochs come from one clock shared by
+        all items, so the latest epoch of the
+        combo and its items changes whenever
+        any of them changes.  Only classes that
+        inherit from Item have an epoch.
+
+        Returns:
+            An int that changes whenever the
+            combo or an item in it changes.
+        """
+        epoch = super().epoch
+        parts: Tuple[Any, ...] = (self.__wrap, self.__drink, self.__side)
+        for item in parts:
+            if Item in type(item).__mro__ and item.epoch > epoch:
+                epoch = item.epoch
+        return epoch
 
     def __eq__(self, c: object) -> bool:
         """Equals method.
 
         Overwrites native __eq__ such that
         two combos are equal if all attributes
-        are equal.
+        are equal.  Combos with different
+        structural hashes are told apart without
+        comparing their items.
 
         Args:
             c: The object to compare to.
@@ -284,8 +434,10 @@ class Combo(Item):
         """
         if not isinstance(c, Combo):
             return False
+        elif hash(self) != hash(c):
+            return False
         else:
-            return (self.__wrap == c.wrap and
-                    self.__drink == c.drink and
-                    self.__side == c.side and
-                    self.__name == c.name)       
+            return (self.__wrap == c.__wrap and
+                    self.__drink == c.__drink and
+                    self.__side == c.__side and
+                    self.__name == c.__name)       
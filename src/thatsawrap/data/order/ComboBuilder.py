@@ -1,11 +1,13 @@
 """Combo builder.
 
 Follows builder pattern to construct
-combos.
+combos, handing out clones of a prototype
+of each.
 
 Author: Dustin hayes djhayes@ksu.edu
 Version: 0.1
 """
+from typing import Dict
 from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
 from src.thatsawrap.data.wraps.Spartacus import Spartacus
 from src.thatsawrap.data.wraps.TheWizardOfOz import TheWizardOfOz
@@ -23,14 +25,22 @@ class ComboBuilder:
     """Combo builder class.
 
     Contains the code to construct
-    combos based on key-words.
+    combos based on key-words.  Each combo
+    is constructed once, as a prototype that
+    is never handed out or changed, and each
+    call gets a copy-on-write clone of it.
+    The items of a clone are only copied if
+    one is handed out to be changed, such as
+    when pickles are taken off the wrap.
     """
+    __prototypes: Dict[str, Combo] = dict()
+
     @staticmethod
     def build_combo(c_name: str) -> Combo:
         """Build combo method.
 
-        Takes a string input to construct
-        and return one of 4 combos.
+        Takes a string input and returns a
+        clone of one of 4 combos.
 
         Args:
             c_name: A string representing
@@ -41,6 +51,31 @@ class ComboBuilder:
         attributes depending on the key-words
         given to the method.
         """
+        prototype = ComboBuilder.__prototypes.get(c_name)
+        if prototype is None:
+            prototype = ComboBuilder.__construct(c_name)
+            ComboBuilder.__prototypes[c_name] = prototype
+        # Works out the values and key on the prototype, if they
+        # are stale, so that clones start with them.
+        hash(prototype)
+        prototype.price_cents
+        return prototype.clone()
+
+    @staticmethod
+    def __construct(c_name: str) -> Combo:
+        """Construct combo method.
+
+        Args:
+            c_name: A string representing
+            one of 4 combos.
+
+        Returns:
+            A new combo with new items.
+
+        Raises:
+            ValueError: If the name is not
+            one of the combos.
+        """
         if c_name == "Classic":
             c = Combo("Classic")
             c.wrap = TheGodFather()
@@ -0,0 +1,226 @@
+"""ComboOptimizer class.
+
+Finds the best combos that fit a budget and a
+calorie limit by branch and bound over tables of
+every wrap, drink and side option on the menu.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import heapq
+import itertools
+from typing import Any, List, NamedTuple, Tuple, Union
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+
+class ComboOption(NamedTuple):
+    """Combo Option class.
+
+    One class of wrap, drink or side in one
+    shell or size, with its price in cents and
+    calories.
+    """
+    kind: type
+    variant: Any
+    price_cents: int
+    calories: int
+
+    def build(self) -> Union[Wrap, Drink, Side]:
+        """Build method.
+
+        Returns:
+            A new item of the option.
+        """
+        item = self.kind()
+        if isinstance(item, Wrap):
+            item.shell = self.variant
+        else:
+            item.size = self.variant
+        return item
+
+
+class ComboChoice(NamedTuple):
+    """Combo Choice class.
+
+    A wrap, drink and side option and the
+    price in cents, with the combo discount,
+    and calories of the combo they make.
+    """
+    price_cents: int
+    calories: int
+    wrap: ComboOption
+    drink: ComboOption
+    side: ComboOption
+
+    def build(self) -> Combo:
+        """Build method.
+
+        Returns:
+            A new combo of the options.
+        """
+        combo = Combo()
+        for option in (self.wrap, self.drink, self.side):
+            item = option.build()
+            if isinstance(item, Wrap):
+                combo.wrap = item
+            elif isinstance(item, Drink):
+                combo.drink = item
+            else:
+                combo.side = item
+        return combo
+
+
+class ComboOptimizer:
+    """ComboOptimizer class.
+
+    Builds one item of each class in each shell
+    or size on the menu to make a table of options
+    for each part of a combo, sorted by calories.
+    Flavors and toppings do not change the price
+    or calories of any item, so each drink and
+    wrap is only listed with its usual ones.
+
+    A search goes through wraps, then drinks, then
+    sides, keeping the best k combos found in a
+    heap.  A branch is cut off when even the best
+    options left in each later part could not fit
+    the limits or beat the worst combo kept.
+    """
+    CALORIES: str = "calories"
+    PRICE: str = "price"
+
+    def __init__(self) -> None:
+        """Constructor for the combo optimizer.
+
+        Builds the option tables from the menu.
+        """
+        self.__parts: List[List[ComboOption]] = [
+            ComboOptimizer.__options(Menu.wraps(), list(Shell)),
+            ComboOptimizer.__options(Menu.drinks(), list(Size)),
+            ComboOptimizer.__options(Menu.sides(), list(Size)),
+        ]
+
+    @property
+    def options(self) -> List[List[ComboOption]]:
+        """Getter for options.
+
+        Returns:
+            The wrap, drink and side options,
+            each sorted by calories, most first.
+        """
+        return [list(part) for part in self.__parts]
+
+    def best(self, budget_cents: int, max_calories: int, k: int = 5,
+             goal: str = CALORIES) -> List[ComboChoice]:
+        """Best combos method.
+
+        Args:
+            budget_cents: The most a combo may
+            cost, in cents, with the discount.
+            max_calories: The most calories a
+            combo may have.
+            k: How many combos to find.
+            goal: CALORIES for the most calories
+            within the limits, with the lower price
+            first on ties, or PRICE for the lowest
+            price, with more calories first on ties.
+
+        Returns:
+            Up to k ComboChoices, best first.
+
+        Raises:
+            ValueError: If k is less than one or
+            the goal is unknown.
+        """
+        if k < 1 or goal not in (ComboOptimizer.CALORIES,
+                                 ComboOptimizer.PRICE):
+            raise ValueError
+        discount = Combo.get_discount_cents()
+        parts = self.__parts
+        if goal == ComboOptimizer.PRICE:
+            parts = [sorted(part, key=lambda o: (o.price_cents, -o.calories))
+                     for part in parts]
+        # Least price and calories, and most calories, of the parts
+        # after each level.
+        low_price = [sum(min(o.price_cents for o in part)
+                         for part in parts[n:]) for n in range(4)]
+        low_calories = [sum(min(o.calories for o in part)
+                            for part in parts[n:]) for n in range(4)]
+        high_calories = [sum(max(o.calories for o in part)
+                             for part in parts[n:]) for n in range(4)]
+        limit = budget_cents + discount
+        kept: List[Tuple[Tuple[int, int], int, ComboChoice]] = list()
+        counter = itertools.count()
+
+        def score(price: int, calories: int) -> Tuple[int, int]:
+            if goal == ComboOptimizer.CALORIES:
+                return (calories, -price)
+            return (-price, calories)
+
+        def bound(level: int, price: int, calories: int) -> int:
+            if goal == ComboOptimizer.CALORIES:
+                return min(calories + high_calories[level], max_calories)
+            return -(price + low_price[level] - discount)
+
+        def search(level: int, price: int, calories: int,
+                   chosen: List[ComboOption]) -> None:
+            if level == 3:
+                choice = ComboChoice(price - discount, calories, *chosen)
+                entry = (score(price - discount, calories), next(counter),
+                         choice)
+                if len(kept) < k:
+                    heapq.heappush(kept, entry)
+                elif entry[0] > kept[0][0]:
+                    heapq.heapreplace(kept, entry)
+                return
+            for option in parts[level]:
+                total = price + option.price_cents
+                energy = calories + option.calories
+                if len(kept) == k and bound(level + 1, total,
+                                            energy) < kept[0][0][0]:
+                    # Options are sorted, so later ones bound no better.
+                    break
+                if (total + low_price[level + 1] > limit or
+                        energy + low_calories[level + 1] > max_calories):
+                    continue
+                chosen.append(option)
+                search(level + 1, total, energy, chosen)
+                chosen.pop()
+
+        search(0, 0, 0, list())
+        kept.sort(key=lambda entry: (entry[0], -entry[1]), reverse=True)
+        return [entry[2] for entry in kept]
+
+    @staticmethod
+    def __options(items: List[Item],
+                  variants: List[Any]) -> List[ComboOption]:
+        """Options method.
+
+        Args:
+            items: Items of each class in a part.
+            variants: The shells or sizes each
+            class comes in.
+
+        Returns:
+            One ComboOption for each class in each
+            variant, sorted by calories, most first.
+        """
+        options: List[ComboOption] = list()
+        seen = set()
+        for item in items:
+            kind = type(item)
+            if kind in seen:
+                continue
+            seen.add(kind)
+            for variant in variants:
+                sample = ComboOption(kind, variant, 0, 0).build()
+                options.append(ComboOption(kind, variant, sample.price_cents,
+                                           sample.calories))
+        return sorted(options, key=lambda o: (-o.calories, o.price_cents))
@@ -0,0 +1,214 @@
+"""ComboPackager class.
+
+Finds wraps, drinks and sides ordered on their
+own that could be sold as combos, and replaces
+them in the order with those combos.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import copy
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.PromotionEngine import PromotionEngine
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+
+class Repackaged(NamedTuple):
+    """Repackaged class.
+
+    A combo added to an order and the wrap,
+    drink and side it was made from.  An item
+    from a line with a quantity of more than
+    one is a copy, and the line is one less.
+    """
+    combo: Combo
+    wrap: Wrap
+    drink: Drink
+    side: Side
+
+
+class ComboPackager:
+    """ComboPackager class.
+
+    Every combo takes exactly one wrap, one drink
+    and one side, so no way of grouping the loose
+    items of an order makes more combos than the
+    fewest of the three.  Every full combo gets the
+    same discount, so every grouping into that many
+    combos costs the same, and the lowest price is
+    reached by taking the wraps, drinks and sides
+    in the order they were added until one kind
+    runs out.  This takes one pass over the lines.
+    Combos made of the same items as a combo on
+    the menu are given its name.
+
+    While promotions are running, a combo can
+    cost more than its items did, such as when
+    its wrap was the free half of a buy one get
+    one.  Each combo in the plan is then tried on
+    a copy of the order, priced with promotions
+    taken off, and only kept if the subtotal goes
+    down.
+    """
+    _names: Optional[Dict[Tuple[Hashable, ...], str]] = None
+
+    @staticmethod
+    def plan(order: Order) -> List[Tuple[Item, Item, Item]]:
+        """Plan method.
+
+        Args:
+            order: The order to look through.
+
+        Returns:
+            The wrap, drink and side of each combo
+            that can be made, in the order they were
+            added.  An item appears once for each of
+            its quantity that goes into a combo.
+        """
+        wraps: List[Item] = list()
+        drinks: List[Item] = list()
+        sides: List[Item] = list()
+        for line in order.lines:
+            item = line.item
+            if isinstance(item, Wrap):
+                wraps.extend([item] * line.quantity)
+            elif isinstance(item, Drink):
+                drinks.extend([item] * line.quantity)
+            elif isinstance(item, Side):
+                sides.extend([item] * line.quantity)
+        return list(zip(wraps, drinks, sides))
+
+    @staticmethod
+    def savings_cents(order: Order) -> int:
+        """Savings method.
+
+        Args:
+            order: The order to look through.
+
+        Returns:
+            How many cents repackaging the order
+            would take off its subtotal, with
+            promotions taken off.
+        """
+        return ComboPackager.__choose(order)[1]
+
+    @staticmethod
+    def repackage(order: Order) -> List[Repackaged]:
+        """Repackage method.
+
+        Replaces the loose items of each combo
+        in the plan that lowers the subtotal of
+        the order with the combo.
+
+        Args:
+            order: The order to repackage.
+
+        Returns:
+            A Repackaged for each combo added,
+            in the order they were added.
+        """
+        done: List[Repackaged] = list()
+        for parts in ComboPackager.__choose(order)[0]:
+            combo = ComboPackager.__pack(order, parts)
+            done.append(Repackaged(combo, combo.wrap, combo.drink,
+                                   combo.side))
+        return done
+
+    @staticmethod
+    def __choose(order: Order) -> Tuple[List[Tuple[Item, Item, Item]],
+                                        int]:
+        """Choose method.
+
+        Args:
+            order: The order to look through.
+
+        Returns:
+            The combos of the plan that lower the
+            subtotal of the order, and how many
+            cents they take off it.  Without running
+            promotions, every combo takes off the
+            discount and the order is not copied.
+        """
+        plan = ComboPackager.plan(order)
+        if not plan or not PromotionEngine.mask():
+            return plan, len(plan) * Combo.get_discount_cents()
+        scratch = Order(order.order_number)
+        for line in order.lines:
+            scratch.add_item(line.item)
+            if line.quantity > 1:
+                scratch.add_items(line.item, line.quantity - 1)
+        before = subtotal = scratch.subtotal_cents
+        kept: List[Tuple[Item, Item, Item]] = list()
+        for parts in plan:
+            combo = ComboPackager.__pack(scratch, parts)
+            packed = scratch.subtotal_cents
+            if packed < subtotal:
+                kept.append(parts)
+                subtotal = packed
+            else:
+                scratch.remove_item(combo)
+                for item in parts:
+                    scratch.add_items(item)
+        return kept, before - subtotal
+
+    @staticmethod
+    def __pack(order: Order, parts: Tuple[Item, Item, Item]) -> Combo:
+        """Pack method.
+
+        Takes one of each item off its line and
+        adds a combo of them to the order.  An
+        item from a line with a quantity of more
+        than one is copied.
+
+        Args:
+            order: The order holding the items.
+            parts: The wrap, drink and side.
+
+        Returns:
+            The combo added.
+        """
+        combo = Combo()
+        for item in parts:
+            line = order.line_of(item)
+            if line.quantity > 1:
+                order.remove_items(item, 1)
+                item = copy.deepcopy(item)
+            else:
+                order.remove_item(item)
+            if isinstance(item, Wrap):
+                combo.wrap = item
+            elif isinstance(item, Drink):
+                combo.drink = item
+            elif isinstance(item, Side):
+                combo.side = item
+        name = ComboPackager.name_of(*combo.items_in_combo)
+        if name is not None:
+            combo.name = name
+        order.add_item(combo)
+        return combo
+
+    @staticmethod
+    def name_of(wrap: Item, drink: Item, side: Item) -> Optional[str]:
+        """Name of combo method.
+
+        Args:
+            wrap: The wrap of a combo.
+            drink: The drink of a combo.
+            side: The side of a combo.
+
+        Returns:
+            The name of the combo on the menu made
+            of the same items, or None if there is
+            not one.
+        """
+        if ComboPackager._names is None:
+            ComboPackager._names = {
+                tuple(item.key for item in combo.items_in_combo): combo.name
+                for combo in Menu.combos()}
+        return ComboPackager._names.get((wrap.key, drink.key, side.key))
@@ -0,0 +1,432 @@
+"""ItemCodec class.
+
+Encodes items, combos and orders as compact,
+versioned binary records and decodes them.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import struct
+from typing import Dict, List, Optional, Tuple, Type, Union
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.drinks.ForrestGump import ForrestGump
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.drinks.SinginInTheRain import SinginInTheRain
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+from src.thatsawrap.data.sides.TheFrenchConnection import TheFrenchConnection
+from src.thatsawrap.data.sides.YankeeDoodleDandy import YankeeDoodleDandy
+from src.thatsawrap.data.wraps.SomeLikeItHot import SomeLikeItHot
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.wraps.TheWizardOfOz import TheWizardOfOz
+from src.thatsawrap.data.wraps.WestSideStory import WestSideStory
+from src.thatsawrap.data.wraps.Wrap import Wrap
+
+
+class ItemCodec:
+    """ItemCodec class.
+
+    Every record starts with a one byte type code.
+    Wraps follow it with their shell and a 16 bit
+    field holding a bit for each topping, in the
+    order given in TYPES, and a bit for each addin
+    from bit 8 on, in the order of Addin.  Drinks
+    and sides follow it with their size and a byte
+    of flavor bits.  Custom items carry their price
+    in cents, calories and name, and combos carry
+    a byte saying which parts are present, their
+    name and then the record of each part.
+
+    Values written by encode and encode_order
+    start with VERSION, and the codes, flags and
+    enum orders here may only change along with it.
+
+    Items are read back without calling their
+    constructors or setters: the flags of a record
+    are looked up in tables of the packed options
+    they stand for, and the options are set on the
+    new item at once.
+    """
+    VERSION: int = 1
+    CUSTOM: int = 48
+    COMBO: int = 64
+    ADDIN_BIT: int = 8
+    TYPES: Dict[int, Tuple[Type[Item], Tuple[str, ...]]] = {
+        1: (Spartacus, ("chicken", "cheese", "corned_beef",
+                        "pepperoni", "sausage")),
+        2: (SomeLikeItHot, ("chicken", "cheese")),
+        3: (TheGodFather, ("pepperoni", "sausage", "marinara", "cheese")),
+        4: (TheWizardOfOz, ("chicken", "spinach", "cheese")),
+        5: (WestSideStory, ("corned_beef", "cheese", "cabbage")),
+        16: (ForrestGump, ("chocolate", "vanilla", "caramel", "coffee")),
+        17: (KingKong, ("banana", "strawberry", "peach", "mango")),
+        18: (SinginInTheRain, ("cherry", "strawberry", "cola", "grape")),
+        32: (SnowWhite, ()),
+        33: (TheFrenchConnection, ()),
+        34: (YankeeDoodleDandy, ()),
+    }
+    CODES: Dict[type, int] = {kind: code
+                              for code, (kind, _) in TYPES.items()}
+    SHELLS: List[Shell] = list(Shell)
+    SIZES: List[Size] = list(Size)
+    ADDINS: List[Addin] = list(Addin)
+
+    __code = struct.Struct(">B")
+    __wrap = struct.Struct(">BBH")
+    __sized = struct.Struct(">BBB")
+    __custom = struct.Struct(">BiiH")
+    __combo = struct.Struct(">BBH")
+    __order = struct.Struct(">BQdI")
+    __line = struct.Struct(">I")
+    __shell_codes = {shell: n for n, shell in enumerate(Shell)}
+    __size_codes = {size: n for n, size in enumerate(Size)}
+    __addin_options: Tuple[int, ...] = tuple(
+        sum(Wrap.ADDINS[addin] for n, addin in enumerate(Addin)
+            if flags >> n & 1)
+        for flags in range(1 << len(Addin)))
+    __topping_options: Dict[int, Tuple[int, ...]] = dict()
+
+    @staticmethod
+    def encode(item: Item) -> bytes:
+        """Encode method.
+
+        Args:
+            item: The item or combo to encode.
+
+        Returns:
+            The version and record of the item.
+        """
+        buffer = bytearray(ItemCodec.__code.pack(ItemCodec.VERSION))
+        ItemCodec.write_item(buffer, item)
+        return bytes(buffer)
+
+    @staticmethod
+    def decode(data: bytes) -> Item:
+        """Decode method.
+
+        Args:
+            data: Bytes made by encode.
+
+        Returns:
+            A new item equal to the one encoded.
+
+        Raises:
+            ValueError: If the data is not a
+            record of this version.
+        """
+        ItemCodec.__check_version(data)
+        item, offset = ItemCodec.read_item(data, 1)
+        if offset != len(data):
+            raise ValueError("trailing bytes")
+        return item
+
+    @staticmethod
+    def encode_order(order: Order) -> bytes:
+        """Encode order method.
+
+        Args:
+            order: The order to encode.
+
+        Returns:
+            The version, order number, tax rate
+            and lines of the order.
+        """
+        lines = order.lines
+        buffer = bytearray(ItemCodec.__order.pack(
+            ItemCodec.VERSION, order.order_number, order.tax_rate,
+            len(lines)))
+        for line in lines:
+            buffer += ItemCodec.__line.pack(line.quantity)
+            ItemCodec.write_item(buffer, line.item)
+        return bytes(buffer)
+
+    @staticmethod
+    def decode_order(data: bytes) -> Order:
+        """Decode order method.
+
+        Args:
+            data: Bytes made by encode_order.
+
+        Returns:
+            A new order with the same number,
+            tax rate and lines, without taking
+            a new order number.
+
+        Raises:
+            ValueError: If the data is not an
+            order of this version.
+        """
+        number, rate, lines = ItemCodec.decode_lines(data)
+        order = Order(number)
+        order.tax_rate = rate
+        for quantity, item in lines:
+            if quantity == 1:
+                order.add_item(item)
+            else:
+                order.add_items(item, quantity)
+        return order
+
+    @staticmethod
+    def decode_lines(data: bytes) -> Tuple[int, float, List[Tuple[int, Item]]]:
+        """Decode lines method.
+
+        Reads an order without building it,
+        for callers that only need its items.
+
+        Args:
+            data: Bytes made by encode_order.
+
+        Returns:
+            A tuple of the order number, the tax
+            rate and a list of the quantity and
+            item of each line.
+
+        Raises:
+            ValueError: If the data is not an
+            order of this version.
+        """
+        ItemCodec.__check_version(data)
+        _, number, rate, count = ItemCodec.__unpack(ItemCodec.__order,
+                                                    data, 0)
+        offset = ItemCodec.__order.size
+        lines: List[Tuple[int, Item]] = list()
+        for _ in range(count):
+            quantity = ItemCodec.__unpack(ItemCodec.__line, data, offset)[0]
+            item, offset = ItemCodec.read_item(
+                data, offset + ItemCodec.__line.size)
+            lines.append((quantity, item))
+        if offset != len(data):
+            raise ValueError("trailing bytes")
+        return number, rate, lines
+
+    @staticmethod
+    def write_item(buffer: bytearray,
+                   item: Union[Item, Wrap, Drink, Side]) -> None:
+        """Write item method.
+
+        Appends the record of an item, without
+        a version, to a buffer.
+
+        Args:
+            buffer: The buffer to append to.
+            item: The item or combo to write.
+
+        Raises:
+            ValueError: If there is no code for
+            the class of the item.
+        """
+        if isinstance(item, Combo):
+            parts = (item.wrap, item.drink, item.side)
+            present = sum(1 << n for n, part in enumerate(parts)
+                          if part is not None)
+            name = ItemCodec.__text(item.name)
+            if item.name is not None:
+                present |= 1 << 3
+            buffer += ItemCodec.__combo.pack(ItemCodec.COMBO, present,
+                                             len(name))
+            buffer += name
+            for part in parts:
+                if part is not None:
+                    ItemCodec.write_item(buffer, part)
+            return
+        if isinstance(item, CustomItem):
+            name = ItemCodec.__text(item.name)
+            buffer += ItemCodec.__custom.pack(ItemCodec.CUSTOM,
+                                              item.price_cents,
+                                              item.calories, len(name))
+            buffer += name
+            return
+        code = ItemCodec.CODES.get(type(item))
+        if code is None:
+            raise ValueError(type(item).__name__)
+        flags = 0
+        for bit, attribute in enumerate(ItemCodec.TYPES[code][1]):
+            if getattr(item, attribute):
+                flags |= 1 << bit
+        if isinstance(item, Wrap):
+            addins = item.addins
+            for bit, addin in enumerate(ItemCodec.ADDINS):
+                if addin in addins:
+                    flags |= 1 << (bit + ItemCodec.ADDIN_BIT)
+            buffer += ItemCodec.__wrap.pack(
+                code, ItemCodec.__shell_codes[item.shell], flags)
+        elif isinstance(item, (Drink, Side)):
+            buffer += ItemCodec.__sized.pack(
+                code, ItemCodec.__size_codes[item.size], flags)
+
+    @staticmethod
+    def read_item(data: bytes, offset: int) -> Tuple[Item, int]:
+        """Read item method.
+
+        Args:
+            data: Bytes holding a record made
+            by write_item.
+            offset: Where the record starts.
+
+        Returns:
+            A tuple of the item and the offset
+            just past its record.
+
+        Raises:
+            ValueError: If the record is cut short
+            or its codes are unknown.
+        """
+        code = ItemCodec.__unpack(ItemCodec.__code, data, offset)[0]
+        if code == ItemCodec.COMBO:
+            _, present, length = ItemCodec.__unpack(ItemCodec.__combo,
+                                                    data, offset)
+            offset += ItemCodec.__combo.size
+            name = ItemCodec.__read_text(data, offset, length)
+            combo = Combo(name) if present & (1 << 3) else Combo()
+            offset += length
+            parts = (("wrap", Wrap), ("drink", Drink), ("side", Side))
+            for n, (part, kind) in enumerate(parts):
+                if present & (1 << n):
+                    item, offset = ItemCodec.read_item(data, offset)
+                    if not isinstance(item, kind):
+                        raise ValueError("combo " + part)
+                    setattr(combo, part, item)
+            return combo, offset
+        if code == ItemCodec.CUSTOM:
+            _, cents, calories, length = ItemCodec.__unpack(
+                ItemCodec.__custom, data, offset)
+            offset += ItemCodec.__custom.size
+            name = ItemCodec.__read_text(data, offset, length)
+            return CustomItem(name, cents / 100, calories), offset + length
+        found = ItemCodec.TYPES.get(code)
+        if found is None:
+            raise ValueError("unknown type code {}".format(code))
+        kind = found[0]
+        item = kind.__new__(kind)
+        try:
+            if issubclass(kind, Wrap):
+                _, shell, flags = ItemCodec.__unpack(ItemCodec.__wrap,
+                                                     data, offset)
+                offset += ItemCodec.__wrap.size
+                object.__setattr__(item, "_shell", ItemCodec.SHELLS[shell])
+                addins = ItemCodec.__addin_options
+                options = addins[flags >> ItemCodec.ADDIN_BIT &
+                                 len(addins) - 1]
+            else:
+                _, size, flags = ItemCodec.__unpack(ItemCodec.__sized,
+                                                    data, offset)
+                offset += ItemCodec.__sized.size
+                if issubclass(kind, Side):
+                    setattr(item, "_size", ItemCodec.SIZES[size])
+                    return item, offset
+                object.__setattr__(item, "_size", ItemCodec.SIZES[size])
+                options = 0
+            toppings = ItemCodec.__topping_options.get(code)
+            if toppings is None:
+                toppings = ItemCodec.__tabulate(code)
+            # Set through the item, so that its epoch moves on once.
+            setattr(item, "_options",
+                    options | toppings[flags & (len(toppings) - 1)])
+        except IndexError:
+            raise ValueError("unknown enum code")
+        return item, offset
+
+    @staticmethod
+    def __tabulate(code: int) -> Tuple[int, ...]:
+        """Tabulate method.
+
+        Sets every combination of the topping
+        flags of a wrap or drink on a new one and
+        keeps the toppings packed into its options.
+
+        Args:
+            code: The type code of a wrap
+            or drink.
+
+        Returns:
+            The packed toppings for each value
+            of the low flags of a record.
+        """
+        kind, names = ItemCodec.TYPES[code]
+        probe = kind()
+        table = list()
+        for flags in range(1 << len(names)):
+            for bit, name in enumerate(names):
+                setattr(probe, name, bool(flags & (1 << bit)))
+            options: int = getattr(probe, "_options")
+            if isinstance(probe, Wrap):
+                options &= -Wrap.TOPPING
+            table.append(options)
+        toppings = tuple(table)
+        ItemCodec.__topping_options[code] = toppings
+        return toppings
+
+    @staticmethod
+    def __check_version(data: bytes) -> None:
+        """Check version method.
+
+        Args:
+            data: Bytes made by encode
+            or encode_order.
+
+        Raises:
+            ValueError: If they were made by
+            another version.
+        """
+        if len(data) == 0 or data[0] != ItemCodec.VERSION:
+            raise ValueError("unsupported version")
+
+    @staticmethod
+    def __unpack(layout: struct.Struct, data: bytes,
+                 offset: int) -> Tuple:
+        """Unpack method.
+
+        Args:
+            layout: The struct to read.
+            data: The bytes to read from.
+            offset: Where to read.
+
+        Returns:
+            The values read.
+
+        Raises:
+            ValueError: If the data is too short.
+        """
+        try:
+            return layout.unpack_from(data, offset)
+        except struct.error as e:
+            raise ValueError(str(e))
+
+    @staticmethod
+    def __text(text: Optional[str]) -> bytes:
+        """Text method.
+
+        Args:
+            text: A name, or None.
+
+        Returns:
+            The name as UTF-8.
+        """
+        return b"" if text is None else text.encode("utf-8")
+
+    @staticmethod
+    def __read_text(data: bytes, offset: int, length: int) -> str:
+        """Read text method.
+
+        Args:
+            data: The bytes to read from.
+            offset: Where the text starts.
+            length: How many bytes it takes.
+
+        Returns:
+            The text.
+
+        Raises:
+            ValueError: If the data is too short.
+        """
+        if offset + length > len(data):
+            raise ValueError("text cut short")
+        return bytes(data[offset:offset + length]).decode("utf-8")
@@ -0,0 +1,103 @@
+"""Money class.
+
+Converts between dollar amounts and whole
+cents, and holds the rounding rules used for
+tax and discounts.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version: 0.1
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from fractions import Fraction
+from typing import Union
+
+
+class Money:
+    """Money class.
+
+    Prices are worked out in whole cents so that
+    sums of any number of them are exact.  Dollar
+    amounts are only made from cents at the edges,
+    for display and for the float properties kept
+    for backwards compatibility.
+    """
+    @staticmethod
+    def to_cents(amount: Union[float, int, str]) -> int:
+        """To cents method.
+
+        Rounds a dollar amount to the nearest
+        cent, with half a cent rounded away from
+        zero.  The amount is read as the shortest
+        decimal that gives the same float, so 16.55
+        is 1655 cents even though the float is
+        slightly less.
+
+        Args:
+            amount: A dollar amount.
+
+        Returns:
+            The amount in cents.
+        """
+        return int(Decimal(repr(float(amount))).scaleb(2).quantize(
+            Decimal(1), rounding=ROUND_HALF_UP))
+
+    @staticmethod
+    def to_dollars(cents: int) -> float:
+        """To dollars method.
+
+        Args:
+            cents: An amount in cents.
+
+        Returns:
+            The amount in dollars.
+        """
+        return cents / 100
+
+    @staticmethod
+    def tax_cents(subtotal_cents: int, rate: float) -> int:
+        """Tax method.
+
+        The tax is the subtotal times the rate,
+        rounded to the nearest cent with half a
+        cent rounded up.  The rate is read as the
+        decimal it is written as.
+
+        Args:
+            subtotal_cents: The subtotal in cents.
+            rate: The tax rate, between 0 and 1.
+
+        Returns:
+            The tax in cents.
+        """
+        exact = Fraction(str(rate)) * subtotal_cents
+        return int((exact + Fraction(1, 2)) // 1)
+
+    @staticmethod
+    def percent_cents(cents: int, percent: int) -> int:
+        """Percent method.
+
+        Args:
+            cents: An amount in cents.
+            percent: A whole percent of it.
+
+        Returns:
+            That percent of the amount, rounded
+            to the nearest cent with half a cent
+            rounded up.
+        """
+        return (cents * percent * 2 + 100) // 200
+
+    @staticmethod
+    def format(cents: int) -> str:
+        """Format method.
+
+        Args:
+            cents: An amount in cents.
+
+        Returns:
+            The amount as dollars, such
+            as $1,234.50.
+        """
+        sign = "-" if cents < 0 else ""
+        dollars, remainder = divmod(abs(cents), 100)
+        return "{}${:,}.{:02d}".format(sign, dollars, remainder)
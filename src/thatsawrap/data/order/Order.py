@@ -6,9 +6,15 @@ constituting an order.
 Author: Dustin hayes djhayes@ksu.edu
 Version: 0.1
 """
-from typing import Iterator, Iterable, List
+from typing import (Dict, Hashable, Iterator, Iterable, List, Optional,
+                    Tuple)
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.order.OrderLine import OrderLine
+from src.thatsawrap.data.order.Money import Money
+from src.thatsawrap.data.order.PromotionEngine import (AppliedPromotion,
+                                                       PromotionEngine)
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
 
 
 class Order(Iterable[Item]):
@@ -17,24 +23,66 @@ class Order(Iterable[Item]):
     This class represents the order
     and implements standard collection
     methods.
+
+    The subtotal, calories and the keys that
+    let identical items share a line are kept
+    as items are added and removed, rather than
+    read from every item each time.  An item
+    changed in place while it is in the order,
+    such as a new size or shell, has a new
+    epoch, so its line is brought up to date
+    the next time the totals or lines are read.
+    The lines are only looked over when an item
+    has been made or changed, or the menu
+    catalog has moved on, since they last were.
     """
     __tax_rate = 0.125
 
-    def __init__(self) -> None:
+    def __init__(self, order_number: Optional[int] = None) -> None:
         """Constructor for order class.
 
-        Contains the state of the order.
+        Contains the state of the order.  Lines
+        are kept in a dict keyed by their id, in
+        the order they were added, and the lines
+        holding each instance by the id of the
+        instance.  Lines added with add_items are
+        also kept by the key of their item, so that
+        identical items share a line.  The tick and
+        catalog version are those the lines were
+        last looked over at.  The revision goes up
+        whenever a line changes, so the promotions
+        worked out for the order are only worked
+        out again once a line, the promotions or
+        the running happy hours have changed.
+
+        Args:
+            order_number: The number of an order
+            being restored.  A new number is taken
+            when it is None.
         """
-        self.__order: List[Item] = list()
-        self.__order_number: int = (OrderNumberSingleton().
-                                    get_next_order_number())
+        self.__entries: Dict[int, OrderLine] = dict()
+        self.__placed: Dict[int, List[OrderLine]] = dict()
+        self.__keys: Dict[Hashable, OrderLine] = dict()
+        self.__line_keys: Dict[int, Hashable] = dict()
+        self.__items: Optional[List[Item]] = list()
+        self.__subtotal_cents: int = 0
+        self.__calories: int = 0
+        self.__revision: int = 0
+        self.__tick: int = 0
+        self.__version: int = CatalogVersion.get_version()
+        self.__applied: Optional[Tuple[Tuple[int, int, int],
+                                       Tuple[AppliedPromotion, ...]]] = None
+        if order_number is None:
+            order_number = OrderNumberSingleton().get_next_order_number()
+        self.__order_number: int = order_number
 
     @classmethod
     def set_tax_rate(cls, new_rate: float) -> None:
         """Set tax rate.
 
         Allows the tax rate to be set
-        in the interval (0,1).
+        in the interval (0,1) and invalidates
+        the menu catalog.
 
         Args:
             new_rate: A float between 0 and
@@ -44,6 +92,7 @@ class Order(Iterable[Item]):
             raise ValueError
         else:
             cls._Order__tax_rate = new_rate
+            CatalogVersion.bump()
 
     @classmethod
     def get_tax_rate(cls) -> float:
@@ -60,30 +109,305 @@ class Order(Iterable[Item]):
     def add_item(self, item: Item) -> None:
         """Adds item method.
 
-        Adds an item to the set.
+        Adds an item to the set, on a line
+        of its own.  An instance added twice
+        is on two lines.
 
         Args:
             item: The Item type object
             that will be added to the set.
         """
-        self.__order.append(item)
+        self.__add_line(OrderLine(item))
+
+    def add_items(self, item: Item, quantity: int = 1) -> OrderLine:
+        """Adds items method.
+
+        Adds a quantity of an item to the
+        order.  If the instance, or an item
+        with the same key added by this method,
+        is already in the order, its quantity
+        goes up instead of a new line being made.
+
+        Args:
+            item: The Item type object
+            that will be added.
+            quantity: How many to add.
+
+        Returns:
+            The OrderLine holding the items.
+
+        Raises:
+            ValueError: If the quantity is
+            less than one.
+        """
+        if quantity < 1:
+            raise ValueError
+        line = self.__first(item)
+        if line is None:
+            key = OrderLine.key_of(item)
+            line = self.__keyed(key)
+            if line is None:
+                line = OrderLine(item, quantity)
+                self.__add_line(line)
+                self.__keys[key] = line
+                self.__line_keys[id(line)] = key
+                return line
+        line.quantity += quantity
+        self.__revision += 1
+        self.__subtotal_cents += line.unit_price_cents * quantity
+        self.__calories += line.unit_calories * quantity
+        return line
 
     def remove_item(self, item: Item) -> None:
         """Remove item method.
 
-        Removes an item to the set.
+        Removes the first line holding an
+        item from the set.
+
+        Args:
+            item: The Item type object
+            that will be removed.
+
+        Raises:
+            ValueError: If that instance is
+            not in the order.
+        """
+        line = self.__first(item)
+        if line is None:
+            raise ValueError
+        self.__remove_line(line)
+
+    def remove_items(self, item: Item, quantity: int = 1) -> None:
+        """Remove items method.
+
+        Takes a quantity of an item off its
+        line, removing the line when none are
+        left.  The item may be the instance on
+        the line or any item with the same key
+        added by add_items.
 
         Args:
             item: The Item type object
             that will be removed.
+            quantity: How many to remove.
+
+        Raises:
+            ValueError: If the order does not
+            have that many of the item.
+        """
+        line = self.__first(item)
+        if line is None:
+            key = OrderLine.key_of(item)
+            line = self.__keyed(key)
+            if line is None:
+                # The line may be under the old key of a changed item.
+                self.__sync()
+                line = self.__keys.get(key)
+        if line is None or quantity < 1 or quantity > line.quantity:
+            raise ValueError
+        if quantity == line.quantity:
+            self.__remove_line(line)
+            return
+        line.quantity -= quantity
+        self.__revision += 1
+        self.__subtotal_cents -= line.unit_price_cents * quantity
+        self.__calories -= line.unit_calories * quantity
+
+    def update_item(self, item: Item) -> None:
+        """Update item method.
+
+        Brings the lines holding an item up
+        to date straight away.  Lines are also
+        brought up to date when read, so this
+        is only needed when the price of an item
+        changes without the item being set.
+
+        Args:
+            item: The Item type object
+            that was changed.
+
+        Raises:
+            ValueError: If that instance is
+            not in the order.
+        """
+        lines = self.__placed.get(id(item))
+        if lines is None:
+            raise ValueError
+        for line in lines:
+            self.__refresh(line)
+
+    def __first(self, item: Item) -> Optional[OrderLine]:
+        """First method.
+
+        Args:
+            item: An Item type object.
+
+        Returns:
+            The first line holding that
+            instance, or None if it is not in
+            the order.
+        """
+        lines = self.__placed.get(id(item))
+        return None if lines is None else lines[0]
+
+    def __keyed(self, key: Hashable) -> Optional[OrderLine]:
+        """Keyed method.
+
+        A line whose item has changed since it
+        was keyed is brought up to date first,
+        so that an item is never added to a line
+        it no longer matches.
+
+        Args:
+            key: The key of an item.
+
+        Returns:
+            The line added by add_items for
+            items with that key, or None.
+        """
+        line = self.__keys.get(key)
+        if line is not None and line.stale:
+            self.__refresh(line)
+            line = self.__keys.get(key)
+        return line
+
+    def __add_line(self, line: OrderLine) -> None:
+        """Add line method.
+
+        Args:
+            line: The OrderLine to add at the
+            end of the order.
+        """
+        self.__entries[id(line)] = line
+        self.__placed.setdefault(id(line.item), []).append(line)
+        self.__items = None
+        self.__revision += 1
+        self.__subtotal_cents += line.price_cents
+        self.__calories += line.calories
+
+    def __remove_line(self, line: OrderLine) -> None:
+        """Remove line method.
+
+        The totals go down by what the line
+        added to them, so a line that is out of
+        date does not need to be refreshed first.
+
+        Args:
+            line: The OrderLine to remove.
+        """
+        del self.__entries[id(line)]
+        lines = self.__placed[id(line.item)]
+        lines.remove(line)
+        if not lines:
+            del self.__placed[id(line.item)]
+        key = self.__line_keys.pop(id(line), None)
+        if key is not None:
+            del self.__keys[key]
+        self.__items = None
+        self.__revision += 1
+        self.__subtotal_cents -= line.price_cents
+        self.__calories -= line.calories
+
+    def __refresh(self, line: OrderLine) -> None:
+        """Refresh method.
+
+        Reads the price and calories of the
+        item on a line again, and keys the line
+        by the key the item has now.
+
+        Args:
+            line: The OrderLine to refresh.
         """
-        count = 0
-        for i in self.__order:
-            if i is item:
-                self.__order.remove(item)
-                count += 1
-        if count != 1:
+        price, calories = line.refresh()
+        self.__revision += 1
+        self.__subtotal_cents += price
+        self.__calories += calories
+        key = self.__line_keys.pop(id(line), None)
+        if key is not None:
+            del self.__keys[key]
+            key = OrderLine.key_of(line.item)
+            if key not in self.__keys:
+                self.__keys[key] = line
+                self.__line_keys[id(line)] = key
+
+    def __sync(self) -> None:
+        """Sync method.
+
+        Refreshes the lines whose item has
+        changed, or every line if the menu
+        catalog has moved on.  The lines are
+        not looked over when the clock of the
+        items has not moved since the last time.
+        """
+        tick = Item.tick()
+        version = CatalogVersion.get_version()
+        if tick != self.__tick + 1 or version != self.__version:
+            for line in list(self.__entries.values()):
+                if version != self.__version or line.stale:
+                    self.__refresh(line)
+        self.__tick = tick
+        self.__version = version
+
+    def line_of(self, item: Item) -> OrderLine:
+        """Line of item method.
+
+        Args:
+            item: An Item type object in
+            the order.
+
+        Returns:
+            The first OrderLine holding that
+            instance.
+
+        Raises:
+            ValueError: If that instance is
+            not in the order.
+        """
+        line = self.__first(item)
+        if line is None:
             raise ValueError
+        if CatalogVersion.get_version() != self.__version:
+            self.__sync()
+        elif line.stale:
+            self.__refresh(line)
+        return line
+
+    @property
+    def lines(self) -> List[OrderLine]:
+        """Lines getter.
+
+        Returns:
+            The lines of the order, in the
+            order they were added.
+        """
+        self.__sync()
+        return list(self.__entries.values())
+
+    @property
+    def quantity(self) -> int:
+        """Quantity getter.
+
+        Returns:
+            The number of items in the order,
+            counting every unit on every line.
+        """
+        return sum(line.quantity for line in self.__entries.values())
+
+    def __list(self) -> List[Item]:
+        """List method.
+
+        The list is rebuilt after the order
+        changes, the first time it is needed.
+
+        Returns:
+            The item of each line of the order,
+            in the order they were added.
+        """
+        items = self.__items
+        if items is None:
+            items = [line.item for line in self.__entries.values()]
+            self.__items = items
+        return items
 
     def __iter__(self) -> Iterator[Item]:
         """Iterator method.
@@ -93,7 +417,7 @@ class Order(Iterable[Item]):
         Returns:
             The iterator object.
         """
-        return iter(self.__order)
+        return iter(self.__list())
 
     def __len__(self) -> int:
         """Iterator method.
@@ -103,10 +427,10 @@ class Order(Iterable[Item]):
 
         Returns:
             An int representing the
-            number of Items in
+            number of lines in
             the order.
         """
-        return len(self.__order)
+        return len(self.__entries)
 
     def __getitem__(self, position: int) -> Item:
         """Iterator method.
@@ -122,7 +446,7 @@ class Order(Iterable[Item]):
             The Item stored at that
             position.
         """
-        return self.__order[position]
+        return self.__list()[position]
 
     def __contains__(self, item: Item) -> bool:
         """Iterator method.
@@ -140,11 +464,7 @@ class Order(Iterable[Item]):
             of an item is stored in the class,
             False otherwise.
         """
-        ret = False
-        for i in self.__order:
-            if item is i:
-                ret = True
-        return ret
+        return id(item) in self.__placed
 
     @property
     def tax_rate(self) -> float:
@@ -173,6 +493,86 @@ class Order(Iterable[Item]):
         else:
             raise ValueError
 
+    @property
+    def promotions(self) -> List[AppliedPromotion]:
+        """Promotions getter.
+
+        Returns:
+            An AppliedPromotion for each
+            promotion that takes something off
+            the order.
+        """
+        return list(self.__promotions())
+
+    @property
+    def discount_cents(self) -> int:
+        """Discount in cents getter.
+
+        Returns:
+            An int representing the cents
+            taken off the order by promotions.
+        """
+        return sum(applied.cents for applied in self.__promotions())
+
+    def __promotions(self) -> Tuple[AppliedPromotion, ...]:
+        """Promotions method.
+
+        Returns:
+            The promotions applied to the
+            order, worked out again only if the
+            order, the promotions or the running
+            happy hours have changed.
+        """
+        self.__sync()
+        stamp = (self.__revision, CatalogVersion.get_version(),
+                 PromotionEngine.mask())
+        applied = self.__applied
+        if applied is None or applied[0] != stamp:
+            applied = (stamp, tuple(PromotionEngine.apply(
+                self.__entries.values(), stamp[2])))
+            self.__applied = applied
+        return applied[1]
+
+    @property
+    def subtotal_cents(self) -> int:
+        """Subtotal in cents getter.
+
+        Used for getting the total
+        before tax.  The total of the lines
+        is kept up to date as items are added,
+        removed and changed, and promotions are
+        taken off it.
+
+        Returns:
+            An int representing
+            the subtotal in cents.
+        """
+        self.__sync()
+        return self.__subtotal_cents - self.discount_cents
+
+    @property
+    def tax_cents(self) -> int:
+        """Tax in cents getter.
+
+        The tax is rounded to the nearest
+        cent, with half a cent rounded up.
+
+        Returns:
+            An int representing the tax
+            on an order in cents.
+        """
+        return Money.tax_cents(self.subtotal_cents, self.__tax_rate)
+
+    @property
+    def total_cents(self) -> int:
+        """Total in cents getter.
+
+        Returns:
+            An int representing the total
+            price of an order in cents.
+        """
+        return self.subtotal_cents + self.tax_cents
+
     @property
     def subtotal(self) -> float:
         """Subtotal getter.
@@ -184,10 +584,7 @@ class Order(Iterable[Item]):
             A float representing
             the subtotal.
         """
-        sub_t = 0
-        for i in self.__order:
-            sub_t = sub_t + i.price
-        return sub_t
+        return Money.to_dollars(self.subtotal_cents)
 
     @property
     def tax(self) -> float:
@@ -200,7 +597,7 @@ class Order(Iterable[Item]):
             A float representing the tax
             on an order.
         """
-        return self.__tax_rate * self.subtotal
+        return Money.to_dollars(self.tax_cents)
 
     @property
     def total(self) -> float:
@@ -213,7 +610,7 @@ class Order(Iterable[Item]):
             A float representing the total
             price of an order.
         """
-        return self.tax + self.subtotal
+        return Money.to_dollars(self.total_cents)
 
     @property
     def calories(self) -> float:
@@ -226,10 +623,8 @@ class Order(Iterable[Item]):
             A float representing the total
             calories in an order.
         """
-        cal = 0
-        for i in self.__order:
-            cal = cal + i.calories
-        return cal
+        self.__sync()
+        return self.__calories
 
     @property
     def order_number(self) -> int:
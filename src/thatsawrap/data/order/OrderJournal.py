@@ -0,0 +1,446 @@
+"""Order Journal.
+
+Records finished orders in an append-only file,
+writing and syncing many orders at a time, and
+reads them back when the application starts.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version: 0.1
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import List, NamedTuple, Optional, Tuple
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ItemCodec import ItemCodec
+from src.thatsawrap.data.order.Order import Order
+
+
+class JournalLine(NamedTuple):
+    """Journal Line class.
+
+    One line of a journaled order.
+    """
+    kind: str
+    description: str
+    quantity: int
+    unit_price_cents: int
+    unit_calories: int
+
+    @classmethod
+    def of(cls, item: Item, quantity: int, unit_price_cents: int,
+           unit_calories: int) -> "JournalLine":
+        """Line of an item method.
+
+        Args:
+            item: The item ordered.
+            quantity: How many were ordered.
+            unit_price_cents: The price of one.
+            unit_calories: The calories of one.
+
+        Returns:
+            The JournalLine describing them.
+        """
+        description = item.name if isinstance(item, Combo) else str(item)
+        return cls(type(item).__name__, description, quantity,
+                   unit_price_cents, unit_calories)
+
+
+class JournalEntry(NamedTuple):
+    """Journal Entry class.
+
+    One finished order, as it was when it
+    was journaled.
+    """
+    number: int
+    lines: List[JournalLine]
+    subtotal_cents: int
+    tax_cents: int
+    total_cents: int
+    calories: int
+
+    @classmethod
+    def of(cls, order: Order) -> "JournalEntry":
+        """Entry of an order method.
+
+        Args:
+            order: The finished order.
+
+        Returns:
+            The JournalEntry describing it.
+        """
+        lines = [JournalLine.of(line.item, line.quantity,
+                                line.unit_price_cents, line.unit_calories)
+                 for line in order.lines]
+        return cls(order.order_number, lines, order.subtotal_cents,
+                   order.tax_cents, order.total_cents, int(order.calories))
+
+
+class JournalTicket:
+    """Journal Ticket class.
+
+    Handed out for each appended order, so that
+    the caller can wait until it is on disk.
+    """
+    def __init__(self) -> None:
+        """Constructor for a journal ticket."""
+        self.__done = threading.Event()
+        self.__error: Optional[BaseException] = None
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        """Finish method.
+
+        Called by the journal once the record
+        is synced, or failed to be.
+
+        Args:
+            error: The error that stopped the
+            record being written, if any.
+        """
+        self.__error = error
+        self.__done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait method.
+
+        Args:
+            timeout: The most seconds to wait,
+            or None to wait until done.
+
+        Returns:
+            True if the record is on disk, False
+            if the timeout ran out first.
+
+        Raises:
+            OSError: If the record could not
+            be written.
+        """
+        if not self.__done.wait(timeout):
+            return False
+        if self.__error is not None:
+            raise self.__error
+        return True
+
+
+class OrderJournal:
+    """Order Journal class.
+
+    Each record is a 4 byte length and a 4 byte
+    CRC32 followed by that many bytes of payload.
+    The payload holds the order number, totals
+    and lines, with each item written by
+    ItemCodec.  Appending only queues the record;
+    a writer thread writes every queued record and
+    syncs the file once, waiting up to max_delay
+    seconds after the first record for others to
+    join it.
+    A record cut short by a crash, or one whose CRC
+    does not match, ends the journal and is
+    dropped on the next open.  A record that is
+    whole but cannot be decoded, such as one
+    written by another version, is not torn, so
+    the journal refuses to open rather than drop
+    it and every order after it.  If a batch fails to
+    be written or synced, the file is cut back to
+    the end of the last synced batch, so that
+    later orders are not written after part of a
+    record; if even that fails, the journal is
+    failed and takes no more orders.
+    """
+    HEADER = struct.Struct(">II")
+    ENTRY = struct.Struct(">BQqqqqI")
+    LINE = struct.Struct(">Iqi")
+
+    def __init__(self, path: str, max_delay: float = 0.01,
+                 max_batch: int = 256) -> None:
+        """Constructor for the order journal.
+
+        Replays the journal at the path, if
+        there is one, and opens it for appending.
+
+        Args:
+            path: The file to journal to.
+            max_delay: The most seconds a record
+            waits for others before being synced.
+            max_batch: The most records written
+            with one sync.
+
+        Raises:
+            ValueError: If max_delay or max_batch
+            is out of range, or a whole record in
+            the journal cannot be decoded.  The
+            file is left as it is.
+        """
+        if max_delay < 0 or max_batch < 1:
+            raise ValueError
+        self.__path: str = path
+        self.__max_delay: float = max_delay
+        self.__max_batch: int = max_batch
+        entries, good = OrderJournal.__read(path)
+        self.__entries: List[JournalEntry] = entries
+        self.__file = open(path, "ab", buffering=0)
+        if self.__file.tell() != good:
+            self.__file.truncate(good)
+            self.__file.seek(good)
+        self.__good: int = good
+        self.__failed: Optional[OSError] = None
+        self.__queue: List[Tuple[bytes, JournalTicket, JournalEntry]] = list()
+        self.__condition = threading.Condition()
+        self.__closed: bool = False
+        self.__busy: bool = False
+        self.__syncs: int = 0
+        self.__writer = threading.Thread(target=self.__run, daemon=True,
+                                         name="OrderJournal")
+        self.__writer.start()
+
+    @property
+    def path(self) -> str:
+        """Getter for path.
+
+        Returns:
+            The file being journaled to.
+        """
+        return self.__path
+
+    @property
+    def entries(self) -> List[JournalEntry]:
+        """Getter for entries.
+
+        Returns:
+            Every order replayed or synced
+            since the journal was opened.
+        """
+        with self.__condition:
+            return list(self.__entries)
+
+    @property
+    def syncs(self) -> int:
+        """Getter for syncs.
+
+        Returns:
+            The number of times the file has
+            been synced since it was opened.
+        """
+        return self.__syncs
+
+    def append(self, order: Order) -> JournalTicket:
+        """Append method.
+
+        Queues a finished order to be written.
+
+        Args:
+            order: The finished order.
+
+        Returns:
+            A JournalTicket to wait on.
+
+        Raises:
+            ValueError: If the journal is closed.
+            OSError: If the journal has failed.
+        """
+        entry = JournalEntry.of(order)
+        payload = OrderJournal.__encode(order)
+        record = OrderJournal.HEADER.pack(
+            len(payload), zlib.crc32(payload)) + payload
+        ticket = JournalTicket()
+        with self.__condition:
+            if self.__closed:
+                raise ValueError
+            if self.__failed is not None:
+                raise self.__failed
+            self.__queue.append((record, ticket, entry))
+            self.__condition.notify_all()
+        return ticket
+
+    def flush(self) -> None:
+        """Flush method.
+
+        Waits until every queued order
+        is on disk.
+        """
+        with self.__condition:
+            while len(self.__queue) != 0 or self.__busy:
+                self.__condition.wait()
+
+    def close(self) -> None:
+        """Close method.
+
+        Writes every queued order and
+        closes the file.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__writer.join()
+        self.__file.close()
+
+    def __run(self) -> None:
+        """Writer thread method.
+
+        Takes the queued records in batches,
+        writing and syncing each batch once.
+        The file is unbuffered, so nothing from a
+        failed batch is left to be written later.
+        """
+        while True:
+            with self.__condition:
+                while len(self.__queue) == 0 and not self.__closed:
+                    self.__condition.wait()
+                if len(self.__queue) == 0:
+                    return
+                deadline = time.monotonic() + self.__max_delay
+                while (len(self.__queue) < self.__max_batch and
+                       not self.__closed):
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self.__condition.wait(left)
+                batch = self.__queue[:self.__max_batch]
+                del self.__queue[:self.__max_batch]
+                self.__busy = True
+            error: Optional[OSError] = self.__failed
+            if error is None:
+                data = memoryview(b"".join(record for record, _, _ in batch))
+                try:
+                    written = 0
+                    while written < len(data):
+                        written += self.__file.write(data[written:])
+                    os.fsync(self.__file.fileno())
+                    self.__good += len(data)
+                except OSError as e:
+                    error = e
+                    self.__rewind()
+            with self.__condition:
+                self.__syncs += 1
+                if error is None:
+                    self.__entries.extend(entry for _, _, entry in batch)
+                self.__busy = False
+                self.__condition.notify_all()
+            for _, ticket, _ in batch:
+                ticket._finish(error)
+
+    def __rewind(self) -> None:
+        """Rewind method.
+
+        Cuts the file back to the end of the
+        last synced batch, or fails the journal
+        if it cannot be.
+        """
+        try:
+            os.ftruncate(self.__file.fileno(), self.__good)
+            self.__file.seek(self.__good)
+        except OSError as e:
+            with self.__condition:
+                self.__failed = e
+
+    @staticmethod
+    def replay(path: str) -> List[JournalEntry]:
+        """Replay method.
+
+        Args:
+            path: The journal file.
+
+        Returns:
+            Every complete order in the journal,
+            in the order they were written.
+
+        Raises:
+            ValueError: If a whole record cannot
+            be decoded.
+        """
+        return OrderJournal.__read(path)[0]
+
+    @staticmethod
+    def __read(path: str) -> Tuple[List[JournalEntry], int]:
+        """Read method.
+
+        Args:
+            path: The journal file.
+
+        Returns:
+            A tuple of the complete orders in the
+            journal and the number of bytes they
+            take up.
+
+        Raises:
+            ValueError: If a whole record cannot
+            be decoded.
+        """
+        entries: List[JournalEntry] = list()
+        if not os.path.exists(path):
+            return entries, 0
+        with open(path, "rb") as journal:
+            data = journal.read()
+        offset = 0
+        header = OrderJournal.HEADER
+        while offset + header.size <= len(data):
+            length, crc = header.unpack_from(data, offset)
+            start = offset + header.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            entries.append(OrderJournal.__decode(payload))
+            offset = start + length
+        return entries, offset
+
+    @staticmethod
+    def __encode(order: Order) -> bytes:
+        """Encode method.
+
+        Args:
+            order: The finished order.
+
+        Returns:
+            The payload of its record.
+        """
+        lines = order.lines
+        buffer = bytearray(OrderJournal.ENTRY.pack(
+            ItemCodec.VERSION, order.order_number, order.subtotal_cents,
+            order.tax_cents, order.total_cents, order.calories, len(lines)))
+        for line in lines:
+            buffer += OrderJournal.LINE.pack(
+                line.quantity, line.unit_price_cents, line.unit_calories)
+            ItemCodec.write_item(buffer, line.item)
+        return bytes(buffer)
+
+    @staticmethod
+    def __decode(payload: bytes) -> JournalEntry:
+        """Decode method.
+
+        Args:
+            payload: The payload of a record.
+
+        Returns:
+            The JournalEntry it records.
+
+        Raises:
+            ValueError: If the payload is cut
+            short or of another version.
+        """
+        try:
+            (version, number, subtotal, tax, total, calories,
+             count) = OrderJournal.ENTRY.unpack_from(payload)
+        except struct.error as e:
+            raise ValueError(str(e))
+        if version != ItemCodec.VERSION:
+            raise ValueError("unsupported version")
+        offset = OrderJournal.ENTRY.size
+        lines: List[JournalLine] = list()
+        for _ in range(count):
+            try:
+                quantity, cents, unit_calories = \
+                    OrderJournal.LINE.unpack_from(payload, offset)
+            except struct.error as e:
+                raise ValueError(str(e))
+            item, offset = ItemCodec.read_item(
+                payload, offset + OrderJournal.LINE.size)
+            lines.append(JournalLine.of(item, quantity, cents,
+                                        unit_calories))
+        if offset != len(payload):
+            raise ValueError("trailing bytes")
+        return JournalEntry(number, lines, subtotal, tax, total, calories)
@@ -0,0 +1,195 @@
+"""OrderLine class.
+
+Represents one line of an order: an item
+and how many of it were ordered.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version: 0.1
+"""
+from typing import Hashable, Tuple
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Money import Money
+
+
+class OrderLine:
+    """OrderLine class.
+
+    This class represents a quantity of
+    identical items.  The price and calories
+    of one item are read when the line is
+    made and again by refresh, so that the
+    line can report how much it changed.  The
+    epoch of the item is kept with them, so the
+    line knows when they are out of date.
+    """
+    def __init__(self, item: Item, quantity: int = 1) -> None:
+        """Constructor for order line class.
+
+        Args:
+            item: The item ordered.
+            quantity: How many of the item
+            were ordered.
+
+        Raises:
+            ValueError: If the quantity is
+            less than one.
+        """
+        if quantity < 1:
+            raise ValueError
+        self.__item: Item = item
+        self.__quantity: int = quantity
+        self.__unit_price_cents: int = Money.to_cents(item.price)
+        self.__unit_calories: int = item.calories
+        self.__epoch: int = OrderLine.__epoch_of(item)
+
+    @property
+    def item(self) -> Item:
+        """Getter for item.
+
+        Returns:
+            The item ordered.
+        """
+        return self.__item
+
+    @property
+    def quantity(self) -> int:
+        """Getter for quantity.
+
+        Returns:
+            How many of the item were ordered.
+        """
+        return self.__quantity
+
+    @quantity.setter
+    def quantity(self, quantity: int) -> None:
+        """Setter for quantity.
+
+        Args:
+            quantity: How many of the item
+            were ordered.
+
+        Raises:
+            ValueError: If the quantity is
+            less than one.
+        """
+        if quantity < 1:
+            raise ValueError
+        self.__quantity = quantity
+
+    @property
+    def unit_price_cents(self) -> int:
+        """Getter for unit price in cents.
+
+        Returns:
+            The price of one item, rounded
+            to the nearest cent.
+        """
+        return self.__unit_price_cents
+
+    @property
+    def unit_price(self) -> float:
+        """Getter for unit price.
+
+        Returns:
+            The price of one item.
+        """
+        return Money.to_dollars(self.__unit_price_cents)
+
+    @property
+    def unit_calories(self) -> int:
+        """Getter for unit calories.
+
+        Returns:
+            The calories of one item.
+        """
+        return self.__unit_calories
+
+    @property
+    def price_cents(self) -> int:
+        """Getter for price in cents.
+
+        Returns:
+            The price of one item in cents
+            times the quantity.
+        """
+        return self.__unit_price_cents * self.__quantity
+
+    @property
+    def price(self) -> float:
+        """Getter for price.
+
+        Returns:
+            The price of one item times
+            the quantity.
+        """
+        return Money.to_dollars(self.price_cents)
+
+    @property
+    def calories(self) -> int:
+        """Getter for calories.
+
+        Returns:
+            The calories of one item times
+            the quantity.
+        """
+        return self.__unit_calories * self.__quantity
+
+    @property
+    def stale(self) -> bool:
+        """Getter for stale.
+
+        Returns:
+            True if the item has changed since
+            its price and calories were read,
+            False otherwise.
+        """
+        return OrderLine.__epoch_of(self.__item) != self.__epoch
+
+    def refresh(self) -> Tuple[int, int]:
+        """Refresh method.
+
+        Reads the price and calories of the
+        item again, after it was changed in
+        place.
+
+        Returns:
+            A tuple of how much the price in cents
+            and calories of the line changed by.
+        """
+        price = Money.to_cents(self.__item.price)
+        calories = self.__item.calories
+        change = ((price - self.__unit_price_cents) * self.__quantity,
+                  (calories - self.__unit_calories) * self.__quantity)
+        self.__unit_price_cents = price
+        self.__unit_calories = calories
+        self.__epoch = OrderLine.__epoch_of(self.__item)
+        return change
+
+    @staticmethod
+    def __epoch_of(item: Item) -> int:
+        """Epoch of item method.
+
+        Args:
+            item: The item to look at.
+
+        Returns:
+            The epoch of the item, or 0 for
+            objects without one.
+        """
+        return getattr(item, "epoch", 0)
+
+    @staticmethod
+    def key_of(item: Item) -> Hashable:
+        """Key of item method.
+
+        Items share a line when they have the
+        same Item.key.
+
+        Args:
+            item: The item to describe.
+
+        Returns:
+            A hashable key for the configuration
+            of the item.
+        """
+        return item.key
@@ -0,0 +1,171 @@
+"""Order Number Allocator.
+
+Hands out order numbers from blocks leased
+from a high-water mark kept in a shared file,
+so that several processes never give out the
+same number.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version: 0.1
+"""
+import os
+import threading
+from typing import Iterator
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+class OrderNumberAllocator:
+    """Order Number Allocator class.
+
+    The file holds the highest number leased by
+    any process, as a fixed width decimal that is
+    overwritten in place.  Leasing a block locks
+    the file, moves the mark forward by the block
+    size and syncs it before any number in the
+    block is handed out, so a number is never
+    given out twice, even after a crash.  Numbers
+    left in a block when a process stops are
+    skipped.  Numbers within a block are handed
+    out without taking a lock.
+    """
+    WIDTH: int = 20
+
+    def __init__(self, path: str, block_size: int = 100) -> None:
+        """Constructor for the order number allocator.
+
+        Args:
+            path: The file holding the mark,
+            shared by every process.
+            block_size: How many numbers to
+            lease at a time.
+
+        Raises:
+            ValueError: If the block size is
+            less than one.
+        """
+        if block_size < 1:
+            raise ValueError
+        self.__path: str = path
+        self.__block_size: int = block_size
+        self.__block: Iterator[int] = iter(())
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        """Getter for path.
+
+        Returns:
+            The file holding the mark.
+        """
+        return self.__path
+
+    @property
+    def block_size(self) -> int:
+        """Getter for block size.
+
+        Returns:
+            How many numbers are leased
+            at a time.
+        """
+        return self.__block_size
+
+    def next_number(self) -> int:
+        """Next number method.
+
+        Returns:
+            The next number of the leased block,
+            leasing a new block when it runs out.
+        """
+        number = next(self.__block, None)
+        while number is None:
+            with self.__lock:
+                number = next(self.__block, None)
+                if number is None:
+                    start = self.__lease(self.__block_size)
+                    self.__block = iter(range(start + 1,
+                                              start + self.__block_size + 1))
+                    number = next(self.__block)
+        return number
+
+    def advance_past(self, number: int) -> None:
+        """Advance past method.
+
+        Moves the mark to a number in use, such
+        as one read back from the order journal,
+        if it is not already past it.  If the mark
+        moves, the rest of the current block is
+        given up, so the next number comes from a
+        new lease.
+
+        Args:
+            number: An order number in use.
+        """
+        with self.__lock:
+            if self.__lease(0, number) == number:
+                self.__block = iter(())
+
+    def mark(self) -> int:
+        """Mark method.
+
+        Returns:
+            The highest number leased by
+            any process.
+        """
+        with self.__lock:
+            return self.__lease(0)
+
+    def __lease(self, count: int, at_least: int = 0) -> int:
+        """Lease method.
+
+        Locks the file, reads the mark and moves
+        it forward by count, or to at_least if
+        that is further.
+
+        Args:
+            count: How many numbers to lease.
+            at_least: The least the mark may
+            be before leasing.
+
+        Returns:
+            The mark before the numbers were
+            leased.
+        """
+        fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            OrderNumberAllocator.__lock_file(fd, True)
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                text = os.read(fd, OrderNumberAllocator.WIDTH)
+                stored = int(text) if text.strip() else 0
+                mark = max(stored, at_least)
+                if mark + count != stored:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.write(fd, "{:0{}d}\n".format(
+                        mark + count, OrderNumberAllocator.WIDTH - 1
+                    ).encode("ascii"))
+                    os.fsync(fd)
+                return mark
+            finally:
+                OrderNumberAllocator.__lock_file(fd, False)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def __lock_file(fd: int, lock: bool) -> None:
+        """Lock file method.
+
+        Args:
+            fd: The open mark file.
+            lock: True to wait for and take the
+            lock, False to release it.
+        """
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX if lock else fcntl.LOCK_UN)
+        else:  # pragma: no cover
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK if lock else msvcrt.LK_UNLCK,
+                           OrderNumberAllocator.WIDTH)
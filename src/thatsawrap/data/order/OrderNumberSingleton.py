@@ -8,6 +8,8 @@ Version: 0.1
 """
 import threading
 from typing import Optional
+from src.thatsawrap.data.order.OrderNumberAllocator import \
+    OrderNumberAllocator
 
 
 class OrderNumberSingleton:
@@ -18,6 +20,7 @@ class OrderNumberSingleton:
     """
     next_order_number: int = 0
     _instance: Optional["OrderNumberSingleton"] = None
+    _allocator: Optional[OrderNumberAllocator] = None
     lock = threading.Lock()
 
     def __new__(cls) -> "OrderNumberSingleton":
@@ -37,17 +40,56 @@ class OrderNumberSingleton:
             cls._instance = super().__new__(cls)
         return cls._instance
 
+    @classmethod
+    def use_allocator(cls,
+                      allocator: Optional[OrderNumberAllocator]) -> None:
+        """Use allocator function.
+
+        Hands out order numbers from an
+        allocator shared between processes
+        instead of the counter kept by this
+        process.
+
+        Args:
+            allocator: The allocator to use, or
+            None to go back to the counter.
+        """
+        cls._allocator = allocator
+
     def get_next_order_number(self) -> int:
         """Next order number function.
 
         Iterates the class variable indicating
         order number and returns it.  Locks
-        thread.
+        thread.  If an allocator is in use the
+        number comes from it instead.
 
         Returns:
             An int indicating order number.
         """
+        allocator = OrderNumberSingleton._allocator
+        if allocator is not None:
+            return allocator.next_number()
         with OrderNumberSingleton.lock:
             single_in = self._instance
             single_in.next_order_number += 1
             return single_in.next_order_number
+
+    def advance_past(self, number: int) -> None:
+        """Advance past function.
+
+        Makes sure the next order number is
+        greater than one already given out, such
+        as one read back from the order journal.
+        Locks thread.
+
+        Args:
+            number: An order number in use.
+        """
+        allocator = OrderNumberSingleton._allocator
+        if allocator is not None:
+            allocator.advance_past(number)
+            return
+        with OrderNumberSingleton.lock:
+            if self.next_order_number < number:
+                self.next_order_number = number
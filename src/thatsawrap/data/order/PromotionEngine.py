@@ -0,0 +1,348 @@
+"""PromotionEngine class.
+
+Holds the promotions on offer, such as happy
+hours, buy one get one and percent off, and
+works out what they take off an order.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import datetime
+from typing import (Callable, Dict, Iterable, List, NamedTuple, Optional,
+                    Tuple)
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.Money import Money
+from src.thatsawrap.data.order.OrderLine import OrderLine
+
+
+class Promotion(NamedTuple):
+    """Promotion class.
+
+    A rule taking a percent off items of some
+    classes, or off all items when no classes are
+    given.  With buy set, only one unit in every
+    buy plus one is taken off, the cheapest of
+    each group.  With start and end set, it only
+    runs between those times of day, across
+    midnight if start is after end.
+    """
+    name: str
+    kinds: Tuple[type, ...] = ()
+    percent: int = 100
+    buy: int = 0
+    start: Optional[datetime.time] = None
+    end: Optional[datetime.time] = None
+
+    @classmethod
+    def percent_off(cls, name: str, percent: int,
+                    *kinds: type) -> "Promotion":
+        """Percent off method.
+
+        Args:
+            name: The name of the promotion.
+            percent: The percent taken off.
+            kinds: The classes of items it
+            applies to.
+
+        Returns:
+            A promotion taking the percent off
+            every unit, at any time.
+        """
+        return cls(name, kinds, percent)
+
+    @classmethod
+    def happy_hour(cls, name: str, percent: int, start: datetime.time,
+                   end: datetime.time, *kinds: type) -> "Promotion":
+        """Happy hour method.
+
+        Args:
+            name: The name of the promotion.
+            percent: The percent taken off.
+            start: The time of day it starts.
+            end: The time of day it ends.
+            kinds: The classes of items it
+            applies to.
+
+        Returns:
+            A promotion taking the percent off
+            every unit between start and end.
+        """
+        return cls(name, kinds, percent, 0, start, end)
+
+    @classmethod
+    def bogo(cls, name: str, *kinds: type, buy: int = 1,
+             percent: int = 100) -> "Promotion":
+        """Buy one get one method.
+
+        Args:
+            name: The name of the promotion.
+            kinds: The classes of items it
+            applies to.
+            buy: How many units must be bought
+            for the next to be taken off.
+            percent: The percent taken off that
+            unit, all of it by default.
+
+        Returns:
+            A promotion taking the percent off
+            the cheapest unit of each group.
+        """
+        return cls(name, kinds, percent, buy)
+
+    def runs_at(self, now: datetime.time) -> bool:
+        """Runs at method.
+
+        Args:
+            now: A time of day.
+
+        Returns:
+            True if the promotion runs at
+            that time, False otherwise.
+        """
+        if self.start is None or self.end is None:
+            return True
+        if self.start <= self.end:
+            return self.start <= now < self.end
+        return now >= self.start or now < self.end
+
+
+class AppliedPromotion(NamedTuple):
+    """Applied Promotion class.
+
+    The name of a promotion and how many cents
+    it took off an order.
+    """
+    name: str
+    cents: int
+
+
+class PromotionEngine:
+    """PromotionEngine class.
+
+    Promotions are kept in the order given, and
+    the first one running that applies to an item
+    is the only one it gets.  Setting them compiles
+    them into a bit mask of the promotions that
+    always run and a list of those that only run
+    at some times, and the promotions for each
+    class of item are looked up once, the first
+    time the class is seen, and kept in a table.
+    An order is then priced in one pass over its
+    lines, with one table lookup and a check of
+    the mask for each, however many promotions
+    there are.  Units of buy one get one
+    promotions are pooled across lines and sorted
+    by price once the pass is done.
+
+    The combo discount is not one of these
+    promotions, but is already taken off the
+    price of each full combo.
+    """
+    __promotions: Tuple[Promotion, ...] = ()
+    __always: int = 0
+    __timed: Tuple[Tuple[int, Promotion], ...] = ()
+    __table: Dict[type, Tuple[int, ...]] = dict()
+    __clock: Optional[Callable[[], datetime.time]] = None
+
+    @classmethod
+    def get_promotions(cls) -> List[Promotion]:
+        """Static getter for promotions.
+
+        Returns:
+            The promotions on offer, first
+            match first.
+        """
+        return list(cls.__promotions)
+
+    @classmethod
+    def set_promotions(cls, promotions: Iterable[Promotion]) -> None:
+        """Static setter for promotions.
+
+        Compiles the promotions and invalidates
+        the menu catalog.
+
+        Args:
+            promotions: The promotions on offer,
+            first match first.
+
+        Raises:
+            ValueError: If a promotion has a
+            percent outside 1 to 100, a buy less
+            than zero, or only one of start and
+            end.
+        """
+        promotions = tuple(promotions)
+        for promotion in promotions:
+            if (not 0 < promotion.percent <= 100 or promotion.buy < 0 or
+                    (promotion.start is None) != (promotion.end is None)):
+                raise ValueError
+        always = 0
+        timed = list()
+        for index, promotion in enumerate(promotions):
+            if promotion.start is None:
+                always |= 1 << index
+            else:
+                timed.append((index, promotion))
+        cls.__promotions = promotions
+        cls.__always = always
+        cls.__timed = tuple(timed)
+        cls.__table = dict()
+        CatalogVersion.bump()
+
+    @classmethod
+    def set_clock(cls, clock: Optional[Callable[[], datetime.time]]) -> None:
+        """Static setter for clock.
+
+        Args:
+            clock: A function giving the time of
+            day, or None for the local time.
+        """
+        cls.__clock = clock
+
+    @classmethod
+    def mask(cls, now: Optional[datetime.time] = None) -> int:
+        """Mask method.
+
+        Args:
+            now: The time of day, or None for
+            the time from the clock.
+
+        Returns:
+            An int with bit n set if promotion
+            n is running.  It only changes when
+            the promotions change or a happy hour
+            starts or ends.
+        """
+        mask = cls.__always
+        timed = cls.__timed
+        if timed:
+            if now is None:
+                clock = cls.__clock
+                now = (clock() if clock is not None
+                       else datetime.datetime.now().time())
+            for index, promotion in timed:
+                if promotion.runs_at(now):
+                    mask |= 1 << index
+        return mask
+
+    @classmethod
+    def promotion_of(cls, item: Item,
+                     mask: Optional[int] = None) -> Optional[Promotion]:
+        """Promotion of item method.
+
+        Args:
+            item: An item.
+            mask: The running promotions, or None
+            to work them out.
+
+        Returns:
+            The promotion the item gets, or
+            None if it gets none.
+        """
+        promotions = cls.__promotions
+        if not promotions:
+            return None
+        if mask is None:
+            mask = cls.mask()
+        index = cls.index_of(type(item), mask)
+        return promotions[index] if index >= 0 else None
+
+    @classmethod
+    def index_of(cls, kind: type, mask: int) -> int:
+        """Index of class method.
+
+        Args:
+            kind: The class of an item.
+            mask: The running promotions.
+
+        Returns:
+            The index of the promotion items of
+            the class get, or -1 if they get none.
+        """
+        rules = cls.__table.get(kind)
+        if rules is None:
+            rules = cls.__rules(kind)
+        for index in rules:
+            if mask >> index & 1:
+                return index
+        return -1
+
+    @classmethod
+    def apply(cls, lines: Iterable[OrderLine],
+              mask: Optional[int] = None) -> List[AppliedPromotion]:
+        """Apply method.
+
+        Args:
+            lines: The lines of an order.
+            mask: The running promotions, or None
+            to work them out.
+
+        Returns:
+            An AppliedPromotion for each promotion
+            that took something off, in the order
+            the promotions were given.
+        """
+        promotions = cls.__promotions
+        if not promotions:
+            return list()
+        if mask is None:
+            mask = cls.mask()
+        if not mask:
+            return list()
+        table = cls.__table
+        cents: Dict[int, int] = dict()
+        pools: Dict[int, List[Tuple[int, int]]] = dict()
+        for line in lines:
+            kind = type(line.item)
+            rules = table.get(kind)
+            if rules is None:
+                rules = cls.__rules(kind)
+            for index in rules:
+                if mask >> index & 1:
+                    promotion = promotions[index]
+                    if promotion.buy:
+                        pools.setdefault(index, list()).append(
+                            (line.unit_price_cents, line.quantity))
+                    else:
+                        off = Money.percent_cents(line.unit_price_cents,
+                                                  promotion.percent)
+                        cents[index] = (cents.get(index, 0) +
+                                        off * line.quantity)
+                    break
+        for index, pool in pools.items():
+            promotion = promotions[index]
+            group = promotion.buy + 1
+            pool.sort(reverse=True)
+            seen = 0
+            off = 0
+            for price, quantity in pool:
+                # Every group-th unit, counting from the dearest, is off.
+                count = (seen + quantity) // group - seen // group
+                off += Money.percent_cents(price, promotion.percent) * count
+                seen += quantity
+            cents[index] = off
+        return [AppliedPromotion(promotions[index].name, cents[index])
+                for index in sorted(cents) if cents[index]]
+
+    @classmethod
+    def __rules(cls, kind: type) -> Tuple[int, ...]:
+        """Rules method.
+
+        Args:
+            kind: The class of an item.
+
+        Returns:
+            The indexes of the promotions that
+            apply to the class, first match first.
+        """
+        table = cls.__table
+        rules = table.get(kind)
+        if rules is None:
+            mro = kind.__mro__
+            rules = tuple(
+                index for index, promotion in enumerate(cls.__promotions)
+                if (any(k in mro for k in promotion.kinds)
+                    if promotion.kinds else Item in mro))
+            table[kind] = rules
+        return rules
@@ -19,7 +19,12 @@ class Side:
     This class contains the methods that all side objects
     have in common.  It will behave as a superclass that
     all side classes will inherit from.
+
+    Sides keep no __dict__, only slots for the
+    size, and the epoch and key kept by Item.
     """
+    __slots__ = ("_size", "_Item__epoch", "_Item__key")
+
     @property
     def size(self) -> Size:
         """Getter for size.
@@ -49,18 +54,28 @@ class Side:
 
     @property
     @abc.abstractmethod
-    def price(self) -> float:
-        """Abstract getter for price.
+    def price_cents(self) -> int:
+        """Abstract getter for price in cents.
 
         Verifies that each subclass has
         price getting functionality. This method
         should not be called directly.
 
         Returns:
-            Price when overwritten by subclass.
+            Price in cents when overwritten by subclass.
         """
         raise NotImplementedError
 
+    @property
+    def price(self) -> float:
+        """Getter for price.
+
+        Returns:
+            The price in dollars, from
+            price_cents.
+        """
+        return self.price_cents / 100
+
     @property
     @abc.abstractmethod
     def calories(self) -> int:
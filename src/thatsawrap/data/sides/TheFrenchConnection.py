@@ -18,26 +18,29 @@ class TheFrenchConnection(Side, Item):
     the state of the side, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+
     def __init__(self) -> None:
         """The constructor for The French Connection side."""
         self._size: Size = Size.INDIE
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the side.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the side.
 
         The side could have 3 different prices depending
         on its size.
 
         Returns:
-            A float value indicating the price of the side.
+            An int value indicating the price of the side
+            in cents.
         """
         if self._size == Size.INDIE:
-            return 2.75
+            return 275
         elif self._size == Size.STUDIO:
-            return 4.85
+            return 485
         else:
-            return 5.25
+            return 525
 
     @property
     def calories(self) -> int:
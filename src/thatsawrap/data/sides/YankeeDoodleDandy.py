@@ -18,26 +18,29 @@ class YankeeDoodleDandy(Side, Item):
     the state of the side, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+
     def __init__(self) -> None:
         """The constructor for the Yankee Doodle Dandy side."""
         self._size: Size = Size.INDIE
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the side.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the side.
 
         The side could have 3 different prices depending
         on its size.
 
         Returns:
-            A float value indicating the price of the side.
+            An int value indicating the price of the side
+            in cents.
         """
         if self._size == Size.INDIE:
-            return 2.25
+            return 225
         elif self._size == Size.STUDIO:
-            return 3.65
+            return 365
         else:
-            return 6.25
+            return 625
 
     @property
     def calories(self) -> int:
@@ -8,7 +8,7 @@ Version 0.3
 """
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
-from typing import List, Set
+from typing import List
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -21,31 +21,35 @@ class SomeLikeItHot(Wrap, Item):
     it can perform.
     """
 
+    __slots__ = ()
+    __CHICKEN: int = Wrap.TOPPING
+    __CHEESE: int = __CHICKEN << 1
+
     def __init__(self) -> None:
         """The constructor for the Some Like it Hot wrap."""
         self._shell: Shell = Shell.WHOLE_GRAIN
-        self._addins: Set[Addin] = {Addin.ONIONS,
-                                    Addin.PEPPERS,
-                                    Addin.BUFFALO_SAUCE}
-        self.__chicken: bool = True
-        self.__cheese: bool = True
+        self._options: int = (Wrap.ADDINS[Addin.ONIONS] |
+                              Wrap.ADDINS[Addin.PEPPERS] |
+                              Wrap.ADDINS[Addin.BUFFALO_SAUCE] |
+                              SomeLikeItHot.__CHICKEN | SomeLikeItHot.__CHEESE)
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the wrap.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the wrap.
 
         The wrap could have 3 different prices depending
         on its shell.
 
         Returns:
-            A float value indicating the price of the wrap.
+            An int value indicating the price of the wrap
+            in cents.
         """
         if self._shell == Shell.WHOLE_GRAIN:
-            return 11.45
+            return 1145
         elif self._shell == Shell.SPINACH:
-            return 11.70
+            return 1170
         else:
-            return 12.20
+            return 1220
 
     @property
     def calories(self) -> int:
@@ -70,9 +74,9 @@ class SomeLikeItHot(Wrap, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__chicken:
+        if not self._has(SomeLikeItHot.__CHICKEN):
             specials.append("Hold Chicken")
-        if not self.__cheese:
+        if not self._has(SomeLikeItHot.__CHEESE):
             specials.append("Hold Cheese")
         for instr in super().instructions:
             specials.append(instr)
@@ -88,7 +92,7 @@ class SomeLikeItHot(Wrap, Item):
         Returns:
             True if the wrap has chicken, otherwise False.
         """
-        return self.__chicken
+        return self._has(SomeLikeItHot.__CHICKEN)
 
     @chicken.setter
     def chicken(self, value: bool) -> None:
@@ -101,7 +105,7 @@ class SomeLikeItHot(Wrap, Item):
             value: True if we wish to include chicken,
             False otherwise.
         """
-        self.__chicken = value
+        self._put(SomeLikeItHot.__CHICKEN, value)
 
     @property
     def cheese(self) -> bool:
@@ -113,7 +117,7 @@ class SomeLikeItHot(Wrap, Item):
         Returns:
             True if the wrap has cheese, otherwise False.
         """
-        return self.__cheese
+        return self._has(SomeLikeItHot.__CHEESE)
 
     @cheese.setter
     def cheese(self, value: bool) -> None:
@@ -126,7 +130,7 @@ class SomeLikeItHot(Wrap, Item):
             value: True if we wish to include cheese,
             False otherwise.
         """
-        self.__cheese = value
+        self._put(SomeLikeItHot.__CHEESE, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -159,9 +163,7 @@ class SomeLikeItHot(Wrap, Item):
         """
         if isinstance(value, SomeLikeItHot):
             return (self._shell == value.shell and
-                    self._addins == value.addins and
-                    self.__chicken == value.chicken and
-                    self.__cheese == value.cheese)
+                    self._options == value._options)
         else:
             return False
 
@@ -8,7 +8,7 @@ Version 0.3
 """
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
-from typing import List, Set
+from typing import List
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -20,35 +20,43 @@ class Spartacus(Wrap, Item):
     the state of the wrap, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __CHICKEN: int = Wrap.TOPPING
+    __CHEESE: int = __CHICKEN << 1
+    __CORNED_BEEF: int = __CHEESE << 1
+    __PEPPERONI: int = __CORNED_BEEF << 1
+    __SAUSAGE: int = __PEPPERONI << 1
+
     def __init__(self) -> None:
         """The constructor for the Spartacus wrap."""
         self._shell: Shell = Shell.SPINACH
-        self._addins: Set[Addin] = {Addin.ONIONS, Addin.PEPPERS,
-                                    Addin.TOMATOES, Addin.PICKLES,
-                                    Addin.BUFFALO_SAUCE,
-                                    Addin.DRESSING}
-        self.__chicken = True
-        self.__cheese = True
-        self.__corned_beef = True
-        self.__pepperoni = True
-        self.__sausage = True
+        self._options: int = (Wrap.ADDINS[Addin.ONIONS] |
+                              Wrap.ADDINS[Addin.PEPPERS] |
+                              Wrap.ADDINS[Addin.TOMATOES] |
+                              Wrap.ADDINS[Addin.PICKLES] |
+                              Wrap.ADDINS[Addin.BUFFALO_SAUCE] |
+                              Wrap.ADDINS[Addin.DRESSING] |
+                              Spartacus.__CHICKEN | Spartacus.__CHEESE |
+                              Spartacus.__CORNED_BEEF | Spartacus.__PEPPERONI |
+                              Spartacus.__SAUSAGE)
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the wrap.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the wrap.
 
         The wrap could have 3 different prices depending
         on its shell.
 
         Returns:
-            A float value indicating the price of the wrap.
+            An int value indicating the price of the wrap
+            in cents.
         """
         if self._shell == Shell.WHOLE_GRAIN:
-            return 16.30
+            return 1630
         elif self._shell == Shell.SPINACH:
-            return 16.55
+            return 1655
         else:
-            return 17.05
+            return 1705
 
     @property
     def calories(self) -> int:
@@ -73,15 +81,15 @@ class Spartacus(Wrap, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__chicken:
+        if not self._has(Spartacus.__CHICKEN):
             specials.append("Hold Chicken")
-        if not self.__cheese:
+        if not self._has(Spartacus.__CHEESE):
             specials.append("Hold Cheese")
-        if not self.__corned_beef:
+        if not self._has(Spartacus.__CORNED_BEEF):
             specials.append("Hold Corned Beef")
-        if not self.__sausage:
+        if not self._has(Spartacus.__SAUSAGE):
             specials.append("Hold Sausage")
-        if not self.__pepperoni:
+        if not self._has(Spartacus.__PEPPERONI):
             specials.append("Hold Pepperoni")
         for instr in super().instructions:
             specials.append(instr)
@@ -97,7 +105,7 @@ class Spartacus(Wrap, Item):
         Returns:
             True if the wrap has chicken, otherwise False.
         """
-        return self.__chicken
+        return self._has(Spartacus.__CHICKEN)
 
     @chicken.setter
     def chicken(self, value: bool) -> None:
@@ -110,7 +118,7 @@ class Spartacus(Wrap, Item):
             value: True if we wish to include chicken,
             False otherwise.
         """
-        self.__chicken = value
+        self._put(Spartacus.__CHICKEN, value)
 
     @property
     def cheese(self) -> bool:
@@ -122,7 +130,7 @@ class Spartacus(Wrap, Item):
         Returns:
             True if the wrap has cheese, otherwise False.
         """
-        return self.__cheese
+        return self._has(Spartacus.__CHEESE)
 
     @cheese.setter
     def cheese(self, value: bool) -> None:
@@ -135,7 +143,7 @@ class Spartacus(Wrap, Item):
             value: True if we wish to include cheese,
             False otherwise.
         """
-        self.__cheese = value
+        self._put(Spartacus.__CHEESE, value)
 
     @property
     def corned_beef(self) -> bool:
@@ -147,7 +155,7 @@ class Spartacus(Wrap, Item):
         Returns:
             True if the wrap has corned beef, otherwise False.
         """
-        return self.__corned_beef
+        return self._has(Spartacus.__CORNED_BEEF)
 
     @corned_beef.setter
     def corned_beef(self, value: bool) -> None:
@@ -160,7 +168,7 @@ class Spartacus(Wrap, Item):
             value: True if we wish to include corned beef,
             False otherwise.
         """
-        self.__corned_beef = value
+        self._put(Spartacus.__CORNED_BEEF, value)
 
     @property
     def sausage(self) -> bool:
@@ -172,7 +180,7 @@ class Spartacus(Wrap, Item):
         Returns:
             True if the wrap has sausage, otherwise False.
         """
-        return self.__sausage
+        return self._has(Spartacus.__SAUSAGE)
 
     @sausage.setter
     def sausage(self, value: bool) -> None:
@@ -185,7 +193,7 @@ class Spartacus(Wrap, Item):
             value: True if we wish to include sausage,
             False otherwise.
         """
-        self.__sausage = value
+        self._put(Spartacus.__SAUSAGE, value)
 
     @property
     def pepperoni(self) -> bool:
@@ -197,7 +205,7 @@ class Spartacus(Wrap, Item):
         Returns:
             True if the wrap has pepperoni, otherwise False.
         """
-        return self.__pepperoni
+        return self._has(Spartacus.__PEPPERONI)
 
     @pepperoni.setter
     def pepperoni(self, value: bool) -> None:
@@ -210,7 +218,7 @@ class Spartacus(Wrap, Item):
             value: True if we wish to include pepperoni,
             False otherwise.
         """
-        self.__pepperoni = value
+        self._put(Spartacus.__PEPPERONI, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -243,12 +251,7 @@ class Spartacus(Wrap, Item):
         """
         if isinstance(value, Spartacus):
             return (self._shell == value.shell and
-                    self._addins == value.addins and
-                    self.__chicken == value.chicken and
-                    self.__cheese == value.cheese and
-                    self.__corned_beef == value.corned_beef and
-                    self.__sausage == value.sausage and
-                    self.__pepperoni == value.pepperoni)
+                    self._options == value._options)
         else:
             return False
 
@@ -8,7 +8,7 @@ Version 0.3
 """
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
-from typing import List, Set
+from typing import List
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -20,31 +20,38 @@ class TheGodFather(Wrap, Item):
     the state of the wrap, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __PEPPERONI: int = Wrap.TOPPING
+    __SAUSAGE: int = __PEPPERONI << 1
+    __MARINARA: int = __SAUSAGE << 1
+    __CHEESE: int = __MARINARA << 1
+
     def __init__(self) -> None:
         """The constructor for The Godfather wrap."""
         self._shell: Shell = Shell.STROMBOLI
-        self._addins: Set[Addin] = {Addin.PEPPERS, Addin.ONIONS}
-        self.__pepperoni: bool = True
-        self.__sausage: bool = True
-        self.__marinara: bool = True
-        self.__cheese: bool = True
+        self._options: int = (Wrap.ADDINS[Addin.PEPPERS] |
+                              Wrap.ADDINS[Addin.ONIONS] |
+                              TheGodFather.__PEPPERONI |
+                              TheGodFather.__SAUSAGE |
+                              TheGodFather.__MARINARA | TheGodFather.__CHEESE)
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the wrap.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the wrap.
 
         The wrap could have 3 different prices depending
         on its shell.
 
         Returns:
-            A float value indicating the price of the wrap.
+            An int value indicating the price of the wrap
+            in cents.
         """
         if self._shell == Shell.STROMBOLI:
-            return 9.65
+            return 965
         elif self._shell == Shell.SPINACH:
-            return 9.15
+            return 915
         else:
-            return 8.90
+            return 890
 
     @property
     def calories(self) -> int:
@@ -69,13 +76,13 @@ class TheGodFather(Wrap, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__pepperoni:
+        if not self._has(TheGodFather.__PEPPERONI):
             specials.append("Hold Pepperoni")
-        if not self.__sausage:
+        if not self._has(TheGodFather.__SAUSAGE):
             specials.append("Hold Sausage")
-        if not self.__marinara:
+        if not self._has(TheGodFather.__MARINARA):
             specials.append("Hold Marinara")
-        if not self.__cheese:
+        if not self._has(TheGodFather.__CHEESE):
             specials.append("Hold Cheese")
         for instr in super().instructions:
             specials.append(instr)
@@ -91,7 +98,7 @@ class TheGodFather(Wrap, Item):
         Returns:
             True if the wrap has pepperoni, otherwise False.
         """
-        return self.__pepperoni
+        return self._has(TheGodFather.__PEPPERONI)
 
     @pepperoni.setter
     def pepperoni(self, value: bool) -> None:
@@ -104,7 +111,7 @@ class TheGodFather(Wrap, Item):
             value: True if we wish to include pepperoni,
             False otherwise.
         """
-        self.__pepperoni = value
+        self._put(TheGodFather.__PEPPERONI, value)
 
     @property
     def sausage(self) -> bool:
@@ -116,7 +123,7 @@ class TheGodFather(Wrap, Item):
         Returns:
             True if the wrap has sausage, otherwise False.
         """
-        return self.__sausage
+        return self._has(TheGodFather.__SAUSAGE)
 
     @sausage.setter
     def sausage(self, value: bool) -> None:
@@ -129,7 +136,7 @@ class TheGodFather(Wrap, Item):
             value: True if we wish to include sausage,
             False otherwise.
         """
-        self.__sausage = value
+        self._put(TheGodFather.__SAUSAGE, value)
 
     @property
     def marinara(self) -> bool:
@@ -141,7 +148,7 @@ class TheGodFather(Wrap, Item):
         Returns:
             True if the wrap has marinara, otherwise False.
         """
-        return self.__marinara
+        return self._has(TheGodFather.__MARINARA)
 
     @marinara.setter
     def marinara(self, value: bool) -> None:
@@ -154,7 +161,7 @@ class TheGodFather(Wrap, Item):
             value: True if we wish to include marinara,
             False otherwise.
         """
-        self.__marinara = value
+        self._put(TheGodFather.__MARINARA, value)
 
     @property
     def cheese(self) -> bool:
@@ -166,7 +173,7 @@ class TheGodFather(Wrap, Item):
         Returns:
             True if the wrap has cheese, otherwise False.
         """
-        return self.__cheese
+        return self._has(TheGodFather.__CHEESE)
 
     @cheese.setter
     def cheese(self, value: bool) -> None:
@@ -179,7 +186,7 @@ class TheGodFather(Wrap, Item):
             value: True if we wish to include cheese,
             False otherwise.
         """
-        self.__cheese = value
+        self._put(TheGodFather.__CHEESE, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -212,11 +219,7 @@ class TheGodFather(Wrap, Item):
         """
         if isinstance(value, TheGodFather):
             return (self._shell == value.shell and
-                    self._addins == value.addins and
-                    self.__pepperoni == value.pepperoni and
-                    self.__sausage == value.sausage and
-                    self.__marinara == value.marinara and
-                    self.__cheese == value.cheese)
+                    self._options == value._options)
         else:
             return False
 
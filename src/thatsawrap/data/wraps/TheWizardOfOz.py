@@ -8,7 +8,7 @@ Version 0.3
 """
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
-from typing import List, Set
+from typing import List
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -20,30 +20,36 @@ class TheWizardOfOz(Wrap, Item):
     the state of the wrap, as well as the functions that
     it can perform.
     """
+    __slots__ = ()
+    __CHICKEN: int = Wrap.TOPPING
+    __SPINACH: int = __CHICKEN << 1
+    __CHEESE: int = __SPINACH << 1
+
     def __init__(self) -> None:
         """The constructor for The Wizard Of Oz wrap."""
         self._shell: Shell = Shell.SPINACH
-        self._addins: Set[Addin] = {Addin.TOMATOES, Addin.DRESSING}
-        self.__chicken = True
-        self.__spinach = True
-        self.__cheese = True
+        self._options: int = (Wrap.ADDINS[Addin.TOMATOES] |
+                              Wrap.ADDINS[Addin.DRESSING] |
+                              TheWizardOfOz.__CHICKEN |
+                              TheWizardOfOz.__SPINACH | TheWizardOfOz.__CHEESE)
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the wrap.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the wrap.
 
         The wrap could have 3 different prices depending
         on its shell.
 
         Returns:
-            A float value indicating the price of the wrap.
+            An int value indicating the price of the wrap
+            in cents.
         """
         if self._shell == Shell.STROMBOLI:
-            return 10.85
+            return 1085
         elif self._shell == Shell.SPINACH:
-            return 10.35
+            return 1035
         else:
-            return 10.10
+            return 1010
 
     @property
     def calories(self) -> int:
@@ -68,11 +74,11 @@ class TheWizardOfOz(Wrap, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__spinach:
+        if not self._has(TheWizardOfOz.__SPINACH):
             specials.append("Hold Spinach")
-        if not self.__chicken:
+        if not self._has(TheWizardOfOz.__CHICKEN):
             specials.append("Hold Chicken")
-        if not self.__cheese:
+        if not self._has(TheWizardOfOz.__CHEESE):
             specials.append("Hold Cheese")
         for instr in super().instructions:
             specials.append(instr)
@@ -88,7 +94,7 @@ class TheWizardOfOz(Wrap, Item):
         Returns:
             True if the wrap has chicken, otherwise False.
         """
-        return self.__chicken
+        return self._has(TheWizardOfOz.__CHICKEN)
 
     @chicken.setter
     def chicken(self, value: bool) -> None:
@@ -101,7 +107,7 @@ class TheWizardOfOz(Wrap, Item):
             value: True if we wish to include chicken,
             False otherwise.
         """
-        self.__chicken = value
+        self._put(TheWizardOfOz.__CHICKEN, value)
 
     @property
     def spinach(self) -> bool:
@@ -113,7 +119,7 @@ class TheWizardOfOz(Wrap, Item):
         Returns:
             True if the wrap has spinach, otherwise False.
         """
-        return self.__spinach
+        return self._has(TheWizardOfOz.__SPINACH)
 
     @spinach.setter
     def spinach(self, value: bool) -> None:
@@ -126,7 +132,7 @@ class TheWizardOfOz(Wrap, Item):
             value: True if we wish to include spinach,
             False otherwise.
         """
-        self.__spinach = value
+        self._put(TheWizardOfOz.__SPINACH, value)
 
     @property
     def cheese(self) -> bool:
@@ -138,7 +144,7 @@ class TheWizardOfOz(Wrap, Item):
         Returns:
             True if the wrap has cheese, otherwise False.
         """
-        return self.__cheese
+        return self._has(TheWizardOfOz.__CHEESE)
 
     @cheese.setter
     def cheese(self, value: bool) -> None:
@@ -151,7 +157,7 @@ class TheWizardOfOz(Wrap, Item):
             value: True if we wish to include cheese,
             False otherwise.
         """
-        self.__cheese = value
+        self._put(TheWizardOfOz.__CHEESE, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -184,10 +190,7 @@ class TheWizardOfOz(Wrap, Item):
         """
         if isinstance(value, TheWizardOfOz):
             return (self._shell == value.shell and
-                    self._addins == value.addins and
-                    self.__chicken == value.chicken and
-                    self.__spinach == value.spinach and
-                    self.__cheese == value.cheese)
+                    self._options == value._options)
         else:
             return False
 
@@ -8,7 +8,7 @@ Version 0.3
 """
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
-from typing import List, Set
+from typing import List
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -21,30 +21,37 @@ class WestSideStory(Wrap, Item):
     it can perform.
     """
 
+    __slots__ = ()
+    __CORNED_BEEF: int = Wrap.TOPPING
+    __CABBAGE: int = __CORNED_BEEF << 1
+    __CHEESE: int = __CABBAGE << 1
+
     def __init__(self) -> None:
         """The constructor for The West Side Story wrap."""
         self._shell: Shell = Shell.WHOLE_GRAIN
-        self._addins: Set[Addin] = {Addin.ONIONS, Addin.PICKLES, Addin.MUSTARD}
-        self.__corned_beef = True
-        self.__cabbage = True
-        self.__cheese = True
+        self._options: int = (Wrap.ADDINS[Addin.ONIONS] |
+                              Wrap.ADDINS[Addin.PICKLES] |
+                              Wrap.ADDINS[Addin.MUSTARD] |
+                              WestSideStory.__CORNED_BEEF |
+                              WestSideStory.__CABBAGE | WestSideStory.__CHEESE)
 
     @property
-    def price(self) -> float:
-        """Getter for the price of the wrap.
+    def price_cents(self) -> int:
+        """Getter for the price in cents of the wrap.
 
         The wrap could have 3 different prices depending
         on its shell.
 
         Returns:
-            A float value indicating the price of the wrap.
+            An int value indicating the price of the wrap
+            in cents.
         """
         if self._shell == Shell.WHOLE_GRAIN:
-            return 8.75
+            return 875
         elif self._shell == Shell.SPINACH:
-            return 9.0
+            return 900
         else:
-            return 9.50
+            return 950
 
     @property
     def calories(self) -> int:
@@ -69,11 +76,11 @@ class WestSideStory(Wrap, Item):
             A list of strings containing the instructions.
         """
         specials: List[str] = []
-        if not self.__corned_beef:
+        if not self._has(WestSideStory.__CORNED_BEEF):
             specials.append("Hold Corned Beef")
-        if not self.__cabbage:
+        if not self._has(WestSideStory.__CABBAGE):
             specials.append("Hold Cabbage")
-        if not self.__cheese:
+        if not self._has(WestSideStory.__CHEESE):
             specials.append("Hold Cheese")
         for instr in super().instructions:
             specials.append(instr)
@@ -89,7 +96,7 @@ class WestSideStory(Wrap, Item):
         Returns:
             True if the wrap has corned beef, otherwise False.
         """
-        return self.__corned_beef
+        return self._has(WestSideStory.__CORNED_BEEF)
 
     @corned_beef.setter
     def corned_beef(self, value: bool) -> None:
@@ -102,7 +109,7 @@ class WestSideStory(Wrap, Item):
             value: True if we wish to include corned beef,
             False otherwise.
         """
-        self.__corned_beef = value
+        self._put(WestSideStory.__CORNED_BEEF, value)
 
     @property
     def cheese(self) -> bool:
@@ -114,7 +121,7 @@ class WestSideStory(Wrap, Item):
         Returns:
             True if the wrap has cheese, otherwise False.
         """
-        return self.__cheese
+        return self._has(WestSideStory.__CHEESE)
 
     @cheese.setter
     def cheese(self, value: bool) -> None:
@@ -127,7 +134,7 @@ class WestSideStory(Wrap, Item):
             value: True if we wish to include cheese,
             False otherwise.
         """
-        self.__cheese = value
+        self._put(WestSideStory.__CHEESE, value)
 
     @property
     def cabbage(self) -> bool:
@@ -139,7 +146,7 @@ class WestSideStory(Wrap, Item):
         Returns:
             True if the wrap has cabbage, otherwise False.
         """
-        return self.__cabbage
+        return self._has(WestSideStory.__CABBAGE)
 
     @cabbage.setter
     def cabbage(self, value: bool) -> None:
@@ -152,7 +159,7 @@ class WestSideStory(Wrap, Item):
             value: True if we wish to include cabbage,
             False otherwise.
         """
-        self.__cabbage = value
+        self._put(WestSideStory.__CABBAGE, value)
 
     def __str__(self) -> str:
         """String representation.
@@ -185,10 +192,7 @@ class WestSideStory(Wrap, Item):
         """
         if isinstance(value, WestSideStory):
             return (self._shell == value.shell and
-                    self._addins == value.addins and
-                    self.__corned_beef == value.corned_beef and
-                    self.__cheese == value.cheese and
-                    self.__cabbage == value.cabbage)
+                    self._options == value._options)
         else:
             return False
 
@@ -7,7 +7,7 @@ shared characteristics.
 Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
-from typing import List, Set
+from typing import Dict, List, Set
 from src.thatsawrap.data.enums.Shell import Shell
 from src.thatsawrap.data.enums.Addin import Addin
 import abc
@@ -19,7 +19,21 @@ class Wrap:
     This class contains the methods that all wrap objects
     have in common.  It will behave as a superclass that
     all wrap classes will inherit from.
+
+    Wraps keep no __dict__, only slots for the
+    shell, the options, and the epoch and key kept
+    by Item.  The addins and the toppings of a wrap
+    are packed into the bits of one int, an addin
+    to each of the low bits and the toppings of
+    each wrap from TOPPING up.
     """
+    __slots__ = ("_shell", "_options", "_Item__epoch", "_Item__key")
+    _shell: Shell
+    _options: int
+    ADDINS: Dict[Addin, int] = {addin: 1 << n
+                                for n, addin in enumerate(Addin)}
+    TOPPING: int = 1 << 16
+
     @property
     def shell(self) -> Shell:
         """Getter for shell.
@@ -56,7 +70,8 @@ class Wrap:
         Returns:
             A list of Addin type objects.
         """
-        return self._addins.copy()
+        return {addin for addin, bit in Wrap.ADDINS.items()
+                if self._options & bit}
 
     def add_addin(self, value: Addin) -> None:
         """Adds an addin.
@@ -67,7 +82,7 @@ class Wrap:
         Args:
             value: An Addin type object.
         """
-        self._addins.add(value)
+        self._options = self._options | Wrap.ADDINS[value]
 
     def remove_addin(self, value: Addin) -> None:
         """Removes an addin.
@@ -78,22 +93,32 @@ class Wrap:
         Args:
             value: An Addin type object.
         """
-        self._addins.discard(value)
+        self._options = self._options & ~Wrap.ADDINS[value]
 
     @property
     @abc.abstractmethod
-    def price(self) -> float:
-        """Abstract getter for price.
+    def price_cents(self) -> int:
+        """Abstract getter for price in cents.
 
         Verifies that each subclass has
         price getting functionality. This method
         should not be called directly.
 
         Returns:
-            Price when overwritten by subclass.
+            Price in cents when overwritten by subclass.
         """
         raise NotImplementedError
 
+    @property
+    def price(self) -> float:
+        """Getter for price.
+
+        Returns:
+            The price in dollars, from
+            price_cents.
+        """
+        return self.price_cents / 100
+
     @property
     @abc.abstractmethod
     def calories(self) -> int:
@@ -120,10 +145,36 @@ class Wrap:
             regarding the addins.
         """
         extra_instructions = []
-        for add in self._addins:
-            extra_instructions.append("Add {}".format(add))
+        for add, bit in Wrap.ADDINS.items():
+            if self._options & bit:
+                extra_instructions.append("Add {}".format(add))
         return extra_instructions
 
+    def _has(self, bit: int) -> bool:
+        """Has option method.
+
+        Args:
+            bit: The bit of an option.
+
+        Returns:
+            True if the option is set,
+            False otherwise.
+        """
+        return bool(self._options & bit)
+
+    def _put(self, bit: int, value: bool) -> None:
+        """Put option method.
+
+        Args:
+            bit: The bit of an option.
+            value: True to set the option,
+            False to clear it.
+        """
+        if value:
+            self._options = self._options | bit
+        else:
+            self._options = self._options & ~bit
+
     @property
     @abc.abstractmethod
     def name(self) -> str:
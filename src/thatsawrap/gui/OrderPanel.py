@@ -6,15 +6,19 @@ the Order in the GUI.
 Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
-from tkinter import Frame, Button, Label
+from tkinter import Frame, Button, Label, messagebox
 from tkinter.ttk import Treeview, Scrollbar
-from typing import Dict
+from typing import Dict, Optional
 
 from src.thatsawrap.data.menu.Item import Item
 from src.thatsawrap.gui.PanelFactory import PanelFactory
 from src.thatsawrap.data.sides.Side import Side
 from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.OrderJournal import (JournalTicket,
+                                                    OrderJournal)
+from src.thatsawrap.data.order.Money import Money
 from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboPackager import ComboPackager
 from src.thatsawrap.gui.combo.ComboPanel import ComboPanel
 from src.thatsawrap.data.wraps.Wrap import Wrap
 
@@ -23,9 +27,16 @@ class OrderPanel(Frame):
     """The Order Panel class.
 
     This class builds the representation of the
-    order panel in the GUI.
+    order panel in the GUI.  At checkout, the
+    order is kept open if the journal fails to
+    save it, and a failure found after the next
+    order was started is reported by its number.
     """
-    def __init__(self, master) -> None:
+    JOURNAL_WAIT: float = 1.0
+    JOURNAL_POLL: int = 200
+
+    def __init__(self, master,
+                 journal: Optional[OrderJournal] = None) -> None:
         """The Order Panel constructor.
 
         This constructor builds the layout
@@ -40,8 +51,11 @@ class OrderPanel(Frame):
 
         Args:
             master: A reference to the PrimaryWindow.
+            journal: The journal finished orders
+            are recorded in, if any.
         """
         self.__master = master
+        self.__journal: Optional[OrderJournal] = journal
         self.__order: Order = Order()
         Frame.__init__(self, master=self.__master)
         self.grid_columnconfigure(0, weight=1)
@@ -139,17 +153,67 @@ class OrderPanel(Frame):
                 self.__order_list.delete(node)
                 self.__update_money()
         elif text == "new_order":
-            self.__order = Order()
-            self.__update_money()
-            self.__items.clear()
-            for item in self.__order_list.get_children():
-                self.__order_list.delete(item)
+            self.__new_order()
+        elif text == "checkout":
+            if len(self.__order) == 0:
+                return
+            if self.__journal is not None:
+                number = self.__order.order_number
+                try:
+                    ticket = self.__journal.append(self.__order)
+                    saved = ticket.wait(OrderPanel.JOURNAL_WAIT)
+                except (OSError, ValueError) as error:
+                    messagebox.showerror(
+                        "Checkout", "Order #{} was not saved and is still "
+                        "open: {}".format(number, error))
+                    return
+                if not saved:
+                    self.__watch(ticket, number)
+            self.__new_order()
+
+    def __watch(self, ticket: JournalTicket, number: int) -> None:
+        """Watches a ticket.
+
+        Checks again later on an order still
+        being saved, and tells the user if it
+        could not be.
+
+        Args:
+            ticket: The JournalTicket of the order.
+            number: The number of the order.
+        """
+        try:
+            saved = ticket.wait(0)
+        except OSError as error:
+            messagebox.showerror(
+                "Checkout", "Order #{} was not saved: {}".format(
+                    number, error))
+            return
+        if not saved:
+            self.after(OrderPanel.JOURNAL_POLL,
+                       lambda: self.__watch(ticket, number))
+
+    def __new_order(self) -> None:
+        """Starts a new order.
+
+        Replaces the current order with an
+        empty one and clears the order list.
+        """
+        self.__order = Order()
+        self.__update_money()
+        self.__items.clear()
+        for item in self.__order_list.get_children():
+            self.__order_list.delete(item)
 
     def save_item(self, item: Item) -> None:
         """Saves an item.
 
         Saves the item so that it will
-        appear to the user.
+        appear to the user.  A new item the
+        same as one already in the order joins
+        its line, and a new wrap, drink or side
+        that completes a combo with other loose
+        items is sold as a combo.
 
         Args:
             item: The Item type object,
@@ -158,12 +222,44 @@ class OrderPanel(Frame):
         """
         for item_id, value in self.__items.items():
             if item is value:
+                self.__order.update_item(item)
                 self.__update_tree(item, item_id)
+                self.__update_money()
                 return
-        self.__items[self.__update_tree(item)] = item
-        self.__order.add_item(item)
+        line = self.__order.add_items(item)
+        if line.item is item:
+            self.__items[self.__update_tree(item)] = item
+        else:
+            self.__update_tree(line.item, self.__node_of(line.item))
+        packed = ComboPackager.repackage(self.__order)
+        if packed:
+            for node, value in list(self.__items.items()):
+                if value in self.__order:
+                    self.__update_tree(value, node)
+                else:
+                    del self.__items[node]
+                    self.__order_list.delete(node)
+            for repackaged in packed:
+                combo = repackaged.combo
+                self.__items[self.__update_tree(combo)] = combo
         self.__update_money()
 
+    def __node_of(self, item: Item) -> str:
+        """Node of item method.
+
+        Args:
+            item: An Item type object shown in
+            the order list.
+
+        Returns:
+            The ID of the Treeview node showing
+            that instance.
+        """
+        for node, value in self.__items.items():
+            if value is item:
+                return node
+        raise ValueError
+
     def __update_tree(self, item: Item, index: str = "end") -> str:
         """Update order.
 
@@ -181,18 +277,24 @@ class OrderPanel(Frame):
             A string indicating the item
             to be updated.
         """
+        quantity = ""
+        if item in self.__order:
+            count = self.__order.line_of(item).quantity
+            if count > 1:
+                quantity = " x {}".format(count)
         if index == "end":
             if isinstance(item, Combo):
                 index = self.__order_list.insert(parent="", index="end",
-                                             text="Combo")
+                                             text="Combo" + quantity)
             else:
                 index = self.__order_list.insert(parent="", index="end",
-                                                text=str(item))
+                                                text=str(item) + quantity)
         else:
             if isinstance(item, Combo):
-                self.__order_list.item(index, text=item.name)
+                self.__order_list.item(
+                    index, text=(item.name or "Combo") + quantity)
             else:
-                self.__order_list.item(index, text=str(item))
+                self.__order_list.item(index, text=str(item) + quantity)
             for child in self.__order_list.get_children(index):
                 self.__order_list.delete(child)
         self.__order_list.item(index, open=True)
@@ -233,8 +335,8 @@ class OrderPanel(Frame):
         and total labels in the GUI.
         """
         self.__subtotal_price_label['text'] = \
-        "${:,.2f}".format(self.__order.subtotal)
+        Money.format(self.__order.subtotal_cents)
         self.__total_price_label['text'] = \
-        "${:,.2f}".format(self.__order.total)
+        Money.format(self.__order.total_cents)
         self.__tax_price_label['text'] = \
-        "${:,.2f}".format(self.__order.tax)
+        Money.format(self.__order.tax_cents)
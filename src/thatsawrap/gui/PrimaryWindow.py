@@ -7,9 +7,15 @@ Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
 import tkinter as tk
+from tkinter import messagebox
 from src.thatsawrap.gui.OrderPanel import OrderPanel
 from src.thatsawrap.gui.MenuPanel import MenuPanel
 from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.order.OrderJournal import OrderJournal
+from src.thatsawrap.data.order.OrderNumberAllocator import \
+    OrderNumberAllocator
+from src.thatsawrap.data.order.OrderNumberSingleton import \
+    OrderNumberSingleton
 
 
 class PrimaryWindow(tk.Tk):
@@ -21,6 +27,9 @@ class PrimaryWindow(tk.Tk):
     Author: Dustin Hayes djhayes@ksu.edu
     Version 0.1
     """
+    JOURNAL_PATH: str = "orders.journal"
+    ORDER_NUMBER_PATH: str = "orders.mark"
+
     def __init__(self) -> None:
         """The Primary Window constructor.
 
@@ -44,9 +53,34 @@ class PrimaryWindow(tk.Tk):
         self.__main = None
         self.load_menu_panel()
 
-        self.__order = OrderPanel(self)
+        OrderNumberSingleton.use_allocator(
+            OrderNumberAllocator(PrimaryWindow.ORDER_NUMBER_PATH))
+        try:
+            self.__journal = OrderJournal(PrimaryWindow.JOURNAL_PATH)
+        except (OSError, ValueError) as error:
+            messagebox.showerror(
+                "Journal", "The order journal {} could not be opened and "
+                "was left as it is: {}".format(PrimaryWindow.JOURNAL_PATH,
+                                               error))
+            self.destroy()
+            raise
+        OrderNumberSingleton().advance_past(
+            max((entry.number for entry in self.__journal.entries),
+                default=0))
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.__order = OrderPanel(self, self.__journal)
         self.__order.grid(row=0, column=1, padx=10, pady=10, sticky="NSEW")
 
+    def close(self) -> None:
+        """Close method.
+
+        Writes any orders still waiting in the
+        journal before closing the window.
+        """
+        self.__journal.close()
+        self.destroy()
+
     def load_menu_panel(self):
         """Load menu method.
 
@@ -0,0 +1,100 @@
+"""API controller file.
+
+This file contains the code to send the menu as
+JSON to the kiosks and the mobile app.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import json
+from typing import Optional
+from flask import Response, abort, request
+from flask_classful import FlaskView, route  # type: ignore
+from src.thatsawrap.data.menu.MenuDocument import MenuDocument
+from src.thatsawrap.data.order.ComboOptimizer import ComboOptimizer
+from src.thatsawrap.data.order.Money import Money
+
+
+class ApiController(FlaskView):
+    """API controller class.
+
+    This class contains the code to send the menu as
+    JSON.  Every response has a strong ETag, and a
+    client sending it back in If-None-Match gets an
+    empty 304 response while the menu is unchanged.
+    """
+    route_base = "/api/"
+    MAX_COMBOS: int = 20
+    _optimizer: Optional[ComboOptimizer] = None
+
+    @route('/menu', methods=['GET'])
+    def menu(self):
+        """Menu action.
+
+        Returns:
+            Every section of the menu, as JSON.
+        """
+        return ApiController.__send("menu")
+
+    @route('/menu/<section>', methods=['GET'])
+    def menu_section(self, section: str):
+        """Menu section action.
+
+        Args:
+            section: The wraps, drinks, sides or
+            combos on the menu.
+
+        Returns:
+            The section of the menu, as JSON.
+        """
+        if section not in MenuDocument.SECTIONS:
+            abort(404)
+        return ApiController.__send(section)
+
+    @route('/combos/best', methods=['GET'])
+    def best_combos(self):
+        """Best combos action.
+
+        Takes a budget in dollars, a calorie limit,
+        how many combos to send and, optionally, a
+        goal of "calories" or "price".
+
+        Returns:
+            The best combos within the limits,
+            as JSON.
+        """
+        budget = request.args.get("budget", type=float)
+        calories = request.args.get("calories", type=int)
+        k = request.args.get("k", default=5, type=int)
+        goal = request.args.get("goal", default=ComboOptimizer.CALORIES)
+        if (budget is None or calories is None or
+                k < 1 or k > ApiController.MAX_COMBOS or
+                goal not in (ComboOptimizer.CALORIES, ComboOptimizer.PRICE)):
+            abort(400)
+        if ApiController._optimizer is None:
+            ApiController._optimizer = ComboOptimizer()
+        choices = ApiController._optimizer.best(Money.to_cents(budget),
+                                                calories, k, goal)
+        body = json.dumps([MenuDocument.combo(choice.build())
+                           for choice in choices], separators=(",", ":"))
+        return Response(body, mimetype="application/json")
+
+    @staticmethod
+    def __send(name: str) -> Response:
+        """Send method.
+
+        Args:
+            name: The section of the menu to send.
+
+        Returns:
+            The cached bytes of the section, or a
+            304 response if the client has them.
+        """
+        section = MenuDocument.section(name)
+        if request.if_none_match.contains_weak(section.etag):
+            response = Response(status=304)
+        else:
+            response = Response(section.body, mimetype="application/json")
+        response.set_etag(section.etag)
+        response.headers['Cache-Control'] = "no-cache"
+        return response
@@ -7,10 +7,16 @@ with.
 Author: Dustin Hayes djhayes@ksu.edu
 Version 0.1
 """
-from flask import render_template, request
+from flask import (current_app, jsonify, render_template, request,
+                   stream_template)
 from flask_classful import FlaskView, route  # type: ignore
 from src.thatsawrap.data.menu.Menu import Menu
-from typing import List
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog, MenuSnapshot
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.QueryPlanner import QueryPlanner, SearchFacets
+from src.thatsawrap.data.menu.SearchCache import SearchCache
+from src.thatsawrap.data.menu.SearchCursor import SearchPage
+from typing import List, Tuple
 from src.thatsawrap.data.order.Combo import Combo
 from src.thatsawrap.data.menu.Item import Item
 
@@ -25,6 +31,8 @@ class MenuController(FlaskView):
     """
 
     route_base = "/"
+    cache = SearchCache(maxsize=256, ttl=300.0)
+    MAX_PAGE_SIZE: int = 100
 
     @route('/')
     def index(self):
@@ -51,13 +59,13 @@ class MenuController(FlaskView):
             data generated from the Menu class.
         """
         menu = Menu()
-        combo = Combo()
-        discount = combo.get_discount()
+        snapshot = MenuCatalog.snapshot()
+        discount = Combo.get_discount()
         return render_template("menu.html",
-                               wraps=menu.wraps(),
+                               wraps=snapshot.wraps,
                                drinks=menu.parsed_drinks(),
                                sides=menu.parsed_sides(),
-                               combos=menu.combos(),
+                               combos=snapshot.combos,
                                discount=discount)
 
     @route('/about/')
@@ -80,12 +88,37 @@ class MenuController(FlaskView):
     @route('/search/', methods=['POST'])
     def simple_search_results(self):
         text: str = request.form.get('text', None)
-        items: List[Item] = Menu.fullmenu()
-        items = Menu.filter_keywords(items, text)
-        return render_template(
+        snapshot = MenuCatalog.snapshot()
+        key = SearchCache.normalize(snapshot, MenuQuery(text=text))
+
+        def compute() -> Tuple[List[Item], bool]:
+            found = Menu.filter_keywords(snapshot.items, text)
+            if len(found) == 0 and text:
+                return Menu.search_ranked(snapshot.items, text), True
+            return found, False
+
+        items, suggested = MenuController.cache.get_or_compute(
+            ("search", snapshot.version, key.text), compute)
+        page_size = MenuController.__page_size()
+        page = SearchPage.paginate(items, snapshot.version,
+                                   request.form.get('cursor'), page_size)
+        return stream_template(
             "search.html",
             text=text,
-            items=items)
+            items=page.items,
+            page=page,
+            page_size=page_size,
+            suggested=suggested)
+
+    @route('/search/cache/', methods=['GET'])
+    def search_cache(self):
+        """Search cache action.
+
+        Returns:
+            The hit and miss counters of the
+            search cache, as JSON.
+        """
+        return jsonify(MenuController.cache.stats())
 
     @route('/advancedsearch/', methods=['GET'])
     def search(self):
@@ -93,50 +126,97 @@ class MenuController(FlaskView):
 
     @route('/advancedsearch/', methods=['POST'])
     def search_results(self):
-        text: str = request.form.get('text', None)
-        wraps: bool = request.form.get('wraps', False)
-        drinks: bool = request.form.get('drinks', False)
-        sides: bool = request.form.get('sides', False)
-        combos: bool = request.form.get('combos', False)
-        try:
-            caloriesmin: int = int(request.form.get('caloriesmin', "-1"))
-        except Exception:
-            caloriesmin = -1
-        try:
-            caloriesmax: int = int(request.form.get('caloriesmax', "-1"))
-        except Exception:
-            caloriesmax = -1
-        try:
-            pricemin: float = float(request.form.get('pricemin', "-1"))
-        except Exception:
-            pricemin = -1
-        try:
-            pricemax: float = float(request.form.get('pricemax', "-1"))
-        except Exception:
-            pricemax = -1
-        items: List[Item] = Menu.fullmenu()
-        items = Menu.filter_keywords(items, text)
-        items = Menu.filter_type_of_item(wraps, drinks,
-                                               sides, combos,
-                                               items)
-        items = Menu.filter_calories(items, caloriesmin,
-                                           caloriesmax)
-        items = Menu.filter_price(items, pricemin,
-                                        pricemax)
+        query = MenuQuery.from_form(request.form)
+        snapshot = MenuCatalog.snapshot()
+        items, facets, suggested = MenuController.__search(snapshot, query)
+        page_size = MenuController.__page_size()
+        page = SearchPage.paginate(items, snapshot.version,
+                                   request.form.get('cursor'), page_size)
         if len(items) != 0:
             search_success = True
         else:
             search_success = False
-        return render_template(
+        return stream_template(
             "advanced_search.html",
-            text=text,
-            wraps=wraps,
-            drinks=drinks,
-            sides=sides,
-            combos=combos,
-            items=items,
-            caloriesmin=("" if caloriesmin < 0 else caloriesmin),
-            caloriesmax=("" if caloriesmax < 0 else caloriesmax),
-            pricemin=("" if pricemin < 0 else pricemin),
-            pricemax=("" if pricemax < 0 else pricemax),
-            search_success=search_success)
\ No newline at end of file
+            text=query.text,
+            wraps=query.wraps,
+            drinks=query.drinks,
+            sides=query.sides,
+            combos=query.combos,
+            items=page.items,
+            page=page,
+            page_size=page_size,
+            facets=facets,
+            suggested=suggested,
+            caloriesmin=("" if query.caloriesmin < 0 else query.caloriesmin),
+            caloriesmax=("" if query.caloriesmax < 0 else query.caloriesmax),
+            pricemin=("" if query.pricemin < 0 else query.pricemin),
+            pricemax=("" if query.pricemax < 0 else query.pricemax),
+            search_success=search_success)
+
+    @route('/advancedsearch/facets/', methods=['POST'])
+    def search_facets(self):
+        """Search facets action.
+
+        Called by the kiosk while the customer
+        changes the advanced search form.
+
+        Returns:
+            The facet counts for the submitted
+            form, as JSON.
+        """
+        items, facets, suggested = MenuController.__search(
+            MenuCatalog.snapshot(), MenuQuery.from_form(request.form))
+        return jsonify(count=0 if suggested else len(items),
+                       types=facets.types,
+                       prices=facets.prices, calories=facets.calories)
+
+    @staticmethod
+    def __search(snapshot: MenuSnapshot,
+                 query: MenuQuery) -> Tuple[List[Item], SearchFacets, bool]:
+        """Advanced search method.
+
+        Runs the search through the search cache.
+        When the keywords match nothing exactly,
+        the closest items meeting the rest of the
+        criteria are suggested instead.
+
+        Args:
+            snapshot: The catalog snapshot to search.
+            query: The search criteria.
+
+        Returns:
+            A tuple of the matching items, the facet
+            counts and whether the items are
+            suggestions.
+        """
+        normalized = SearchCache.normalize(snapshot, query)
+
+        def compute() -> Tuple[List[Item], SearchFacets, bool]:
+            ids, facets = QueryPlanner.plan_with_facets(snapshot, query)
+            suggested = False
+            if len(ids) == 0 and query.text:
+                candidates = set(QueryPlanner.plan(
+                    snapshot, query._replace(text="")))
+                ids = [i for i, _ in snapshot.fuzzy_index.search(
+                    query.text, candidates=candidates)]
+                suggested = len(ids) != 0
+            return [snapshot.items[i] for i in ids], facets, suggested
+
+        return MenuController.cache.get_or_compute(
+            ("advancedsearch", snapshot.version, normalized), compute)
+
+    @staticmethod
+    def __page_size() -> int:
+        """Page size method.
+
+        Returns:
+            The page size asked for by the form,
+            kept between 1 and MAX_PAGE_SIZE, or
+            the SEARCH_PAGE_SIZE setting of the app.
+        """
+        try:
+            size = int(request.form.get('page_size', ''))
+        except ValueError:
+            size = current_app.config.get('SEARCH_PAGE_SIZE', 25)
+        return max(1, min(size, MenuController.MAX_PAGE_SIZE))
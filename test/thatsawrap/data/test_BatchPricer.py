@@ -0,0 +1,156 @@
+"""The Tests for the BatchPricer class.
+
+This file contains a number of unit tests
+used to verify that the BatchPricer class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import datetime
+from src.thatsawrap.data.order.BatchPricer import BatchPricer
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.order.PromotionEngine import (Promotion,
+                                                       PromotionEngine)
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def keep_order_numbers():
+    """Puts the order number back after each test.
+
+    Other tests expect order numbers to start
+    from where the application left them.
+    """
+    single = OrderNumberSingleton()
+    before = single.next_order_number
+    yield
+    PromotionEngine.set_promotions([])
+    PromotionEngine.set_clock(None)
+    single.next_order_number = before
+
+
+def mixed_orders():
+    """Makes orders to price.
+
+    Returns:
+        A list of orders with combos, custom
+        items, partial combos, quantities and
+        tax rates.
+    """
+    items = Menu.fullmenu()
+    orders = list()
+    for n in range(60):
+        order = Order()
+        for k in range(n % 7):
+            order.add_items(items[(n * 3 + k) % len(items)], k + 1)
+        if n % 5 == 0:
+            order.add_item(CustomItem("Catering", 3.335, 10))
+        if n % 4 == 0:
+            order.add_items(ComboBuilder.build_combo("Spicy"), n % 3 + 1)
+        if n % 6 == 0:
+            partial = Combo("Partial")
+            partial.wrap = Spartacus()
+            order.add_item(partial)
+        if n % 9 == 0:
+            order.tax_rate = 0.0725
+        orders.append(order)
+    return orders
+
+
+class TestBatchPricer:
+    """BatchPricer class test class.
+
+    This class contains all of the unit
+    tests for BatchPricer.
+    """
+    def test_table_matches_items(self):
+        """Test the price table.
+
+        This test verifies that the table holds
+        the price of each item in cents.
+        """
+        pricer = BatchPricer()
+        for item in Menu.wraps() + Menu.drinks() + Menu.sides():
+            variant = (list(Shell).index(item.shell) if hasattr(item, "shell")
+                       else list(type(item.size)).index(item.size))
+            assert (pricer.table[pricer.code_of(item), variant] ==
+                    item.price_cents)
+
+    def test_totals_match_orders(self):
+        """Test batch totals.
+
+        This test verifies that every order is
+        priced the same as Order prices it,
+        including combos, custom items, empty
+        orders and quantities.
+        """
+        orders = mixed_orders()
+        totals = BatchPricer().price_orders(orders)
+        assert list(totals.subtotal_cents) == [
+            order.subtotal_cents for order in orders]
+        assert list(totals.tax_cents) == [order.tax_cents for order in orders]
+        assert list(totals.total_cents) == [
+            order.total_cents for order in orders]
+
+    def test_no_orders(self):
+        """Test an empty batch.
+
+        This test verifies that pricing no orders
+        gives empty totals.
+        """
+        totals = BatchPricer().price_orders(list())
+        assert len(totals.total_cents) == 0
+
+    def test_promotions_match_orders(self):
+        """Test batch totals with promotions.
+
+        This test verifies that promotions are
+        taken off each order as Order takes them
+        off, with percents, buy one get one pooled
+        across lines and happy hours.
+        """
+        PromotionEngine.set_promotions([
+            Promotion.happy_hour("Happy Hour", 50, datetime.time(16),
+                                 datetime.time(18), KingKong),
+            Promotion.bogo("Sides", SnowWhite, buy=2, percent=50),
+            Promotion.bogo("Drinks", Drink),
+            Promotion.percent_off("Combos", 15, Combo),
+            Promotion.percent_off("Everything", 10),
+        ])
+        orders = mixed_orders()
+        pricer = BatchPricer()
+        for hour in (12, 17):
+            PromotionEngine.set_clock(lambda: datetime.time(hour))
+            totals = pricer.price_orders(orders)
+            assert sum(order.discount_cents for order in orders) > 0
+            assert list(totals.subtotal_cents) == [
+                order.subtotal_cents for order in orders]
+            assert list(totals.total_cents) == [
+                order.total_cents for order in orders]
+
+    def test_percent_off(self):
+        """Test a percent off.
+
+        This test verifies that a percent off is
+        taken off the batch total.
+        """
+        PromotionEngine.set_promotions(
+            [Promotion.percent_off("Sides 10%", 10, Side)])
+        order = Order()
+        order.add_item(Spartacus())
+        order.add_items(SnowWhite(), 2)
+        totals = BatchPricer().price_orders([order])
+        assert order.discount_cents == 2 * 15
+        assert totals.total_cents[0] == order.total_cents
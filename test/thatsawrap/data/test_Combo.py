@@ -13,6 +13,8 @@ from src.thatsawrap.data.wraps.Wrap import Wrap
 from src.thatsawrap.data.drinks.Drink import Drink
 from src.thatsawrap.data.sides.Side import Side
 from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.enums.Size import Size
 import pytest
 from unittest.mock import patch, PropertyMock
 
@@ -402,3 +404,84 @@ class TestCombo:
         combo = Combo()
         god = TheGodFather()
         assert not god == combo
+
+    def test_price_cents_takes_discount_in_cents(self):
+        """Test combo cents.
+
+        This test verifies that a full combo costs
+        its items in cents less the discount in
+        cents, and a partial combo gets no discount.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        cents = sum(item.price_cents for item in combo.items_in_combo)
+        assert combo.price_cents == cents - Combo.get_discount_cents()
+        assert combo.price == combo.price_cents / 100
+        combo.side = None
+        assert combo.price_cents == combo.wrap.price_cents + \
+            combo.drink.price_cents
+
+    def test_derived_values_follow_items(self):
+        """Test kept values.
+
+        This test verifies that the price,
+        calories, instructions and items of a combo
+        change when an item in it changes, when an
+        item is swapped and when it is renamed.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        price = combo.price_cents
+        calories = combo.calories
+        combo.drink.size = Size.BLOCKBUSTER
+        assert combo.price_cents > price
+        assert combo.price_cents == sum(
+            item.price_cents for item in combo.items_in_combo) - \
+            Combo.get_discount_cents()
+        assert combo.calories == sum(
+            item.calories for item in combo.items_in_combo)
+        drink = ForrestGump()
+        combo.drink = drink
+        assert drink in combo.items_in_combo
+        assert combo.calories == calories - \
+            ComboBuilder.build_combo("Classic").drink.calories + \
+            drink.calories
+        combo.name = "Renamed"
+        assert combo.instructions[0] == "Renamed"
+        combo.items_in_combo.clear()
+        assert len(combo.items_in_combo) == 3
+
+    def test_derived_values_follow_discount(self):
+        """Test kept values and the discount.
+
+        This test verifies that the price and
+        instructions of a combo change when the
+        discount does.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        price = combo.price_cents
+        try:
+            Combo.set_discount(1.5)
+            assert combo.price_cents == price + 95 - 150
+            assert "$1.5 Discount Applied" in combo.instructions
+        finally:
+            Combo.set_discount(.95)
+        assert combo.price_cents == price
+
+    def test_derived_values_are_kept(self):
+        """Test that values are kept.
+
+        This test verifies that the items of a
+        combo are not asked for their price again
+        until something changes.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        combo.price_cents
+        with patch.object(type(combo.wrap), "price",
+                          new_callable=PropertyMock) as price:
+            price.return_value = 1.0
+            combo.price_cents
+            combo.calories
+            combo.instructions
+            assert price.call_count == 0
+            combo.wrap.shell = combo.wrap.shell
+            combo.price_cents
+            assert price.call_count == 1
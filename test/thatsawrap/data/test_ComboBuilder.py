@@ -18,6 +18,9 @@ from src.thatsawrap.data.drinks.ForrestGump import ForrestGump
 from src.thatsawrap.data.sides.TheFrenchConnection import TheFrenchConnection
 from src.thatsawrap.data.sides.YankeeDoodleDandy import YankeeDoodleDandy
 from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Size import Size
+from unittest.mock import patch
 import pytest
 
 
@@ -89,3 +92,77 @@ class TestComboBuilder:
         """
         with pytest.raises(Exception):
             bad = ComboBuilder().build_combo("bad")
+
+    def test_clones_share_until_handed_out(self):
+        """Test copy-on-write clones.
+
+        This test verifies that clones share the
+        items of the prototype, with their values
+        and key, until an item is handed out, and
+        then only change their own copy.
+        """
+        first = ComboBuilder.build_combo("Classic")
+        second = ComboBuilder.build_combo("Classic")
+        assert first is not second
+        assert first._Combo__wrap is second._Combo__wrap
+        assert first == second
+        assert first.price_cents == second.price_cents
+        assert first._Combo__wrap is second._Combo__wrap
+        wrap = first.wrap
+        assert wrap is not second._Combo__wrap
+        assert first.items_in_combo[0] is wrap
+        wrap.add_addin(Addin.PICKLES)
+        assert first != second
+        assert Addin.PICKLES in first.wrap.addins
+        assert Addin.PICKLES not in second.wrap.addins
+        assert ComboBuilder.build_combo("Classic") == second
+
+    def test_prototypes_unchanged(self):
+        """Test changing the items of a clone.
+
+        This test verifies that changing items
+        handed out by a clone, by its getters or
+        its list of items, leaves later combos of
+        the same name as they were.
+        """
+        before = ComboBuilder.build_combo("Classic").instructions
+        combo = ComboBuilder.build_combo("Classic")
+        combo.wrap.pepperoni = False
+        combo.wrap.sausage = False
+        combo.items_in_combo[2].size = Size.BLOCKBUSTER
+        combo.drink.size = Size.BLOCKBUSTER
+        assert "Hold Pepperoni" in combo.wrap.instructions
+        again = ComboBuilder.build_combo("Classic")
+        assert again.instructions == before
+        assert again != combo
+        assert again.wrap.pepperoni and again.wrap.sausage
+        assert again.drink.size == again.side.size != Size.BLOCKBUSTER
+
+    def test_setting_an_item_on_a_clone(self):
+        """Test setting an item on a clone.
+
+        This test verifies that an item set on a
+        clone is kept as given, and the other
+        items are its own.
+        """
+        combo = ComboBuilder.build_combo("Green")
+        shared = combo._Combo__drink
+        wrap = Spartacus()
+        combo.wrap = wrap
+        assert combo.wrap is wrap
+        assert combo.drink is not shared
+        assert combo.drink == shared
+
+    def test_items_built_once(self):
+        """Test prototypes.
+
+        This test verifies that items are only
+        constructed for the prototype.
+        """
+        ComboBuilder.build_combo("Hungry")
+        with patch.object(Spartacus, "__init__", autospec=True,
+                          side_effect=Spartacus.__init__) as init:
+            for _ in range(5):
+                ComboBuilder.build_combo("Hungry").wrap.add_addin(
+                    Addin.PICKLES)
+            assert init.call_count == 0
@@ -0,0 +1,134 @@
+"""The Tests for the ComboOptimizer class.
+
+This file contains a number of unit tests
+used to verify that the ComboOptimizer class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import itertools
+import random
+from src.thatsawrap.data.order.ComboOptimizer import ComboOptimizer
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+import pytest
+
+
+def brute_force(optimizer, budget, calories, k, goal):
+    """Scores every combo.
+
+    Args:
+        optimizer: The optimizer with the options.
+        budget: The budget in cents.
+        calories: The calorie limit.
+        k: How many scores to keep.
+        goal: The goal of the search.
+
+    Returns:
+        The best k scores of combos within
+        the limits.
+    """
+    discount = Combo.get_discount_cents()
+    scores = list()
+    for parts in itertools.product(*optimizer.options):
+        price = sum(part.price_cents for part in parts) - discount
+        energy = sum(part.calories for part in parts)
+        if price <= budget and energy <= calories:
+            scores.append((energy, -price) if goal == ComboOptimizer.CALORIES
+                          else (-price, energy))
+    return sorted(scores, reverse=True)[:k]
+
+
+class TestComboOptimizer:
+    """ComboOptimizer class test class.
+
+    This class contains all of the unit
+    tests for ComboOptimizer.
+    """
+    def test_options_cover_menu(self):
+        """Test the option tables.
+
+        This test verifies that every wrap comes
+        in every shell and every drink and side in
+        every size, priced as the item is.
+        """
+        wraps, drinks, sides = ComboOptimizer().options
+        assert len(wraps) == 5 * len(Shell)
+        assert len(drinks) == 3 * len(Size)
+        assert len(sides) == 3 * len(Size)
+        for option in wraps + drinks + sides:
+            item = option.build()
+            assert item.price_cents == option.price_cents
+            assert item.calories == option.calories
+
+    def test_matches_brute_force(self):
+        """Test the search.
+
+        This test verifies that the best combos
+        found score the same as the best of every
+        combo, for both goals.
+        """
+        optimizer = ComboOptimizer()
+        chance = random.Random(7)
+        for _ in range(200):
+            budget = chance.randint(1000, 4000)
+            calories = chance.randint(1000, 4000)
+            k = chance.randint(1, 15)
+            goal = chance.choice([ComboOptimizer.CALORIES,
+                                  ComboOptimizer.PRICE])
+            found = optimizer.best(budget, calories, k, goal)
+            scores = [(choice.calories, -choice.price_cents)
+                      if goal == ComboOptimizer.CALORIES
+                      else (-choice.price_cents, choice.calories)
+                      for choice in found]
+            assert scores == brute_force(optimizer, budget, calories, k,
+                                         goal)
+
+    def test_choices_build_combos(self):
+        """Test built combos.
+
+        This test verifies that a choice builds a
+        full combo with its price and calories.
+        """
+        for choice in ComboOptimizer().best(2500, 3000, 5):
+            combo = choice.build()
+            assert combo.price_cents == choice.price_cents <= 2500
+            assert combo.calories == choice.calories <= 3000
+            assert combo.wrap.shell == choice.wrap.variant
+
+    def test_follows_discount(self):
+        """Test the discount.
+
+        This test verifies that the discount in
+        use is taken off the price.
+        """
+        optimizer = ComboOptimizer()
+        before = optimizer.best(5000, 5000, 1)[0]
+        try:
+            Combo.set_discount(2.0)
+            after = optimizer.best(5000, 5000, 1)[0]
+        finally:
+            Combo.set_discount(.95)
+        assert after.price_cents == before.price_cents + 95 - 200
+
+    def test_nothing_fits(self):
+        """Test limits too low.
+
+        This test verifies that no combos are
+        found when none fit the limits.
+        """
+        assert ComboOptimizer().best(100, 5000) == []
+        assert ComboOptimizer().best(5000, 100) == []
+
+    def test_bad_arguments(self):
+        """Test bad arguments.
+
+        This test verifies that a k less than one
+        or an unknown goal raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            ComboOptimizer().best(2000, 2000, 0)
+        with pytest.raises(ValueError):
+            ComboOptimizer().best(2000, 2000, 3, "taste")
@@ -0,0 +1,203 @@
+"""The Tests for the ComboPackager class.
+
+This file contains a number of unit tests
+used to verify that the ComboPackager class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import time
+from src.thatsawrap.data.order.ComboPackager import ComboPackager
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.order.PromotionEngine import (Promotion,
+                                                       PromotionEngine)
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.wraps.Wrap import Wrap
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.SinginInTheRain import SinginInTheRain
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.drinks.ForrestGump import ForrestGump
+from src.thatsawrap.data.sides.TheFrenchConnection import TheFrenchConnection
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def keep_order_numbers():
+    """Puts the order number back after each test.
+
+    Other tests expect order numbers to start
+    from where the application left them.
+    """
+    single = OrderNumberSingleton()
+    before = single.next_order_number
+    yield
+    PromotionEngine.set_promotions([])
+    single.next_order_number = before
+
+
+class TestComboPackager:
+    """ComboPackager class test class.
+
+    This class contains all of the unit
+    tests for ComboPackager.
+    """
+    def test_plan_takes_fewest_kind(self):
+        """Test the plan.
+
+        This test verifies that as many combos
+        are planned as the fewest of wraps, drinks
+        and sides, in the order they were added.
+        """
+        order = Order()
+        wraps = [Spartacus(), TheGodFather(), Spartacus()]
+        drinks = [KingKong(), SinginInTheRain()]
+        for item in wraps + drinks + [SnowWhite(), SnowWhite(),
+                                      SnowWhite()]:
+            order.add_item(item)
+        plan = ComboPackager.plan(order)
+        assert len(plan) == 2
+        assert plan[0][0] is wraps[0] and plan[1][0] is wraps[1]
+        assert plan[1][1] is drinks[1]
+
+    def test_repackage_saves_discount(self):
+        """Test repackaging.
+
+        This test verifies that repackaging takes
+        the discount off for each combo made and
+        keeps the leftover items loose.
+        """
+        order = Order()
+        leftover = KingKong()
+        for item in [Spartacus(), KingKong(), SnowWhite(), leftover,
+                     CustomItem("Cookie", 1.0, 100)]:
+            order.add_item(item)
+        before = order.subtotal_cents
+        assert ComboPackager.savings_cents(order) == \
+            Combo.get_discount_cents()
+        done = ComboPackager.repackage(order)
+        assert len(done) == 1
+        assert order.subtotal_cents == before - Combo.get_discount_cents()
+        assert leftover in order
+        assert done[0].combo in order
+        assert done[0].wrap not in order
+        assert len(order) == 3
+        assert ComboPackager.plan(order) == []
+
+    def test_quantities(self):
+        """Test lines with quantities.
+
+        This test verifies that lines with a
+        quantity give one unit to each combo.
+        """
+        order = Order()
+        order.add_items(Spartacus(), 3)
+        order.add_items(KingKong(), 2)
+        order.add_items(SnowWhite(), 2)
+        before = order.subtotal_cents
+        done = ComboPackager.repackage(order)
+        assert len(done) == 2
+        assert done[0].wrap is not done[1].wrap
+        assert order.quantity == 3
+        assert order.subtotal_cents == \
+            before - 2 * Combo.get_discount_cents()
+
+    def test_menu_combo_named(self):
+        """Test naming.
+
+        This test verifies that a combo made of
+        the items of a menu combo gets its name,
+        and any other is left unnamed.
+        """
+        order = Order()
+        for item in [TheGodFather(), SinginInTheRain(),
+                     TheFrenchConnection()]:
+            order.add_item(item)
+        combo = ComboPackager.repackage(order)[0].combo
+        assert combo == ComboBuilder.build_combo("Classic")
+        drink = SinginInTheRain()
+        drink.size = Size.STUDIO
+        assert ComboPackager.name_of(TheGodFather(), drink,
+                                     TheFrenchConnection()) is None
+
+    def test_combos_left_alone(self):
+        """Test combos already in the order.
+
+        This test verifies that items in combos
+        are not taken for new combos.
+        """
+        order = Order()
+        order.add_item(ComboBuilder.build_combo("Green"))
+        order.add_item(Spartacus())
+        order.add_item(KingKong())
+        assert ComboPackager.repackage(order) == []
+
+    def test_large_order_is_fast(self):
+        """Test a group order.
+
+        This test verifies that a large order is
+        repackaged in one pass.
+        """
+        order = Order()
+        for _ in range(2000):
+            order.add_item(Spartacus())
+            order.add_item(KingKong())
+            order.add_item(SnowWhite())
+        start = time.perf_counter()
+        done = ComboPackager.repackage(order)
+        assert time.perf_counter() - start < 2
+        assert len(done) == 2000
+        assert len(order) == 2000
+
+    @pytest.mark.parametrize("promotion", [
+        Promotion.bogo("BOGO wraps", Wrap),
+        Promotion.percent_off("Drinks half off", 50, Drink),
+    ])
+    def test_promotions_worth_more(self, promotion):
+        """Test promotions worth more than a combo.
+
+        This test verifies that items are left
+        loose when a combo would lose a promotion
+        worth more than the combo discount.
+
+        Args:
+            promotion: A promotion the items lose
+            in a combo.
+        """
+        PromotionEngine.set_promotions([promotion])
+        order = Order()
+        order.add_items(Spartacus(), 2)
+        order.add_item(ForrestGump())
+        order.add_item(SnowWhite())
+        before = order.subtotal_cents
+        assert ComboPackager.savings_cents(order) == 0
+        assert ComboPackager.repackage(order) == []
+        assert order.subtotal_cents == before
+        assert order.quantity == 4
+
+    def test_promotions_worth_less(self):
+        """Test promotions worth less than a combo.
+
+        This test verifies that a combo is still
+        made when it saves more than the promotion
+        its items lose, and that the savings are
+        what comes off the order.
+        """
+        PromotionEngine.set_promotions(
+            [Promotion.percent_off("Sides 10%", 10, Side)])
+        order = Order()
+        for item in [Spartacus(), KingKong(), SnowWhite()]:
+            order.add_item(item)
+        before = order.subtotal_cents
+        savings = ComboPackager.savings_cents(order)
+        assert 0 < savings < Combo.get_discount_cents()
+        assert len(ComboPackager.repackage(order)) == 1
+        assert order.subtotal_cents == before - savings
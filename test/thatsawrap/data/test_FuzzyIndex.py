@@ -0,0 +1,94 @@
+"""The Tests for the FuzzyIndex class.
+
+This file contains a number of unit tests
+used to verify that the FuzzyIndex class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.FuzzyIndex import FuzzyIndex
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+import pytest
+
+
+class TestFuzzyIndex:
+    """FuzzyIndex class test class.
+
+    This class contains all of the unit
+    tests for FuzzyIndex.
+    """
+    def test_similarity(self):
+        """Test similarity.
+
+        This test verifies that similarity is
+        one for equal words, zero for unrelated
+        words and in between for misspellings.
+        """
+        assert FuzzyIndex.similarity("kong", "kong") == 1.0
+        assert FuzzyIndex.similarity("kong", "fries") == 0.0
+        assert 0.5 < FuzzyIndex.similarity("godfathr", "godfather") < 1.0
+        assert FuzzyIndex.trigrams("ab") == {"  a", " ab", "ab "}
+
+    @pytest.mark.parametrize("keywords, name", [
+        ("godfathr", "The Godfather"),
+        ("spartakus", "Spartacus"),
+        ("KING kongg", "King Kong"),
+        ("snow wite", "Snow White"),
+    ])
+    def test_misspellings_rank_first(self, keywords, name):
+        """Test misspelled keywords.
+
+        Args:
+            keywords: The misspelled keywords.
+            name: The name of the item that
+            should rank first.
+        """
+        items = [TheGodFather(), Spartacus(), KingKong(), SnowWhite()]
+        results = FuzzyIndex(items).search(keywords)
+        assert items[results[0][0]].name == name
+
+    def test_ingredients_are_searched(self):
+        """Test ingredient words.
+
+        This test verifies that ingredients match,
+        but count for less than names.
+        """
+        items = [TheGodFather(), Spartacus(), KingKong()]
+        results = FuzzyIndex(items).search("bufalo")
+        assert [i for i, _ in results] == [1]
+        assert results[0][1] < 1.0
+
+    def test_top_k_and_candidates(self):
+        """Test limits.
+
+        This test verifies that at most k
+        results are given, best first, and only
+        from the candidates.
+        """
+        index = MenuCatalog.snapshot().fuzzy_index
+        results = index.search("kong the", k=3)
+        assert len(results) == 3
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+        only = index.search("kong the", candidates={0})
+        assert [i for i, _ in only] in ([0], [])
+        assert index.search("zzqx") == []
+        assert index.search(None) == []
+
+    def test_search_ranked(self):
+        """Test Menu.search_ranked.
+
+        This test verifies that the snapshot and
+        a copy of its items rank alike.
+        """
+        snapshot = MenuCatalog.snapshot()
+        ranked = Menu.search_ranked(snapshot.items, "wizzard", 5)
+        assert ranked[0].name == "The Wizard of Oz"
+        assert ranked == Menu.search_ranked(list(snapshot.items),
+                                            "wizzard", 5)
@@ -0,0 +1,219 @@
+"""The Tests for the Item class.
+
+This file contains a number of unit tests
+used to verify that the structural keys and
+hashes of items are working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import copy
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+
+
+class TestItem:
+    """Item class test class.
+
+    This class contains all of the unit
+    tests for the keys and hashes of items.
+    """
+    def test_equal_items_hash_equal(self):
+        """Test equal items.
+
+        This test verifies that two new items of
+        each class on the menu are equal, hash
+        the same and have the same key.
+        """
+        for item in Menu.fullmenu():
+            if isinstance(item, Combo):
+                other = ComboBuilder.build_combo(item.name)
+            else:
+                other = type(item)()
+                if hasattr(item, "size"):
+                    other.size = item.size
+            assert other == item
+            assert hash(other) == hash(item)
+            assert other.key == item.key
+
+    def test_different_classes_differ(self):
+        """Test items of different classes.
+
+        This test verifies that items of different
+        classes have different keys.
+        """
+        keys = {type(item)().key for item in Menu.wraps() + Menu.drinks()
+                + Menu.sides()}
+        assert len(keys) == 11
+
+    def test_setter_changes_key(self):
+        """Test setters.
+
+        This test verifies that a setter changes
+        the epoch and key of an item, and setting
+        it back restores the key.
+        """
+        drink = KingKong()
+        key = drink.key
+        epoch = drink.epoch
+        drink.size = Size.BLOCKBUSTER
+        assert drink.epoch > epoch
+        assert drink.key != key
+        drink.size = Size.INDIE
+        assert drink.key == key
+        drink.mango = True
+        assert drink.key != key
+
+    def test_addins_change_key(self):
+        """Test addins.
+
+        This test verifies that adding and
+        removing addins changes the key.
+        """
+        wrap = Spartacus()
+        key = wrap.key
+        wrap.remove_addin(Addin.PICKLES)
+        assert wrap.key != key
+        wrap.add_addin(Addin.PICKLES)
+        assert wrap.key == key
+        wrap.add_addin(Addin.MUSTARD)
+        assert wrap.key != key
+        assert Addin.MUSTARD in wrap.addins
+
+    def test_key_is_cached(self):
+        """Test caching.
+
+        This test verifies that the key is not
+        made again until the item changes.
+        """
+        wrap = Spartacus()
+        assert wrap.key is wrap.key
+        key = wrap.key
+        wrap.shell = Shell.STROMBOLI
+        assert wrap.key is not key
+
+    def test_items_in_sets(self):
+        """Test sets and dicts.
+
+        This test verifies that equal items are
+        kept once in a set and find each other
+        in a dict.
+        """
+        items = {SnowWhite(), SnowWhite(), KingKong()}
+        assert len(items) == 2
+        prices = {Spartacus(): 1}
+        assert prices[Spartacus()] == 1
+
+    def test_combo_key_follows_items(self):
+        """Test combos.
+
+        This test verifies that changing an item
+        in a combo changes the key of the combo.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        other = ComboBuilder.build_combo("Classic")
+        assert hash(combo) == hash(other)
+        key = combo.key
+        epoch = combo.epoch
+        combo.wrap.add_addin(Addin.MUSTARD)
+        assert combo.epoch > epoch
+        assert combo.key != key
+        assert combo != other
+        combo.wrap = other.wrap
+        assert combo.key == key
+        combo.name = "Other"
+        assert combo.key != key
+
+    def test_custom_items(self):
+        """Test custom items.
+
+        This test verifies that custom items are
+        keyed by name, price and calories.
+        """
+        assert CustomItem("Cookie", 1.0, 100).key == \
+            CustomItem("Cookie", 1.0, 100).key
+        assert CustomItem("Cookie", 1.0, 100).key != \
+            CustomItem("Cookie", 1.5, 100).key
+
+    def test_items_have_slots(self):
+        """Test slots.
+
+        This test verifies that wraps, drinks and
+        sides keep no __dict__, and that a copy is
+        equal and keeps the epoch and key.
+        """
+        for item in Menu.wraps() + Menu.drinks() + Menu.sides():
+            assert not hasattr(item, "__dict__")
+            item.key
+            clone = copy.copy(item)
+            assert clone == item
+            assert clone.epoch == item.epoch
+            assert clone.key is item.key
+
+    def test_options_are_independent(self):
+        """Test packed options.
+
+        This test verifies that each topping,
+        flavor and addin of each item is packed
+        into its own bit, so that changing one
+        leaves the others as they were.
+        """
+        for item in Menu.wraps() + Menu.drinks():
+            kind = type(item)
+            names = [name for name in dir(kind)
+                     if isinstance(getattr(kind, name), property) and
+                     getattr(kind, name).fset is not None and
+                     name not in ("shell", "size")]
+            before = {name: getattr(item, name) for name in names}
+            expected = copy.copy(item)
+            addins = getattr(item, "addins", set())
+            for name in names:
+                setattr(item, name, not before[name])
+                for other in names:
+                    assert getattr(item, other) == (
+                        before[other] != (other == name))
+                assert getattr(item, "addins", set()) == addins
+                setattr(item, name, before[name])
+            assert item == expected
+
+    def test_same_configuration_shares_key(self):
+        """Test interned keys.
+
+        This test verifies that items with the
+        same configuration share one key.
+        """
+        wrap = Spartacus()
+        wrap.add_addin(Addin.MUSTARD)
+        other = Spartacus()
+        other.add_addin(Addin.MUSTARD)
+        assert wrap.key is other.key
+
+    def test_shared_keys_are_bounded(self, monkeypatch):
+        """Test the shared key table.
+
+        This test verifies that once the table of
+        shared keys is full, new configurations
+        are keyed without being kept.
+        """
+        keys = Item._Item__keys
+        monkeypatch.setattr(Item, "SHARED_KEYS", len(keys))
+        before = len(keys)
+        for size in Size:
+            for flavors in range(16):
+                drink = KingKong()
+                drink.size = size
+                drink.banana = bool(flavors & 1)
+                drink.strawberry = bool(flavors & 2)
+                drink.peach = bool(flavors & 4)
+                drink.mango = bool(flavors & 8)
+                hash(drink)
+        assert len(keys) == before
@@ -0,0 +1,238 @@
+"""The Tests for the ItemCodec class.
+
+This file contains a number of unit tests
+used to verify that the ItemCodec class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import itertools
+import json
+from src.thatsawrap.data.order.ItemCodec import ItemCodec
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.menu.Item import Item
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuDocument import MenuDocument
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.wraps.Wrap import Wrap
+from src.thatsawrap.data.drinks.KingKong import KingKong
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def keep_order_numbers():
+    """Puts the order number back after each test.
+
+    Other tests expect order numbers to start
+    from where the application left them.
+    """
+    single = OrderNumberSingleton()
+    before = single.next_order_number
+    yield
+    single.next_order_number = before
+
+
+class TestItemCodec:
+    """ItemCodec class test class.
+
+    This class contains all of the unit
+    tests for ItemCodec.
+    """
+    def test_every_class_has_a_code(self):
+        """Test the type codes.
+
+        This test verifies that every wrap, drink
+        and side on the menu has a type code and
+        that its flags are its settable booleans.
+        """
+        for item in Menu.wraps() + Menu.drinks() + Menu.sides():
+            code = ItemCodec.CODES[type(item)]
+            flags = ItemCodec.TYPES[code][1]
+            assert len(set(flags)) == len(flags)
+            for name in flags:
+                assert isinstance(getattr(item, name), bool)
+
+    def test_menu_items_round_trip(self):
+        """Test menu items.
+
+        This test verifies that every item on the
+        menu decodes equal to itself.
+        """
+        for item in Menu.fullmenu():
+            copy = ItemCodec.decode(ItemCodec.encode(item))
+            assert type(copy) is type(item)
+            assert copy == item
+            assert copy.price_cents == item.price_cents
+
+    def test_every_flag_round_trips(self):
+        """Test toppings and flavors.
+
+        This test verifies that every combination
+        of toppings and flavors decodes the same.
+        """
+        for code, (kind, names) in ItemCodec.TYPES.items():
+            for values in itertools.product((False, True),
+                                            repeat=len(names)):
+                item = kind()
+                for name, value in zip(names, values):
+                    setattr(item, name, value)
+                copy = ItemCodec.decode(ItemCodec.encode(item))
+                assert copy == item
+                for name, value in zip(names, values):
+                    assert getattr(copy, name) is value
+
+    def test_shells_sizes_and_addins(self):
+        """Test enums and addins.
+
+        This test verifies that shells, sizes and
+        addins decode the same.
+        """
+        wrap = Spartacus()
+        for shell in Shell:
+            wrap.shell = shell
+            wrap.remove_addin(Addin.PICKLES)
+            wrap.add_addin(Addin.MUSTARD)
+            copy = ItemCodec.decode(ItemCodec.encode(wrap))
+            assert copy.shell == shell
+            assert copy.addins == wrap.addins
+        drink = KingKong()
+        for size in Size:
+            drink.size = size
+            assert ItemCodec.decode(ItemCodec.encode(drink)).size == size
+
+    def test_items_set_once(self, monkeypatch):
+        """Test decoding without setters.
+
+        This test verifies that a decoded item
+        has its state set in one step, moving its
+        epoch on once, and keys the same as the
+        item encoded.
+        """
+        wrap = Spartacus()
+        wrap.cheese = False
+        wrap.add_addin(Addin.MUSTARD)
+        data = ItemCodec.encode(wrap)
+        # The first decode fills the tables of options.
+        ItemCodec.decode(data)
+        calls = list()
+        setter = Item.__setattr__
+
+        def counting(item, name, value):
+            calls.append(name)
+            setter(item, name, value)
+
+        monkeypatch.setattr(Item, "__setattr__", counting)
+        copy = ItemCodec.decode(data)
+        assert calls == ["_options"]
+        assert copy.epoch != 0
+        assert copy.key == wrap.key
+
+    def test_combo_round_trip(self):
+        """Test combos.
+
+        This test verifies that named, unnamed
+        and partial combos decode the same.
+        """
+        classic = ComboBuilder.build_combo("Classic")
+        assert ItemCodec.decode(ItemCodec.encode(classic)) == classic
+        partial = Combo()
+        partial.drink = KingKong()
+        copy = ItemCodec.decode(ItemCodec.encode(partial))
+        assert copy == partial
+        assert copy.name is None and copy.wrap is None
+
+    def test_custom_item_round_trip(self):
+        """Test custom items.
+
+        This test verifies that custom items keep
+        their name, price in cents and calories.
+        """
+        item = CustomItem("Café Special", 3.35, 410)
+        copy = ItemCodec.decode(ItemCodec.encode(item))
+        assert copy.name == item.name
+        assert copy.price_cents == 335
+        assert copy.calories == 410
+
+    def test_order_round_trip(self):
+        """Test orders.
+
+        This test verifies that an order decodes
+        with the same number, tax rate, lines and
+        totals without taking a new number.
+        """
+        order = Order()
+        order.tax_rate = 0.09
+        order.add_items(Spartacus(), 3)
+        order.add_item(KingKong())
+        order.add_item(ComboBuilder.build_combo("Hungry"))
+        order.add_item(CustomItem("Cookie", 1.25, 200))
+        before = OrderNumberSingleton().next_order_number
+        copy = ItemCodec.decode_order(ItemCodec.encode_order(order))
+        assert OrderNumberSingleton().next_order_number == before
+        assert copy.order_number == order.order_number
+        assert copy.tax_rate == 0.09
+        assert [line.quantity for line in copy.lines] == \
+            [line.quantity for line in order.lines]
+        assert copy.total_cents == order.total_cents
+        assert copy.calories == order.calories
+
+    def test_smaller_than_json(self):
+        """Test the size of the encoding.
+
+        This test verifies that the menu takes a
+        fraction of the bytes of its JSON.
+        """
+        binary = sum(len(ItemCodec.encode(item)) for item in Menu.fullmenu())
+        text = sum(len(json.dumps(MenuDocument.item(item)))
+                   for item in Menu.fullmenu())
+        assert binary * 5 < text
+
+    def test_wrong_version(self):
+        """Test the version.
+
+        This test verifies that data of another
+        version raises a ValueError.
+        """
+        data = bytearray(ItemCodec.encode(Spartacus()))
+        data[0] = ItemCodec.VERSION + 1
+        with pytest.raises(ValueError):
+            ItemCodec.decode(bytes(data))
+        with pytest.raises(ValueError):
+            ItemCodec.decode(b"")
+
+    def test_bad_data(self):
+        """Test bad data.
+
+        This test verifies that cut short, unknown
+        or trailing data raises a ValueError.
+        """
+        data = ItemCodec.encode(ComboBuilder.build_combo("Classic"))
+        for end in range(1, len(data)):
+            with pytest.raises(ValueError):
+                ItemCodec.decode(data[:end])
+        with pytest.raises(ValueError):
+            ItemCodec.decode(data + b"\x00")
+        with pytest.raises(ValueError):
+            ItemCodec.decode(bytes([ItemCodec.VERSION, 200]))
+        with pytest.raises(ValueError):
+            ItemCodec.decode(bytes([ItemCodec.VERSION, 1, 9, 0, 0]))
+
+    def test_unknown_class(self):
+        """Test an unknown class.
+
+        This test verifies that encoding an item
+        without a type code raises a ValueError.
+        """
+        class Plain(Spartacus):
+            pass
+        with pytest.raises(ValueError):
+            ItemCodec.encode(Plain())
+        assert issubclass(Plain, Wrap)
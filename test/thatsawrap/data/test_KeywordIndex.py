@@ -0,0 +1,91 @@
+"""The Tests for the KeywordIndex class.
+
+This file contains a number of unit tests
+used to verify that the KeywordIndex class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.KeywordIndex import KeywordIndex, GramPostings
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.KingKong import KingKong
+import pytest
+
+
+class TestKeywordIndex:
+    """KeywordIndex class test class.
+
+    This class contains all of the unit
+    tests for KeywordIndex.
+    """
+    @pytest.mark.parametrize("keywords", ["god", "GOD", "the", "o",
+                                          "kong rain", "godfather",
+                                          "wizard of", "classic",
+                                          "spartacus hot", "zzz",
+                                          "a e i", "wrap  god"])
+    def test_index_matches_scan(self, keywords):
+        """Test index matches a full scan.
+
+        This test verifies that searching the
+        catalog through the index gives the same
+        items, in the same order, as scanning
+        a copy of the catalog.
+
+        Args:
+            keywords: The keywords to search for.
+        """
+        snapshot = MenuCatalog.snapshot()
+        indexed = Menu.filter_keywords(snapshot.items, keywords)
+        scanned = Menu.filter_keywords(list(snapshot.items), keywords)
+        assert indexed == scanned
+
+    def test_combo_wrap_names_are_searched(self):
+        """Test combos match on their wrap.
+
+        This test verifies that a combo is found
+        by the name of the wrap it contains.
+        """
+        snapshot = MenuCatalog.snapshot()
+        found = [snapshot.items[i] for i in
+                 snapshot.keyword_index.search("godfather")]
+        assert TheGodFather() in found
+        assert any(getattr(item, "name", None) == "Classic"
+                   for item in found)
+
+    def test_empty_query_returns_everything(self):
+        """Test empty query.
+
+        This test verifies that an empty
+        query matches every item.
+        """
+        items = [TheGodFather(), KingKong()]
+        index = KeywordIndex(items)
+        assert index.search("") == [0, 1]
+        assert index.search(None) == [0, 1]
+
+    def test_addins_are_searched_when_asked(self):
+        """Test addin matching.
+
+        This test verifies that addins only
+        match when requested.
+        """
+        items = [TheGodFather(), Spartacus(), KingKong()]
+        index = KeywordIndex(items)
+        assert index.search("buffalo") == []
+        assert index.search("buffalo", addins=True) == [1]
+
+    def test_long_keywords_are_verified(self):
+        """Test long keywords.
+
+        This test verifies that a keyword longer
+        than a gram only matches texts that
+        really contain it.
+        """
+        postings = GramPostings({0: "abcxbcd", 1: "abcd"})
+        assert postings.lookup("abcd") == [1]
+        assert postings.lookup("bc") == [0, 1]
+        assert postings.lookup("abcde") == []
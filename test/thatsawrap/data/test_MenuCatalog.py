@@ -0,0 +1,99 @@
+"""The Tests for the MenuCatalog class.
+
+This file contains a number of unit tests
+used to verify that the MenuCatalog class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.CatalogVersion import CatalogVersion
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+from src.thatsawrap.data.custom.CustomItemList import CustomItemList
+
+
+class TestMenuCatalog:
+    """MenuCatalog class test class.
+
+    This class contains all of the unit
+    tests for MenuCatalog.
+    """
+    def test_snapshot_is_reused_until_invalidated(self):
+        """Test snapshot is cached.
+
+        This test verifies that the same
+        snapshot is handed out until the
+        catalog is invalidated.
+        """
+        first = MenuCatalog.snapshot()
+        assert MenuCatalog.snapshot() is first
+        MenuCatalog.invalidate()
+        second = MenuCatalog.snapshot()
+        assert second is not first
+        assert second.version > first.version
+        assert second.version == CatalogVersion.get_version()
+
+    def test_snapshot_matches_full_menu(self):
+        """Test snapshot contents.
+
+        This test verifies that the snapshot
+        items are exactly the full menu, in
+        order, with the custom items kept apart.
+        """
+        c_item_list = CustomItemList()
+        c_item_list.__setitem__(CustomItem(name="Catalog Test", price=2.0,
+                                           calories=300))
+        try:
+            snapshot = MenuCatalog.snapshot()
+            assert snapshot.items == Menu.fullmenu()
+            assert snapshot.custom_items == list(c_item_list)
+        finally:
+            c_item_list.__delitem__(len(c_item_list) - 1)
+        assert snapshot.combos == Menu.combos()
+        assert snapshot.wraps == Menu.wraps()
+
+    def test_set_discount_invalidates_snapshot(self):
+        """Test discount invalidates.
+
+        This test verifies that changing the
+        combo discount builds a new snapshot.
+        """
+        discount = Combo.get_discount()
+        first = MenuCatalog.snapshot()
+        Combo.set_discount(discount)
+        assert MenuCatalog.snapshot() is not first
+
+    def test_set_tax_rate_invalidates_snapshot(self):
+        """Test tax rate invalidates.
+
+        This test verifies that changing the
+        tax rate builds a new snapshot.
+        """
+        rate = Order.get_tax_rate()
+        first = MenuCatalog.snapshot()
+        Order.set_tax_rate(rate)
+        assert MenuCatalog.snapshot() is not first
+
+    def test_custom_items_invalidate_snapshot(self):
+        """Test custom items invalidate.
+
+        This test verifies that adding and
+        deleting custom items builds a new
+        snapshot containing the change.
+        """
+        c_item_list = CustomItemList()
+        c_item = CustomItem(name="Catalog Test", price=2.0, calories=300)
+        first = MenuCatalog.snapshot()
+        c_item_list.__setitem__(c_item)
+        second = MenuCatalog.snapshot()
+        assert second is not first
+        assert c_item in second.custom_items
+        assert c_item not in second.items
+        c_item_list.__delitem__(len(c_item_list) - 1)
+        third = MenuCatalog.snapshot()
+        assert third is not second
+        assert c_item not in third.custom_items
@@ -0,0 +1,67 @@
+"""The Tests for the MenuDocument class.
+
+This file contains a number of unit tests
+used to verify that the MenuDocument class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import json
+from src.thatsawrap.data.menu.MenuDocument import MenuDocument
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.order.Combo import Combo
+import pytest
+
+
+class TestMenuDocument:
+    """MenuDocument class test class.
+
+    This class contains all of the unit
+    tests for MenuDocument.
+    """
+    def test_sections_match_menu(self):
+        """Test section contents.
+
+        This test verifies that each section
+        describes the items on the menu.
+        """
+        wraps = json.loads(MenuDocument.section("wraps").body)
+        assert [wrap["name"] for wrap in wraps] == [
+            wrap.name for wrap in Menu.wraps()]
+        drinks = json.loads(MenuDocument.section("drinks").body)
+        assert [len(drink["sizes"]) for drink in drinks] == [3, 3, 3]
+        menu = json.loads(MenuDocument.section("menu").body)
+        assert menu["wraps"] == wraps
+        assert menu["discount"] == Combo.get_discount()
+        assert len(menu["combos"]) == len(Menu.combos())
+
+    def test_bytes_are_reused(self):
+        """Test caching.
+
+        This test verifies that the same bytes
+        are handed out until the catalog changes,
+        and that the ETag follows the content.
+        """
+        first = MenuDocument.section("combos")
+        assert MenuDocument.section("combos") is first
+        MenuCatalog.invalidate()
+        second = MenuDocument.section("combos")
+        assert second is not first
+        assert second.etag == first.etag
+        discount = Combo.get_discount()
+        try:
+            Combo.set_discount(discount + 1)
+            assert MenuDocument.section("combos").etag != first.etag
+        finally:
+            Combo.set_discount(discount)
+
+    def test_unknown_section_throws_exception(self):
+        """Test unknown section.
+
+        This test verifies that asking for a
+        section that is not on the menu fails.
+        """
+        with pytest.raises(KeyError):
+            MenuDocument.section("desserts")
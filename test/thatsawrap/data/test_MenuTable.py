@@ -0,0 +1,157 @@
+"""The Tests for the MenuTable class.
+
+This file contains a number of unit tests
+used to verify that the MenuTable class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.MenuTable import MenuTable
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.QueryPlanner import QueryPlanner
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from unittest.mock import patch
+import pytest
+
+
+def selected(items, mask):
+    """Items picked by a mask.
+
+    Args:
+        items: The list of items.
+        mask: A boolean array over the items.
+
+    Returns:
+        The items where the mask is True.
+    """
+    return [item for item, keep in zip(items, mask) if keep]
+
+
+class TestMenuTable:
+    """MenuTable class test class.
+
+    This class contains all of the unit
+    tests for MenuTable.
+    """
+    def test_columns_match_items(self):
+        """Test columns.
+
+        This test verifies that each column
+        holds the value of the item in that row.
+        """
+        items = MenuCatalog.snapshot().items
+        table = MenuTable(items)
+        for i, item in enumerate(items):
+            assert table.price[i] == item.price
+            assert table.calories[i] == item.calories
+            assert table.type_code[i] == Menu.type_of_item(item)
+
+    @pytest.mark.parametrize("low, high", [(-1, 500), (500, -1),
+                                           (400, 1300), (-1, -1)])
+    def test_calorie_mask_matches_filter(self, low, high):
+        """Test calorie mask.
+
+        Args:
+            low: The minimum calories.
+            high: The maximum calories.
+        """
+        snapshot = MenuCatalog.snapshot()
+        items = list(snapshot.items)
+        assert (selected(items, snapshot.table.calorie_mask(low, high)) ==
+                Menu.filter_calories(items, low, high))
+
+    @pytest.mark.parametrize("low, high", [(-1, 5), (5, -1),
+                                           (2.75, 9.65), (-1, -1)])
+    def test_price_mask_matches_filter(self, low, high):
+        """Test price mask.
+
+        Args:
+            low: The minimum price.
+            high: The maximum price.
+        """
+        snapshot = MenuCatalog.snapshot()
+        items = list(snapshot.items)
+        assert (selected(items, snapshot.table.price_mask(low, high)) ==
+                Menu.filter_price(items, low, high))
+
+    def test_type_and_keyword_masks(self):
+        """Test type and keyword masks.
+
+        This test verifies that the type and
+        keyword masks pick the same items as
+        the filters, ignoring order.
+        """
+        snapshot = MenuCatalog.snapshot()
+        items = list(snapshot.items)
+        table = snapshot.table
+        by_type = Menu.filter_type_of_item(True, False, True, False, items)
+        assert (selected(items, table.type_mask(True, False, True, False))
+                == [item for item in items if item in by_type])
+        keyword = Menu.filter_keywords(items, "kong the")
+        assert (selected(items, table.keyword_mask("kong the")) ==
+                [item for item in items if item in keyword])
+
+    def test_ingredient_mask(self):
+        """Test ingredient mask.
+
+        This test verifies that items are found
+        by their addins and ingredients, and that
+        combos carry the ingredients of their wrap.
+        """
+        classic = ComboBuilder.build_combo("Classic")
+        items = [TheGodFather(), Spartacus(), KingKong(), classic]
+        table = MenuTable(items)
+        assert list(table.ingredient_mask(["buffalo sauce"])) == [
+            False, True, False, False]
+        assert list(table.ingredient_mask(["marinara", "onions"])) == [
+            True, False, False, True]
+        assert list(table.ingredient_mask(["banana"])) == [
+            False, False, True, False]
+        assert not table.ingredient_mask(["anchovies"]).any()
+
+    def test_more_than_64_ingredients(self):
+        """Test wide ingredient masks.
+
+        This test verifies that more ingredient
+        names than fit in one 64 bit word are all
+        kept apart.
+        """
+        items = [TheGodFather(), Spartacus(), KingKong()]
+        names = {id(item): ["shared"] +
+                 ["i{}-{}".format(n, k) for k in range(50)]
+                 for n, item in enumerate(items)}
+        with patch.object(Menu, "ingredients_of",
+                          side_effect=lambda item: names[id(item)]):
+            table = MenuTable(items)
+        assert table.ingredients.shape == (3, 3)
+        assert list(table.ingredient_mask(["shared"])) == [True] * 3
+        assert list(table.ingredient_mask(["i2-49"])) == [
+            False, False, True]
+        assert list(table.ingredient_mask(["i1-0", "shared"])) == [
+            False, True, False]
+        assert not table.ingredient_mask(["i0-1", "i2-1"]).any()
+
+    @pytest.mark.parametrize("query", [
+        MenuQuery(wraps=True, drinks=True, sides=True, combos=True),
+        MenuQuery(text="god", wraps=True, combos=True),
+        MenuQuery(text="o", drinks=True, combos=True, caloriesmin=500),
+        MenuQuery(text="a", wraps=True, drinks=True, sides=True,
+                  combos=True, caloriesmin=400, caloriesmax=1900,
+                  pricemin=2.75, pricemax=20),
+        MenuQuery(text="god"),
+    ])
+    def test_select_matches_planner(self, query):
+        """Test select matches the planner.
+
+        Args:
+            query: The search criteria.
+        """
+        snapshot = MenuCatalog.snapshot()
+        assert (list(snapshot.table.select(query)) ==
+                QueryPlanner.plan(snapshot, query))
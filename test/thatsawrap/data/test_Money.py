@@ -0,0 +1,70 @@
+"""The Tests for the Money class.
+
+This file contains a number of unit tests
+used to verify that the Money class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.order.Money import Money
+import pytest
+
+
+class TestMoney:
+    """Money class test class.
+
+    This class contains all of the unit
+    tests for Money.
+    """
+    @pytest.mark.parametrize("amount, cents", [
+        (16.55, 1655), (0.1 + 0.2, 30), (1.005, 101), (2.675, 268),
+        (0.95, 95), (0, 0), (-1.25, -125), ("9.65", 965),
+    ])
+    def test_to_cents(self, amount, cents):
+        """Test dollars to cents.
+
+        Args:
+            amount: A dollar amount.
+            cents: The expected cents.
+        """
+        assert Money.to_cents(amount) == cents
+
+    @pytest.mark.parametrize("cents, percent, off", [
+        (100, 20, 20), (545, 10, 55), (545, 50, 273), (999, 100, 999),
+        (0, 25, 0), (1, 50, 1), (1, 49, 0),
+    ])
+    def test_percent_rounds_half_up(self, cents, percent, off):
+        """Test percent rounding.
+
+        Args:
+            cents: An amount in cents.
+            percent: The percent to take.
+            off: The expected cents.
+        """
+        assert Money.percent_cents(cents, percent) == off
+
+    @pytest.mark.parametrize("subtotal, rate, tax", [
+        (100, 0.125, 13), (1000, 0.125, 125), (1655, 0.125, 207),
+        (4, 0.125, 1), (3, 0.125, 0), (0, 0.125, 0), (1999, 0.15, 300),
+    ])
+    def test_tax_rounds_half_up(self, subtotal, rate, tax):
+        """Test tax rounding.
+
+        Args:
+            subtotal: The subtotal in cents.
+            rate: The tax rate.
+            tax: The expected tax in cents.
+        """
+        assert Money.tax_cents(subtotal, rate) == tax
+
+    def test_format(self):
+        """Test formatting.
+
+        This test verifies that cents are shown
+        as dollars with two places.
+        """
+        assert Money.format(0) == "$0.00"
+        assert Money.format(123456) == "$1,234.56"
+        assert Money.format(-5) == "-$0.05"
+        assert Money.to_dollars(1655) == 16.55
@@ -9,11 +9,17 @@ Version 0.1
 """
 from src.thatsawrap.data.order.Order import Order
 from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.order.Combo import Combo
 import pytest
 from unittest.mock import patch, PropertyMock
 from src.thatsawrap.data.drinks.ForrestGump import ForrestGump
 from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
 from src.thatsawrap.data.sides.Side import Side
+from src.thatsawrap.data.sides.TheFrenchConnection import TheFrenchConnection
+from src.thatsawrap.data.enums.Shell import Shell
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.drinks.SinginInTheRain import SinginInTheRain
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
 
 
 class TestOrder:
@@ -207,3 +213,223 @@ class TestOrder:
         assert test_list[0] == mock_wrap
         assert test_list[1] == mock_drink
         assert test_list[2] == mock_side
+
+    def test_running_totals_match_items(self):
+        """Test running totals.
+
+        This test verifies that the subtotal,
+        tax, total and calories kept while adding,
+        removing and changing items match the
+        items in the order.
+        """
+        ord = Order()
+        items = [TheGodFather(), ForrestGump(), TheGodFather(),
+                 ForrestGump()]
+        for item in items:
+            ord.add_item(item)
+        ord.remove_item(items[1])
+        items[2].shell = Shell.SPINACH
+        items[3].size = Size.BLOCKBUSTER
+        ord.update_item(items[3])
+        ord.update_item(items[2])
+        assert ord.subtotal == pytest.approx(9.65 + 9.15 + 9.00)
+        assert ord.calories == sum(item.calories for item in ord)
+        assert ord.total == pytest.approx(ord.subtotal + ord.tax)
+        for item in list(ord):
+            ord.remove_item(item)
+        assert ord.subtotal == 0
+        assert ord.calories == 0
+
+    def test_changes_followed_without_update_item(self):
+        """Test changing an item in place.
+
+        This test verifies that the totals and
+        the line of an item changed in place
+        follow it without update_item being
+        called.
+        """
+        ord = Order()
+        drink = ForrestGump()
+        ord.add_items(drink, 2)
+        drink.size = Size.BLOCKBUSTER
+        assert ord.subtotal_cents == 2 * round(drink.price * 100)
+        assert ord.calories == 2 * drink.calories
+        assert ord.line_of(drink).unit_price == pytest.approx(drink.price)
+        assert len(ord) == 1
+        big = ForrestGump()
+        big.size = Size.BLOCKBUSTER
+        assert ord.add_items(big) is ord.line_of(drink)
+        ord.add_items(ForrestGump())
+        assert len(ord) == 2
+
+    def test_changed_line_not_joined_by_old_key(self):
+        """Test adding to a changed line.
+
+        This test verifies that an item is not
+        added to a line whose item has been
+        changed so that it no longer matches.
+        """
+        ord = Order()
+        drink = ForrestGump()
+        ord.add_items(drink)
+        drink.size = Size.BLOCKBUSTER
+        small = ForrestGump()
+        line = ord.add_items(small)
+        assert line.item is small
+        assert len(ord) == 2
+        assert ord.subtotal_cents == (round(drink.price * 100) +
+                                      round(small.price * 100))
+
+    def test_combo_discount_reprices_order(self):
+        """Test changing the combo discount.
+
+        This test verifies that combos already in
+        an order are priced with a new discount.
+        """
+        ord = Order()
+        combo = Combo("Test")
+        combo.wrap = TheGodFather()
+        combo.drink = ForrestGump()
+        combo.side = TheFrenchConnection()
+        ord.add_item(combo)
+        discount = Combo.get_discount()
+        try:
+            Combo.set_discount(2.0)
+            assert ord.subtotal_cents == round(combo.price * 100)
+            assert ord.lines[0].unit_price == pytest.approx(combo.price)
+        finally:
+            Combo.set_discount(discount)
+        assert ord.subtotal_cents == round(combo.price * 100)
+
+    def test_updating_missing_item_throws_exception(self):
+        """Test updating an item not in the order.
+
+        This test verifies that only items in
+        the order can be updated.
+        """
+        ord = Order()
+        ord.add_item(TheGodFather())
+        with pytest.raises(ValueError):
+            ord.update_item(TheGodFather())
+
+    def test_positions_follow_removals(self):
+        """Test positions after removal.
+
+        This test verifies that indexing and
+        iteration keep the order items were added
+        in after items are removed.
+        """
+        ord = Order()
+        items = [TheGodFather() for _ in range(5)]
+        for item in items:
+            ord.add_item(item)
+        ord.remove_item(items[1])
+        ord.remove_item(items[3])
+        assert list(ord) == [items[0], items[2], items[4]]
+        assert ord[1] is items[2]
+        assert ord[-1] is items[4]
+        assert items[3] not in ord
+        ord.add_item(items[1])
+        assert ord[3] is items[1]
+        assert len(ord) == 4
+
+    def test_adding_same_instance_twice(self):
+        """Test adding an instance twice.
+
+        This test verifies that an instance
+        added twice is counted twice, and that
+        removing it takes one of them off.
+        """
+        ord = Order()
+        god = TheGodFather()
+        ord.add_item(god)
+        ord.add_item(god)
+        assert list(ord) == [god, god]
+        assert ord.subtotal == pytest.approx(2 * god.price)
+        god.shell = Shell.SPINACH
+        assert ord.calories == 2 * god.calories
+        ord.remove_item(god)
+        assert list(ord) == [god]
+        assert ord.subtotal == pytest.approx(god.price)
+        ord.remove_item(god)
+        assert len(ord) == 0
+        with pytest.raises(ValueError):
+            ord.remove_item(god)
+
+    def test_add_items_coalesces_identical_items(self):
+        """Test bulk adding.
+
+        This test verifies that identical items
+        share one line and the totals count every
+        unit.
+        """
+        ord = Order()
+        line = ord.add_items(ForrestGump(), 150)
+        assert ord.add_items(ForrestGump(), 50) is line
+        big = ForrestGump()
+        big.size = Size.BLOCKBUSTER
+        ord.add_items(big)
+        assert len(ord) == 2
+        assert ord.quantity == 201
+        assert line.quantity == 200
+        assert ord.subtotal == pytest.approx(
+            ForrestGump().price * 200 + big.price)
+        assert ord.calories == ForrestGump().calories * 200 + big.calories
+        assert ord.line_of(big).quantity == 1
+        assert [entry.item for entry in ord.lines] == list(ord)
+
+    def test_remove_items_takes_off_quantity(self):
+        """Test bulk removing.
+
+        This test verifies that removing units
+        lowers the quantity and removes the line
+        when none are left.
+        """
+        ord = Order()
+        drink = ForrestGump()
+        ord.add_items(drink, 10)
+        ord.remove_items(ForrestGump(), 4)
+        assert ord.line_of(drink).quantity == 6
+        assert ord.calories == drink.calories * 6
+        with pytest.raises(ValueError):
+            ord.remove_items(drink, 7)
+        ord.remove_items(drink, 6)
+        assert len(ord) == 0
+        assert ord.subtotal == 0
+        with pytest.raises(ValueError):
+            ord.remove_items(drink)
+
+    def test_add_item_keeps_own_line(self):
+        """Test single items keep their line.
+
+        This test verifies that add_item does not
+        merge an instance into another line, but
+        add_items does add to its line.
+        """
+        ord = Order()
+        first = ForrestGump()
+        ord.add_items(ForrestGump(), 2)
+        ord.add_item(first)
+        assert len(ord) == 2
+        ord.add_items(first, 3)
+        assert ord.line_of(first).quantity == 4
+        assert ord.quantity == 6
+
+    def test_totals_are_exact_cents(self):
+        """Test cent totals.
+
+        This test verifies that totals are summed
+        in cents and the tax is rounded once.
+        """
+        ord = Order()
+        rate = ord.tax_rate
+        try:
+            Order.set_tax_rate(0.125)
+            ord.add_items(SinginInTheRain(), 1000)
+            ord.add_items(Spartacus(), 3)
+            assert ord.subtotal_cents == 275 * 1000 + 1655 * 3
+            assert ord.tax_cents == 34996
+            assert ord.total_cents == ord.subtotal_cents + ord.tax_cents
+            assert ord.total == 3149.61
+        finally:
+            Order.set_tax_rate(rate)
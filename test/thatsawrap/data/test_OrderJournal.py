@@ -0,0 +1,263 @@
+"""The Tests for the OrderJournal class.
+
+This file contains a number of unit tests
+used to verify that the OrderJournal class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import os
+from src.thatsawrap.data.order.ItemCodec import ItemCodec
+from src.thatsawrap.data.order.OrderJournal import OrderJournal
+from src.thatsawrap.data.order.OrderJournal import JournalEntry
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+from src.thatsawrap.data.drinks.KingKong import KingKong
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def keep_order_numbers():
+    """Puts the order number back after each test.
+
+    Other tests expect order numbers to start
+    from where the application left them.
+    """
+    single = OrderNumberSingleton()
+    before = single.next_order_number
+    yield
+    single.next_order_number = before
+
+
+def make_order() -> Order:
+    """Makes an order with a few lines.
+
+    Returns:
+        An order of two wraps, a drink
+        and a combo.
+    """
+    order = Order()
+    order.add_items(Spartacus(), 2)
+    order.add_item(KingKong())
+    order.add_item(ComboBuilder.build_combo("Classic"))
+    return order
+
+
+class TornFile:
+    """Stands in for the journal file.
+
+    Writes half of what it is given and then
+    raises, as a full disk would.
+    """
+    def __init__(self, file) -> None:
+        """Constructor for a torn file.
+
+        Args:
+            file: The real journal file.
+        """
+        self.file = file
+
+    def write(self, data):
+        """Writes half the data and raises.
+
+        Args:
+            data: The bytes to write.
+        """
+        self.file.write(data[:len(data) // 2])
+        raise OSError("No space left on device")
+
+    def __getattr__(self, name):
+        """Passes anything else to the real file.
+
+        Args:
+            name: The name of the attribute.
+        """
+        return getattr(self.file, name)
+
+
+class TestOrderJournal:
+    """OrderJournal class test class.
+
+    This class contains all of the unit
+    tests for OrderJournal.
+    """
+    def test_replay_round_trip(self, tmp_path):
+        """Test replaying the journal.
+
+        This test verifies that every appended
+        order is read back as it was journaled.
+        """
+        path = str(tmp_path / "orders.journal")
+        orders = [make_order() for _ in range(5)]
+        journal = OrderJournal(path)
+        tickets = [journal.append(order) for order in orders]
+        for ticket in tickets:
+            assert ticket.wait(5)
+        journal.close()
+        expected = [JournalEntry.of(order) for order in orders]
+        assert OrderJournal.replay(path) == expected
+        assert OrderJournal(path).entries == expected
+        entry = expected[0]
+        assert entry.number == orders[0].order_number
+        assert entry.total_cents == orders[0].total_cents
+        assert entry.lines[0].quantity == 2
+        assert entry.lines[0].description == str(Spartacus())
+
+    def test_group_commit(self, tmp_path):
+        """Test group commit.
+
+        This test verifies that orders appended
+        together are synced together.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path, max_delay=0.2, max_batch=50)
+        tickets = [journal.append(make_order()) for _ in range(100)]
+        journal.flush()
+        assert all(ticket.wait(0) for ticket in tickets)
+        assert journal.syncs <= 4
+        assert len(journal.entries) == 100
+        journal.close()
+
+    def test_torn_tail_dropped(self, tmp_path):
+        """Test a torn record.
+
+        This test verifies that a record cut
+        short is dropped and the journal can be
+        appended to afterwards.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path)
+        journal.append(make_order())
+        journal.close()
+        with open(path, "ab") as file:
+            file.write(OrderJournal.HEADER.pack(100, 0) + b"{\"num")
+        assert len(OrderJournal.replay(path)) == 1
+        journal = OrderJournal(path)
+        journal.append(make_order()).wait(5)
+        journal.close()
+        assert len(OrderJournal.replay(path)) == 2
+
+    def test_failed_batch_cut_back(self, tmp_path):
+        """Test a failed write.
+
+        This test verifies that a batch which
+        fails partway through is cut off the file,
+        so the orders journaled after it are kept.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path, max_delay=0.2)
+        journal.append(make_order()).wait(5)
+        real = journal._OrderJournal__file
+        journal._OrderJournal__file = TornFile(real)
+        failed = [journal.append(make_order()) for _ in range(3)]
+        for ticket in failed:
+            with pytest.raises(OSError):
+                ticket.wait(5)
+        journal._OrderJournal__file = real
+        later = make_order()
+        assert journal.append(later).wait(5)
+        journal.close()
+        entries = OrderJournal.replay(path)
+        assert len(entries) == 2
+        assert entries[1] == JournalEntry.of(later)
+        assert len(journal.entries) == 2
+
+    def test_failed_journal_refuses_orders(self, tmp_path, monkeypatch):
+        """Test a journal that cannot be cut back.
+
+        This test verifies that when a failed
+        batch cannot be cut off the file, no more
+        orders are taken.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path)
+        real = journal._OrderJournal__file
+        journal._OrderJournal__file = TornFile(real)
+
+        def ftruncate(fd, length):
+            raise OSError("Read-only file system")
+
+        monkeypatch.setattr("os.ftruncate", ftruncate)
+        with pytest.raises(OSError):
+            journal.append(make_order()).wait(5)
+        with pytest.raises(OSError):
+            journal.append(make_order())
+        journal.close()
+
+    def test_corrupt_record_ends_journal(self, tmp_path):
+        """Test a corrupt record.
+
+        This test verifies that a record whose
+        checksum does not match ends the journal.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path)
+        for _ in range(3):
+            journal.append(make_order())
+        journal.close()
+        with open(path, "r+b") as file:
+            data = bytearray(file.read())
+            data[-2] ^= 0xFF
+            file.seek(0)
+            file.write(bytes(data))
+        assert len(OrderJournal.replay(path)) == 2
+
+    def test_undecodable_record_kept(self, tmp_path, monkeypatch):
+        """Test a whole record that cannot be read.
+
+        This test verifies that a record with a
+        good checksum that cannot be decoded, such
+        as one of another version, stops the journal
+        opening and leaves the file as it was.
+        """
+        path = str(tmp_path / "orders.journal")
+        journal = OrderJournal(path)
+        for _ in range(3):
+            journal.append(make_order())
+        journal.close()
+        size = os.path.getsize(path)
+        monkeypatch.setattr(ItemCodec, "VERSION", ItemCodec.VERSION + 1)
+        with pytest.raises(ValueError):
+            OrderJournal.replay(path)
+        with pytest.raises(ValueError):
+            OrderJournal(path)
+        assert os.path.getsize(path) == size
+        monkeypatch.undo()
+        assert len(OrderJournal.replay(path)) == 3
+
+    def test_missing_journal_is_empty(self, tmp_path):
+        """Test a new journal.
+
+        This test verifies that a journal that
+        does not exist yet replays as empty.
+        """
+        path = str(tmp_path / "orders.journal")
+        assert OrderJournal.replay(path) == []
+
+    def test_append_after_close(self, tmp_path):
+        """Test appending to a closed journal.
+
+        This test verifies that appending to a
+        closed journal raises a ValueError.
+        """
+        journal = OrderJournal(str(tmp_path / "orders.journal"))
+        journal.close()
+        with pytest.raises(ValueError):
+            journal.append(make_order())
+
+    def test_advance_past(self):
+        """Test advancing order numbers.
+
+        This test verifies that order numbers
+        continue after the highest replayed one
+        and never go backwards.
+        """
+        single = OrderNumberSingleton()
+        start = single.next_order_number
+        single.advance_past(start + 40)
+        assert single.get_next_order_number() == start + 41
+        single.advance_past(3)
+        assert single.get_next_order_number() == start + 42
@@ -0,0 +1,86 @@
+"""The Tests for the OrderLine class.
+
+This file contains a number of unit tests
+used to verify that the OrderLine class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.order.OrderLine import OrderLine
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.drinks.ForrestGump import ForrestGump
+from src.thatsawrap.data.wraps.TheGodFather import TheGodFather
+from src.thatsawrap.data.enums.Addin import Addin
+from src.thatsawrap.data.enums.Size import Size
+import pytest
+
+
+class TestOrderLine:
+    """OrderLine class test class.
+
+    This class contains all of the unit
+    tests for OrderLine.
+    """
+    def test_totals_scale_with_quantity(self):
+        """Test line totals.
+
+        This test verifies that a line costs
+        the price of one item times its quantity.
+        """
+        drink = ForrestGump()
+        line = OrderLine(drink, 4)
+        assert line.price == pytest.approx(drink.price * 4)
+        assert line.calories == drink.calories * 4
+        line.quantity = 2
+        assert line.calories == drink.calories * 2
+        with pytest.raises(ValueError):
+            line.quantity = 0
+        with pytest.raises(ValueError):
+            OrderLine(drink, 0)
+
+    def test_refresh_reports_change(self):
+        """Test refresh.
+
+        This test verifies that refreshing a line
+        after its item changed gives the change in
+        its totals.
+        """
+        drink = ForrestGump()
+        line = OrderLine(drink, 3)
+        before = line.price_cents
+        drink.size = Size.BLOCKBUSTER
+        price, calories = line.refresh()
+        assert price == (900 - 525) * 3
+        assert line.price_cents == before + price
+        assert calories == (drink.calories - ForrestGump().calories) * 3
+
+    def test_keys_match_configuration(self):
+        """Test item keys.
+
+        This test verifies that items with the
+        same configuration share a key and
+        different ones do not.
+        """
+        assert (OrderLine.key_of(ForrestGump()) ==
+                OrderLine.key_of(ForrestGump()))
+        big = ForrestGump()
+        big.size = Size.STUDIO
+        assert OrderLine.key_of(big) != OrderLine.key_of(ForrestGump())
+        god = TheGodFather()
+        god.remove_addin(Addin.ONIONS)
+        assert OrderLine.key_of(god) != OrderLine.key_of(TheGodFather())
+        god.add_addin(Addin.ONIONS)
+        assert OrderLine.key_of(god) == OrderLine.key_of(TheGodFather())
+
+    def test_combo_keys_use_their_items(self):
+        """Test combo keys.
+
+        This test verifies that combos are keyed
+        by the items in them.
+        """
+        first = ComboBuilder.build_combo("Classic")
+        second = ComboBuilder.build_combo("Classic")
+        assert OrderLine.key_of(first) == OrderLine.key_of(second)
+        second.drink.size = Size.BLOCKBUSTER
+        assert OrderLine.key_of(first) != OrderLine.key_of(second)
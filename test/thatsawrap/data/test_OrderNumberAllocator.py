@@ -0,0 +1,157 @@
+"""The Tests for the OrderNumberAllocator class.
+
+This file contains a number of unit tests
+used to verify that the OrderNumberAllocator
+class is working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import multiprocessing
+import threading
+from src.thatsawrap.data.order.OrderNumberAllocator import \
+    OrderNumberAllocator
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+import pytest
+
+
+def take_numbers(path, count, results):
+    """Takes numbers in another process.
+
+    Args:
+        path: The mark file.
+        count: How many numbers to take.
+        results: A queue to put the numbers on.
+    """
+    allocator = OrderNumberAllocator(path, block_size=7)
+    results.put([allocator.next_number() for _ in range(count)])
+
+
+class TestOrderNumberAllocator:
+    """OrderNumberAllocator class test class.
+
+    This class contains all of the unit
+    tests for OrderNumberAllocator.
+    """
+    def test_numbers_count_up(self, tmp_path):
+        """Test numbers from one allocator.
+
+        This test verifies that one allocator
+        hands out numbers in order across blocks
+        and leases one block at a time.
+        """
+        path = str(tmp_path / "orders.mark")
+        allocator = OrderNumberAllocator(path, block_size=10)
+        assert [allocator.next_number() for _ in range(25)] == \
+            list(range(1, 26))
+        assert allocator.mark() == 30
+
+    def test_mark_survives_restart(self, tmp_path):
+        """Test restarting.
+
+        This test verifies that a new allocator
+        on the same file starts after the numbers
+        leased by the old one.
+        """
+        path = str(tmp_path / "orders.mark")
+        first = OrderNumberAllocator(path, block_size=10)
+        first.next_number()
+        second = OrderNumberAllocator(path, block_size=10)
+        assert second.next_number() == 11
+
+    def test_allocators_never_share(self, tmp_path):
+        """Test two allocators at once.
+
+        This test verifies that allocators on the
+        same file never hand out the same number.
+        """
+        path = str(tmp_path / "orders.mark")
+        first = OrderNumberAllocator(path, block_size=3)
+        second = OrderNumberAllocator(path, block_size=5)
+        numbers = list()
+        for _ in range(20):
+            numbers.append(first.next_number())
+            numbers.append(second.next_number())
+        assert len(set(numbers)) == 40
+
+    def test_threads_never_share(self, tmp_path):
+        """Test threads.
+
+        This test verifies that threads sharing
+        an allocator never get the same number.
+        """
+        allocator = OrderNumberAllocator(str(tmp_path / "orders.mark"),
+                                         block_size=16)
+        numbers = list()
+
+        def take():
+            numbers.extend([allocator.next_number() for _ in range(500)])
+
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(numbers) == list(range(1, 4001))
+
+    def test_processes_never_share(self, tmp_path):
+        """Test processes.
+
+        This test verifies that processes sharing
+        the mark file never get the same number.
+        """
+        path = str(tmp_path / "orders.mark")
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=take_numbers,
+                                           args=(path, 100, results))
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        numbers = list()
+        for _ in workers:
+            numbers.extend(results.get(timeout=30))
+        for worker in workers:
+            worker.join()
+        assert len(set(numbers)) == 400
+
+    def test_advance_past(self, tmp_path):
+        """Test advancing the mark.
+
+        This test verifies that the mark moves
+        past a number in use and never back.
+        """
+        allocator = OrderNumberAllocator(str(tmp_path / "orders.mark"))
+        allocator.next_number()
+        allocator.advance_past(500)
+        assert allocator.next_number() == 501
+        allocator.advance_past(3)
+        assert allocator.next_number() == 502
+
+    def test_block_size_positive(self, tmp_path):
+        """Test the block size.
+
+        This test verifies that a block size
+        less than one raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            OrderNumberAllocator(str(tmp_path / "orders.mark"), 0)
+
+    def test_singleton_uses_allocator(self, tmp_path):
+        """Test the order number singleton.
+
+        This test verifies that the singleton
+        hands out numbers from an allocator once
+        told to, and from its counter after.
+        """
+        single = OrderNumberSingleton()
+        before = single.next_order_number
+        allocator = OrderNumberAllocator(str(tmp_path / "orders.mark"))
+        allocator.advance_past(1000)
+        OrderNumberSingleton.use_allocator(allocator)
+        try:
+            assert single.get_next_order_number() == 1001
+            single.advance_past(2000)
+            assert single.get_next_order_number() == 2001
+        finally:
+            OrderNumberSingleton.use_allocator(None)
+        assert single.next_order_number == before
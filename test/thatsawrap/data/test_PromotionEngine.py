@@ -0,0 +1,241 @@
+"""The Tests for the PromotionEngine class.
+
+This file contains a number of unit tests
+used to verify that the PromotionEngine class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+import datetime
+from src.thatsawrap.data.order.PromotionEngine import (AppliedPromotion,
+                                                       Promotion,
+                                                       PromotionEngine)
+from src.thatsawrap.data.order.ComboBuilder import ComboBuilder
+from src.thatsawrap.data.order.Combo import Combo
+from src.thatsawrap.data.order.Order import Order
+from src.thatsawrap.data.order.OrderNumberSingleton import OrderNumberSingleton
+from src.thatsawrap.data.drinks.Drink import Drink
+from src.thatsawrap.data.drinks.KingKong import KingKong
+from src.thatsawrap.data.drinks.SinginInTheRain import SinginInTheRain
+from src.thatsawrap.data.enums.Size import Size
+from src.thatsawrap.data.sides.SnowWhite import SnowWhite
+from src.thatsawrap.data.wraps.Spartacus import Spartacus
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_promotions():
+    """Takes promotions off after each test.
+
+    Other tests expect orders at list price
+    and the order number where it was.
+    """
+    single = OrderNumberSingleton()
+    before = single.next_order_number
+    yield
+    PromotionEngine.set_promotions([])
+    PromotionEngine.set_clock(None)
+    single.next_order_number = before
+
+
+def at(hour: int, minute: int = 0):
+    """Stops the clock.
+
+    Args:
+        hour: The hour of the day.
+        minute: The minute of the hour.
+    """
+    PromotionEngine.set_clock(lambda: datetime.time(hour, minute))
+
+
+class TestPromotionEngine:
+    """PromotionEngine class test class.
+
+    This class contains all of the unit
+    tests for PromotionEngine.
+    """
+    def test_percent_off(self):
+        """Test percent off.
+
+        This test verifies that a percent is
+        taken off every unit of the classes it
+        applies to, and off the order totals.
+        """
+        PromotionEngine.set_promotions(
+            [Promotion.percent_off("Drinks 10%", 10, Drink)])
+        order = Order()
+        order.add_items(KingKong(), 2)
+        order.add_item(Spartacus())
+        assert order.promotions == [AppliedPromotion("Drinks 10%", 98)]
+        assert order.discount_cents == 98
+        assert order.subtotal_cents == 2 * 485 + 1655 - 98
+        assert order.total_cents == (order.subtotal_cents +
+                                     order.tax_cents)
+
+    def test_happy_hour(self):
+        """Test happy hours.
+
+        This test verifies that a happy hour
+        only runs between its times, and that
+        the order follows the clock.
+        """
+        PromotionEngine.set_promotions([Promotion.happy_hour(
+            "Happy Hour", 50, datetime.time(16), datetime.time(18))])
+        order = Order()
+        order.add_item(SnowWhite())
+        at(15, 59)
+        assert order.subtotal_cents == 150
+        at(16)
+        assert order.subtotal_cents == 75
+        at(18)
+        assert order.subtotal_cents == 150
+
+    def test_happy_hour_past_midnight(self):
+        """Test late happy hours.
+
+        This test verifies that a happy hour
+        starting after it ends runs past midnight.
+        """
+        late = Promotion.happy_hour("Late", 20, datetime.time(22),
+                                    datetime.time(2))
+        assert late.runs_at(datetime.time(23))
+        assert late.runs_at(datetime.time(1))
+        assert not late.runs_at(datetime.time(12))
+
+    def test_bogo_takes_cheapest(self):
+        """Test buy one get one.
+
+        This test verifies that units are pooled
+        across lines and the cheaper unit of each
+        pair is taken off.
+        """
+        PromotionEngine.set_promotions([Promotion.bogo("BOGO", Drink)])
+        order = Order()
+        big = KingKong()
+        big.size = Size.STUDIO
+        order.add_item(big)
+        order.add_items(KingKong(), 2)
+        order.add_item(SinginInTheRain())
+        # Sorted 595, 485, 485, 275: the 485 and the 275 are free.
+        assert order.discount_cents == 485 + 275
+        order.remove_item(big)
+        assert order.discount_cents == 485
+
+    def test_buy_two_half_off(self):
+        """Test buy two get one half off.
+
+        This test verifies that buy and percent
+        are followed.
+        """
+        PromotionEngine.set_promotions(
+            [Promotion.bogo("Sides", SnowWhite, buy=2, percent=50)])
+        order = Order()
+        order.add_items(SnowWhite(), 7)
+        assert order.discount_cents == 2 * 75
+
+    def test_first_match_wins(self):
+        """Test overlapping promotions.
+
+        This test verifies that an item only gets
+        the first running promotion that applies
+        to it.
+        """
+        PromotionEngine.set_promotions([
+            Promotion.happy_hour("Happy Hour", 50, datetime.time(16),
+                                 datetime.time(18), KingKong),
+            Promotion.percent_off("Everything", 10),
+        ])
+        order = Order()
+        order.add_item(KingKong())
+        order.add_item(SnowWhite())
+        at(17)
+        assert order.promotions == [AppliedPromotion("Happy Hour", 243),
+                                    AppliedPromotion("Everything", 15)]
+        at(12)
+        assert order.promotions == [AppliedPromotion("Everything", 64)]
+
+    def test_combo_instructions(self):
+        """Test combo instructions.
+
+        This test verifies that a combo lists the
+        promotion it gets, and drops it once the
+        promotion is gone.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        before = combo.instructions
+        PromotionEngine.set_promotions(
+            [Promotion.percent_off("Combo Week", 5, Combo)])
+        assert combo.instructions == before + ["Combo Week Promotion"]
+        order = Order()
+        order.add_item(combo)
+        assert order.discount_cents == (combo.price_cents * 5 + 50) // 100
+        PromotionEngine.set_promotions([])
+        assert combo.instructions == before
+
+    def test_combo_bogo_without_pair(self):
+        """Test combo instructions without a discount.
+
+        This test verifies that a combo does not
+        list a buy one get one it cannot get alone,
+        though an order of two gets it.
+        """
+        combo = ComboBuilder.build_combo("Classic")
+        before = combo.instructions
+        PromotionEngine.set_promotions([Promotion.bogo("Combo BOGO", Combo)])
+        assert combo.instructions == before
+        order = Order()
+        order.add_item(combo)
+        assert order.discount_cents == 0
+        order.add_item(ComboBuilder.build_combo("Classic"))
+        assert order.discount_cents == combo.price_cents
+
+    def test_orders_without_promotions(self):
+        """Test no promotions.
+
+        This test verifies that orders are at
+        list price when nothing is on offer or
+        nothing running applies.
+        """
+        order = Order()
+        order.add_item(Spartacus())
+        assert order.promotions == []
+        PromotionEngine.set_promotions([Promotion.happy_hour(
+            "Happy Hour", 50, datetime.time(16), datetime.time(18))])
+        at(9)
+        assert order.subtotal_cents == 1655
+
+    def test_one_pass(self):
+        """Test the cost of an order.
+
+        This test verifies that each line is
+        matched against the table once, and the
+        table has one entry for each class.
+        """
+        PromotionEngine.set_promotions(
+            [Promotion.percent_off(str(n), 10, KingKong) for n in range(50)] +
+            [Promotion.percent_off("Wraps", 10, Spartacus)])
+        order = Order()
+        for _ in range(1000):
+            order.add_item(Spartacus())
+            order.add_item(SnowWhite())
+        assert order.discount_cents == 1000 * 166
+        table = PromotionEngine._PromotionEngine__table
+        assert table[Spartacus] == (50,)
+        assert table[SnowWhite] == ()
+
+    @pytest.mark.parametrize("promotion", [
+        Promotion("Zero", percent=0),
+        Promotion("Too much", percent=101),
+        Promotion("Negative", buy=-1),
+        Promotion("Half window", start=datetime.time(9)),
+    ])
+    def test_bad_promotions(self, promotion):
+        """Test bad promotions.
+
+        Args:
+            promotion: A promotion that is not
+            allowed.
+        """
+        with pytest.raises(ValueError):
+            PromotionEngine.set_promotions([promotion])
@@ -0,0 +1,139 @@
+"""The Tests for the QueryPlanner class.
+
+This file contains a number of unit tests
+used to verify that the QueryPlanner class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.QueryPlanner import QueryPlanner
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.Menu import Menu
+import pytest
+
+
+def chain(items, query):
+    """Runs the Menu filters one after another.
+
+    Args:
+        items: The list of items to be filtered.
+        query: The search criteria.
+
+    Returns:
+        A list of items that meet the criteria.
+    """
+    items = Menu.filter_keywords(items, query.text)
+    items = Menu.filter_type_of_item(query.wraps, query.drinks,
+                                     query.sides, query.combos, items)
+    items = Menu.filter_calories(items, query.caloriesmin,
+                                 query.caloriesmax)
+    return Menu.filter_price(items, query.pricemin, query.pricemax)
+
+
+class TestQueryPlanner:
+    """QueryPlanner class test class.
+
+    This class contains all of the unit
+    tests for QueryPlanner and MenuQuery.
+    """
+    @pytest.mark.parametrize("query", [
+        MenuQuery(),
+        MenuQuery(wraps=True, drinks=True, sides=True, combos=True),
+        MenuQuery(text="god", wraps=True, combos=True),
+        MenuQuery(text="kong rain the", drinks=True, sides=True,
+                  combos=True, wraps=True),
+        MenuQuery(text="o", drinks=True, combos=True, caloriesmin=500),
+        MenuQuery(sides=True, drinks=True, caloriesmax=500),
+        MenuQuery(wraps=True, pricemin=10, pricemax=12.20),
+        MenuQuery(text="a", wraps=True, drinks=True, sides=True,
+                  combos=True, caloriesmin=400, caloriesmax=1900,
+                  pricemin=2.75, pricemax=20),
+        MenuQuery(text="nothing", wraps=True),
+        MenuQuery(text="", combos=True, pricemax=19),
+    ])
+    def test_planner_matches_filter_chain(self, query):
+        """Test planner matches the old chain.
+
+        This test verifies that the planner
+        returns the same items in the same
+        order as the chained Menu filters.
+
+        Args:
+            query: The search criteria.
+        """
+        snapshot = MenuCatalog.snapshot()
+        assert (QueryPlanner.execute(snapshot, query) ==
+                chain(list(snapshot.items), query))
+
+    def test_no_types_returns_nothing(self):
+        """Test no types selected.
+
+        This test verifies that a search
+        without any type selected is empty.
+        """
+        snapshot = MenuCatalog.snapshot()
+        assert QueryPlanner.execute(snapshot, MenuQuery(text="god")) == []
+
+    def test_query_from_form(self):
+        """Test parsing the form.
+
+        This test verifies that a MenuQuery
+        reads the advanced search form, treating
+        bad numbers as blank.
+        """
+        query = MenuQuery.from_form({'text': 'god', 'wraps': 'on',
+                                     'caloriesmin': '100',
+                                     'caloriesmax': '',
+                                     'pricemin': 'abc',
+                                     'pricemax': '9.5'})
+        assert query.text == 'god'
+        assert query.wraps is True
+        assert query.drinks is False
+        assert query.caloriesmin == 100
+        assert query.caloriesmax == -1
+        assert query.pricemin == -1
+        assert query.pricemax == 9.5
+
+    @pytest.mark.parametrize("query", [
+        MenuQuery(),
+        MenuQuery(wraps=True, drinks=True, sides=True, combos=True),
+        MenuQuery(text="god", wraps=True, combos=True),
+        MenuQuery(text="o", drinks=True, combos=True, caloriesmin=500),
+        MenuQuery(wraps=True, pricemin=10, pricemax=12.20),
+        MenuQuery(text="a", wraps=True, drinks=True, sides=True,
+                  combos=True, caloriesmin=400, caloriesmax=1900,
+                  pricemin=2.75, pricemax=20),
+    ])
+    def test_facets_match_filter_chain(self, query):
+        """Test facet counts.
+
+        This test verifies that plan_with_facets
+        gives the same ids as plan, and that each
+        facet counts the items the old chain finds
+        with that facet's own filter left out.
+
+        Args:
+            query: The search criteria.
+        """
+        snapshot = MenuCatalog.snapshot()
+        items = list(snapshot.items)
+        ids, facets = QueryPlanner.plan_with_facets(snapshot, query)
+        assert ids == QueryPlanner.plan(snapshot, query)
+        any_type = query._replace(wraps=True, drinks=True, sides=True,
+                                  combos=True)
+        found = chain(items, any_type)
+        assert [count for _, count in facets.types] == [
+            sum(1 for item in found if Menu.type_of_item(item) == item_type)
+            for item_type in QueryPlanner.TYPES]
+        found = chain(items, query._replace(pricemin=-1, pricemax=-1))
+        edges = (0,) + QueryPlanner.PRICE_EDGES + (float("inf"),)
+        assert [count for _, count in facets.prices] == [
+            sum(1 for item in found if low <= item.price < high)
+            for low, high in zip(edges, edges[1:])]
+        found = chain(items, query._replace(caloriesmin=-1, caloriesmax=-1))
+        edges = (0,) + QueryPlanner.CALORIE_EDGES + (float("inf"),)
+        assert [count for _, count in facets.calories] == [
+            sum(1 for item in found if low <= item.calories < high)
+            for low, high in zip(edges, edges[1:])]
@@ -0,0 +1,96 @@
+"""The Tests for the RangeIndex class.
+
+This file contains a number of unit tests
+used to verify that the RangeIndex class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.RangeIndex import RangeIndex
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.custom.CustomItem import CustomItem
+import pytest
+
+
+class TestRangeIndex:
+    """RangeIndex class test class.
+
+    This class contains all of the unit
+    tests for RangeIndex.
+    """
+    def test_between_is_inclusive(self):
+        """Test range bounds.
+
+        This test verifies that both ends
+        of the range are included and that
+        missing bounds are open.
+        """
+        index = RangeIndex({0: 5.0, 1: 1.0, 2: 3.0, 3: 3.0})
+        assert index.between(3.0, 5.0) == {0, 2, 3}
+        assert index.between(None, 1.0) == {1}
+        assert index.between(4.0, None) == {0}
+        assert index.between(None, None) == {0, 1, 2, 3}
+        assert index.between(6.0, 7.0) == set()
+        assert index.minimum == 1.0
+        assert index.maximum == 5.0
+        assert len(index) == 4
+
+    def test_empty_index(self):
+        """Test empty index.
+
+        This test verifies that an empty
+        index has no bounds and no matches.
+        """
+        index = RangeIndex({})
+        assert index.between(0, 10) == set()
+        assert index.minimum is None
+        assert index.maximum is None
+
+    @pytest.mark.parametrize("low, high", [(-1, 500), (500, -1),
+                                           (400, 1300), (1874, 1874),
+                                           (0, 0), (-1, -1)])
+    def test_calorie_index_matches_scan(self, low, high):
+        """Test calorie index matches a scan.
+
+        This test verifies that filtering the
+        catalog through the index gives the same
+        items as scanning a copy of it.
+
+        Args:
+            low: The minimum calories.
+            high: The maximum calories.
+        """
+        items = MenuCatalog.snapshot().items
+        assert (Menu.filter_calories(items, low, high) ==
+                Menu.filter_calories(list(items), low, high))
+
+    @pytest.mark.parametrize("low, high", [(-1, 5), (5, -1),
+                                           (2.75, 9.65), (16.55, 16.55),
+                                           (100, 200)])
+    def test_price_index_matches_scan(self, low, high):
+        """Test price index matches a scan.
+
+        This test verifies that filtering the
+        catalog through the index gives the same
+        items as scanning a copy of it.
+
+        Args:
+            low: The minimum price.
+            high: The maximum price.
+        """
+        items = MenuCatalog.snapshot().items
+        assert (Menu.filter_price(items, low, high) ==
+                Menu.filter_price(list(items), low, high))
+
+    def test_no_upper_bound_when_max_is_blank(self):
+        """Test blank maximum.
+
+        This test verifies that leaving the
+        maximum blank does not cap the range.
+        """
+        big = CustomItem(name="Party Platter", price=6000.0,
+                         calories=9000)
+        assert Menu.filter_calories([big], 100, -1) == [big]
+        assert Menu.filter_price([big], 100, -1) == [big]
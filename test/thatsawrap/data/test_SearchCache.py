@@ -0,0 +1,146 @@
+"""The Tests for the SearchCache class.
+
+This file contains a number of unit tests
+used to verify that the SearchCache class is
+working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.SearchCache import SearchCache
+from src.thatsawrap.data.menu.Menu import Menu
+from src.thatsawrap.data.menu.MenuCatalog import MenuCatalog
+from src.thatsawrap.data.menu.MenuQuery import MenuQuery
+from src.thatsawrap.data.menu.QueryPlanner import QueryPlanner
+import pytest
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+    def __init__(self) -> None:
+        """Starts the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Returns the current time."""
+        return self.now
+
+
+class TestSearchCache:
+    """SearchCache class test class.
+
+    This class contains all of the unit
+    tests for SearchCache.
+    """
+    def test_hits_and_misses_are_counted(self):
+        """Test counters.
+
+        This test verifies that a repeated key
+        is answered from the cache.
+        """
+        cache = SearchCache()
+        calls = list()
+        for _ in range(3):
+            value = cache.get_or_compute("god", lambda: calls.append(1) or 7)
+            assert value == 7
+        assert len(calls) == 1
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+        cache.clear()
+        assert cache.hits == 0 and len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction.
+
+        This test verifies that the entry used
+        longest ago is dropped when full.
+        """
+        cache = SearchCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+        assert len(cache) == 2
+        assert cache.get_or_compute("a", lambda: -1) == 1
+        assert cache.get_or_compute("b", lambda: -2) == -2
+
+    def test_entries_expire(self):
+        """Test TTL expiry.
+
+        This test verifies that an entry is
+        computed again once it has expired.
+        """
+        clock = FakeClock()
+        cache = SearchCache(ttl=10, clock=clock)
+        cache.get_or_compute("a", lambda: 1)
+        clock.now = 9.5
+        assert cache.get_or_compute("a", lambda: 2) == 1
+        clock.now = 10.5
+        assert cache.get_or_compute("a", lambda: 2) == 2
+        assert cache.misses == 2
+
+    def test_bad_sizes_throw_exception(self):
+        """Test bad arguments.
+
+        This test verifies that a cache
+        cannot be empty or never valid.
+        """
+        with pytest.raises(ValueError):
+            SearchCache(maxsize=0)
+        with pytest.raises(ValueError):
+            SearchCache(ttl=0)
+
+    def test_normalize_shares_keys(self):
+        """Test normalized keys.
+
+        This test verifies that searches asking
+        for the same thing normalize to the
+        same query.
+        """
+        snapshot = MenuCatalog.snapshot()
+        first = SearchCache.normalize(snapshot, MenuQuery(
+            text="Kong GOD kong", wraps="on", pricemin=0,
+            pricemax=1000))
+        second = SearchCache.normalize(snapshot, MenuQuery(
+            text="kong god", wraps=True))
+        assert first == second
+        assert first.text == "kong god"
+        assert first.pricemin == -1 and first.pricemax == -1
+
+    def test_normalize_keeps_keyword_order(self):
+        """Test keyword order.
+
+        This test verifies that searches whose
+        results come in a different order do not
+        share a key.
+        """
+        snapshot = MenuCatalog.snapshot()
+        first = MenuQuery(text="kong god")
+        second = MenuQuery(text="god kong")
+        assert (Menu.filter_keywords(snapshot.items, first.text) !=
+                Menu.filter_keywords(snapshot.items, second.text))
+        assert (SearchCache.normalize(snapshot, first) !=
+                SearchCache.normalize(snapshot, second))
+
+    @pytest.mark.parametrize("query", [
+        MenuQuery(text="god", wraps=True, combos=True, caloriesmin=0,
+                  caloriesmax=99999),
+        MenuQuery(drinks=True, sides=True, caloriesmax=500, pricemin=0),
+        MenuQuery(wraps=True, combos=True, pricemin=9, pricemax=500),
+        MenuQuery(text=" ", sides=True),
+        MenuQuery(text="Kong GOD kong"),
+    ])
+    def test_normalize_keeps_results(self, query):
+        """Test normalized results.
+
+        This test verifies that normalizing a
+        query does not change its results.
+
+        Args:
+            query: The search criteria.
+        """
+        snapshot = MenuCatalog.snapshot()
+        normalized = SearchCache.normalize(snapshot, query)
+        assert (QueryPlanner.execute(snapshot, normalized) ==
+                QueryPlanner.execute(snapshot, query))
@@ -0,0 +1,76 @@
+"""The Tests for the SearchCursor class.
+
+This file contains a number of unit tests
+used to verify that the SearchCursor and
+SearchPage classes are working correctly.
+
+Author: Dustin Hayes djhayes@ksu.edu
+Version 0.1
+"""
+from src.thatsawrap.data.menu.SearchCursor import SearchCursor, SearchPage
+import pytest
+
+
+class TestSearchCursor:
+    """SearchCursor class test class.
+
+    This class contains all of the unit
+    tests for SearchCursor and SearchPage.
+    """
+    def test_encode_and_decode(self):
+        """Test cursor round trip.
+
+        This test verifies that a cursor reads
+        back the same, and bad tokens are None.
+        """
+        cursor = SearchCursor(7, 25)
+        assert SearchCursor.decode(cursor.encode()) == cursor
+        assert SearchCursor.decode(None) is None
+        assert SearchCursor.decode("") is None
+        assert SearchCursor.decode("not a cursor!") is None
+        assert SearchCursor.decode(SearchCursor(7, -1).encode()) is None
+
+    def test_pages_cover_results_in_order(self):
+        """Test walking the pages.
+
+        This test verifies that following the
+        cursors gives every result once, in
+        order.
+        """
+        results = list(range(23))
+        seen = list()
+        token = None
+        while True:
+            page = SearchPage.paginate(results, 3, token, 5)
+            seen.extend(page.items)
+            assert page.total == 23
+            token = page.next_cursor
+            if token is None:
+                break
+        assert seen == results
+        assert page.start == 20 and page.end == 23
+
+    def test_stale_cursor_restarts(self):
+        """Test a cursor from an old version.
+
+        This test verifies that a cursor made
+        before the catalog changed starts from
+        the first page again.
+        """
+        first = SearchPage.paginate(list(range(10)), 1, None, 4)
+        page = SearchPage.paginate(list(range(10)), 2, first.next_cursor, 4)
+        assert page.stale is True
+        assert list(page.items) == [0, 1, 2, 3]
+        assert first.stale is False
+
+    def test_empty_and_bad_sizes(self):
+        """Test edge cases.
+
+        This test verifies empty results and
+        that a page must hold something.
+        """
+        page = SearchPage.paginate(list(), 1, None, 5)
+        assert list(page.items) == []
+        assert page.next_cursor is None
+        with pytest.raises(ValueError):
+            SearchPage.paginate(list(), 1, None, 0)